@@ -1,2 +1,11 @@
 # game/__init__.py
-from .game import run_game
+
+
+def __getattr__(name):
+    # Import lazily so lightweight submodules (startup_profiler, asset_pack)
+    # can be loaded without pulling in pygame and the whole game first.
+    if name == "run_game":
+        from .game import run_game
+
+        return run_game
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
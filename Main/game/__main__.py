@@ -9,6 +9,13 @@ if __name__ == '__main__' and __package__ is None:
     import os, sys
     sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
     __package__ = "game"
+from . import memory_tracker, replay, startup_profiler, tracer
+
+# Must run before the game modules are imported so their import time is recorded.
+startup_profiler.enable_from_env()
+tracer.enable_from_env()
+replay.enable_from_env()
+memory_tracker.enable_from_env()
 from .game import run_game
 
 if __name__ == '__main__':
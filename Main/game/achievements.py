@@ -0,0 +1,82 @@
+# game/achievements.py
+"""Batch unlocks for threshold achievements.
+
+Most achievements unlock when a counter reaches a number: money, clicks,
+combo, playtime, crits, specials. Checking them one id at a time makes a
+big jump (offline earnings, a 10x wheel prize, a save that just gained new
+definitions) unlock them one by one. Each unlock queues its own popup, and
+each reward can push money past the next threshold.
+
+AchievementEngine keeps one sorted rule list per stat and a cursor to the
+first rule that stat hasn't reached yet. evaluate() advances the cursors,
+adds the rewards to money and checks the money rules again until nothing
+new unlocks. A quiet frame costs one comparison per stat, however many
+achievements there are; a storm costs one step per unlocked achievement.
+"""
+
+
+class AchievementEngine:
+    """Threshold rules per stat, unlocked in one pass to a fixed point."""
+
+    def __init__(self, achievements, achievement_defs):
+        self.achievement_defs = achievement_defs
+        self._rules = {}  # stat -> [(threshold, ach_id), ...] ascending
+        self._next = {}  # stat -> index of the first rule not yet reached
+        self.reset(achievements)
+
+    def reset(self, achievements):
+        """Use a new (e.g. wiped) achievements dict and rescan every rule."""
+        self.achievements = achievements
+        for stat in self._rules:
+            self._next[stat] = 0
+
+    def add_rules(self, stat, thresholds):
+        """Unlock each {ach_id: threshold} once values[stat] reaches it."""
+        rules = self._rules.setdefault(stat, [])
+        rules.extend(
+            (threshold, ach_id)
+            for ach_id, threshold in thresholds.items()
+            if ach_id in self.achievement_defs
+        )
+        rules.sort()
+        self._next[stat] = 0
+
+    def evaluate(self, values, reward_stat="money"):
+        """Unlock every rule `values` has reached; returns (ids, total reward).
+
+        Rewards are added to values[reward_stat] (in place) and that stat's
+        rules are checked again, until no more unlock.
+        """
+        unlocked = []
+        total = 0
+        stats = values
+        while True:
+            reward = 0
+            for stat, value in stats.items():
+                rules = self._rules.get(stat)
+                if rules is None:
+                    continue
+                i = self._next[stat]
+                end = len(rules)
+                while i < end and rules[i][0] <= value:
+                    ach_id = rules[i][1]
+                    i += 1
+                    state = self.achievements.get(ach_id)
+                    if state is None:
+                        state = self.achievements[ach_id] = {
+                            "unlocked": False,
+                            "progress": 0,
+                        }
+                    elif state.get("unlocked", False):
+                        continue
+                    state["unlocked"] = True
+                    unlocked.append(ach_id)
+                    reward += self.achievement_defs[ach_id].get("reward", 0)
+                self._next[stat] = i
+            if not reward or reward_stat not in values:
+                total += reward
+                return unlocked, total
+            total += reward
+            values[reward_stat] += reward
+            # only the reward stat changed; the others are already settled
+            stats = {reward_stat: values[reward_stat]}
@@ -0,0 +1,121 @@
+# game/asset_pack.py
+"""Single-file indexed asset archive read through mmap.
+
+Frozen builds ship one pack instead of every PNG/MP3/TTF as a separate data
+file, so onefile launches extract one file instead of the whole Assets tree.
+
+Layout (little-endian):
+    magic    8 bytes  b"TTGPACK1"
+    count    u32
+    count x  (u16 name_len, name utf-8, u64 offset, u64 size)
+    data     raw file bytes at the absolute offsets above
+
+This module must not import pygame: build_exe.py loads it standalone.
+"""
+import io
+import mmap
+import os
+import struct
+
+PACK_MAGIC = b"TTGPACK1"
+_COUNT = struct.Struct("<I")
+_NAME_LEN = struct.Struct("<H")
+_ENTRY = struct.Struct("<QQ")
+
+
+def _normalize(name):
+    # Pack keys use forward slashes and are matched case-insensitively, like
+    # the Windows filesystem the asset paths were originally written against.
+    name = name.replace("\\", "/")
+    while name.startswith("./"):
+        name = name[2:]
+    return name.lower()
+
+
+def build_pack(src_dir, out_path, prefix="Assets"):
+    """Pack every file under src_dir into out_path. Returns the entry count."""
+    files = []
+    for root, _dirs, names in os.walk(src_dir):
+        for fname in sorted(names):
+            full = os.path.join(root, fname)
+            rel = os.path.relpath(full, src_dir).replace(os.sep, "/")
+            files.append((f"{prefix}/{rel}" if prefix else rel, full))
+    files.sort()
+
+    encoded = [name.encode("utf-8") for name, _ in files]
+    header_size = len(PACK_MAGIC) + _COUNT.size
+    header_size += sum(_NAME_LEN.size + len(n) + _ENTRY.size for n in encoded)
+
+    sizes = [os.path.getsize(full) for _, full in files]
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(PACK_MAGIC)
+        f.write(_COUNT.pack(len(files)))
+        offset = header_size
+        for name, size in zip(encoded, sizes):
+            f.write(_NAME_LEN.pack(len(name)))
+            f.write(name)
+            f.write(_ENTRY.pack(offset, size))
+            offset += size
+        for _, full in files:
+            with open(full, "rb") as src:
+                f.write(src.read())
+    os.replace(tmp_path, out_path)
+    return len(files)
+
+
+class AssetPack:
+    """Read-only view over a pack file. Entries are memoryviews into the mmap."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._view = memoryview(self._map)
+        self.index = {}
+        self._read_index()
+
+    def _read_index(self):
+        view = self._view
+        if bytes(view[: len(PACK_MAGIC)]) != PACK_MAGIC:
+            raise ValueError(f"Not an asset pack: {self.path}")
+        pos = len(PACK_MAGIC)
+        (count,) = _COUNT.unpack_from(view, pos)
+        pos += _COUNT.size
+        for _ in range(count):
+            (name_len,) = _NAME_LEN.unpack_from(view, pos)
+            pos += _NAME_LEN.size
+            name = bytes(view[pos : pos + name_len]).decode("utf-8")
+            pos += name_len
+            offset, size = _ENTRY.unpack_from(view, pos)
+            pos += _ENTRY.size
+            self.index[_normalize(name)] = (offset, size)
+
+    def __contains__(self, name):
+        return _normalize(name) in self.index
+
+    def get_view(self, name):
+        """Return a zero-copy memoryview of an entry, or None if missing."""
+        entry = self.index.get(_normalize(name))
+        if entry is None:
+            return None
+        offset, size = entry
+        return self._view[offset : offset + size]
+
+    def open(self, name):
+        """Return a BytesIO over an entry for loaders that want a file object."""
+        view = self.get_view(name)
+        return io.BytesIO(view) if view is not None else None
+
+    def close(self):
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            # Entry views are still referenced; the map closes with the process.
+            pass
+        self._file.close()
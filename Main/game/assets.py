@@ -1,25 +1,64 @@
 import pygame
 import os
 import sys
+import logging
 from .settings import SCREEN_SIZE
-from .paths import GRASS1_IMG_PATH, CUSTOM_FONT_PATH, ICON_PATH, CLICK_SOUND_PATH
+from .asset_pack import AssetPack
+from .paths import (
+    ASSET_PACK_PATH,
+    GRASS1_IMG_PATH,
+    CUSTOM_FONT_PATH,
+    ICON_PATH,
+    CLICK_SOUND_PATH,
+    WATERCAN_IMG_PATH,
+)
+
+# Asset diagnostics are opt-in: set TTG_DEBUG_ASSETS=1 to log resolved paths.
+logger = logging.getLogger(__name__)
+DEBUG_ASSETS = os.environ.get("TTG_DEBUG_ASSETS", "") not in ("", "0")
+if DEBUG_ASSETS:
+    logging.basicConfig(level=logging.DEBUG)
+    logger.setLevel(logging.DEBUG)
+
+_base_path = None
+_resolved_paths = {}
+_asset_pack = None
+_asset_pack_checked = False
+
+
+def get_base_path():
+    """Return the resource root once: _MEIPASS when frozen, else the Main directory."""
+    global _base_path
+    if _base_path is None:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        base_path = getattr(sys, "_MEIPASS", None)
+        if base_path:
+            logger.debug("Using _MEIPASS path: %s", base_path)
+        else:
+            # Get the directory containing the game package (Main directory)
+            base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+            logger.debug("Using fallback path: %s", base_path)
+        _base_path = base_path
+    return _base_path
 
 
 def resource_path(relative_path):
-    """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp    folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-        print(f"Using _MEIPASS path: {base_path}")
-    except Exception:
-        # Get the directory containing the game package (Main directory)
-        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        print(f"Using fallback path: {base_path}")
-
-    result = os.path.normpath(os.path.join(base_path, relative_path))
-    print(f"Resolved path for {relative_path}: {result}")
-    print(f"Path exists: {os.path.exists(result)}")
-    print(f"Directory contents: {os.listdir(os.path.dirname(result))}")
+    """Get absolute path to resource, works for dev and for PyInstaller.
+
+    Resolved paths are memoized, so repeated lookups are a dict hit.
+    """
+    result = _resolved_paths.get(relative_path)
+    if result is not None:
+        return result
+
+    result = os.path.normpath(os.path.join(get_base_path(), relative_path))
+    _resolved_paths[relative_path] = result
+    if DEBUG_ASSETS:
+        logger.debug("Resolved path for %s: %s", relative_path, result)
+        logger.debug("Path exists: %s", os.path.exists(result))
+        parent = os.path.dirname(result)
+        if os.path.isdir(parent):
+            logger.debug("Directory contents: %s", os.listdir(parent))
     return result
 
     #   def create_golden_grass(grass_img):
@@ -46,15 +85,68 @@ def resource_path(relative_path):
     return golden_img
 
 
-def load_assets():
-    """Loads and returns all the assets for the game."""
+def get_asset_pack():
+    """Return the mmap-backed asset pack if this build ships one, else None."""
+    global _asset_pack, _asset_pack_checked
+    if not _asset_pack_checked:
+        _asset_pack_checked = True
+        path = resource_path(ASSET_PACK_PATH)
+        if os.path.exists(path):
+            try:
+                _asset_pack = AssetPack(path)
+                logger.debug("Using asset pack: %s", path)
+            except Exception as e:
+                logger.warning("Ignoring unreadable asset pack %s: %s", path, e)
+    return _asset_pack
+
+
+def open_resource(relative_path):
+    """Return a file object from the asset pack, or the resolved filesystem path."""
+    pack = get_asset_pack()
+    if pack is not None:
+        f = pack.open(relative_path)
+        if f is not None:
+            return f
+    return resource_path(relative_path)
+
+
+def load_image(relative_path):
+    """pygame.image.load from the asset pack or the filesystem."""
+    src = open_resource(relative_path)
+    if isinstance(src, str):
+        return pygame.image.load(src)
+    return pygame.image.load(src, os.path.basename(relative_path))
+
+
+def load_sound(relative_path):
+    """pygame.mixer.Sound from the asset pack or the filesystem."""
+    return pygame.mixer.Sound(file=open_resource(relative_path))
+
+
+def load_music(relative_path):
+    """pygame.mixer.music.load from the asset pack or the filesystem."""
+    src = open_resource(relative_path)
+    if isinstance(src, str):
+        pygame.mixer.music.load(src)
+    else:
+        pygame.mixer.music.load(src, os.path.basename(relative_path))
+
+
+def load_font(relative_path, size, font_class=pygame.font.Font):
+    """Font from the asset pack or the filesystem, as an instance of font_class."""
+    return font_class(open_resource(relative_path), size)
+
+
+def load_assets(font_class=pygame.font.Font):
+    """Loads and returns all the assets for the game.
+
+    font_class lets the caller wrap fonts (the game passes CountingFont).
+    """
     assets = {}
 
     # Load and scale grass image
-    path = resource_path(GRASS1_IMG_PATH)
-    print(f"Attempting to load grass image from: {path}")
-    print(f"File exists: {os.path.exists(path)}")
-    grass_img = pygame.image.load(path).convert_alpha()
+    logger.debug("Attempting to load grass image: %s", GRASS1_IMG_PATH)
+    grass_img = load_image(GRASS1_IMG_PATH).convert_alpha()
     original_width, original_height = grass_img.get_size()
     grass_img = pygame.transform.scale(
         grass_img, (int(original_width / 2.4), int(original_height / 2.4))
@@ -65,20 +157,15 @@ def load_assets():
     # assets['golden_grass_img'] = create_golden_grass(grass_img)
 
     # Load custom font
-    assets["custom_font"] = pygame.font.Font(resource_path(CUSTOM_FONT_PATH), 36)
+    assets["custom_font"] = load_font(CUSTOM_FONT_PATH, 36, font_class)
 
     # Load icon image
-    icon_img = pygame.image.load(resource_path(ICON_PATH)).convert_alpha()
+    icon_img = load_image(ICON_PATH).convert_alpha()
     assets["icon"] = icon_img
 
     # Special collectible image: use the existing `watercan.png` asset.
     try:
-        wc_rel = os.path.join("Assets", "images", "watercan.png")
-        wc = resource_path(wc_rel)
-        if os.path.exists(wc):
-            assets["watercan"] = pygame.image.load(wc).convert_alpha()
-        else:
-            assets["watercan"] = None
+        assets["watercan"] = load_image(WATERCAN_IMG_PATH).convert_alpha()
     except Exception:
         assets["watercan"] = None
 
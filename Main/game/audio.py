@@ -0,0 +1,136 @@
+# game/audio.py
+"""Voice-limited sound effect playback over reserved mixer channels.
+
+Each sound category owns a fixed pool of reserved channels. Every registered
+sound has a max number of simultaneous voices and a minimum retrigger
+interval. When its pool is full, the oldest voice is stolen. Volumes are
+precomputed from the master volume and the mute state, so a click costs at
+most one Channel.play() however fast the player clicks.
+"""
+import pygame
+
+# Reserved channels per category. Sound.play() outside the manager only
+# gets channels beyond these.
+CATEGORY_CHANNELS = {
+    "click": 4,  # grass clicks
+    "ui": 2,  # buttons, overlays
+    "sfx": 2,  # purchases, weather, collectibles
+}
+
+
+class VoiceManager:
+    """Plays registered sounds on per-category channel pools."""
+
+    def __init__(self, master_volume=1.0, categories=None):
+        self.master_volume = max(0.0, min(1.0, float(master_volume)))
+        self.muted = False
+        self.voices = {}
+        self.pools = {}
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+        self._owner = {}  # channel index -> (voice name, start tick)
+        self.enabled = bool(pygame.mixer.get_init())
+        if not self.enabled:
+            return
+
+        categories = categories or CATEGORY_CHANNELS
+        total = sum(categories.values())
+        if pygame.mixer.get_num_channels() < total + 2:
+            pygame.mixer.set_num_channels(total + 2)
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for name, count in categories.items():
+            self.pools[name] = list(range(index, index + count))
+            index += count
+
+    def register(self, name, sound, category="sfx", volume=1.0, max_voices=2, min_interval=0.0):
+        """Register a sound. min_interval is the minimum seconds between triggers."""
+        if not isinstance(sound, pygame.mixer.Sound):
+            # Missing or dummy sound: playing it is a no-op
+            return
+        self.voices[name] = {
+            "sound": sound,
+            "category": category,
+            "volume": volume,
+            "max_voices": max(1, max_voices),
+            "min_interval_ms": int(min_interval * 1000),
+            "last_play": -(10**9),
+        }
+        self._apply_volume(self.voices[name])
+
+    def _apply_volume(self, voice):
+        vol = 0.0 if self.muted else voice["volume"] * self.master_volume
+        try:
+            voice["sound"].set_volume(vol)
+        except Exception:
+            pass
+
+    def set_master_volume(self, volume):
+        self.master_volume = max(0.0, min(1.0, float(volume)))
+        for voice in self.voices.values():
+            self._apply_volume(voice)
+
+    def set_muted(self, muted):
+        self.muted = bool(muted)
+        for voice in self.voices.values():
+            self._apply_volume(voice)
+        if self.muted and self.enabled:
+            for pool in self.pools.values():
+                for i in pool:
+                    pygame.mixer.Channel(i).stop()
+
+    def play(self, name):
+        """Play a registered sound, respecting rate limit and voice caps."""
+        voice = self.voices.get(name)
+        if voice is None or self.muted or not self.enabled:
+            return None
+        now = pygame.time.get_ticks()
+        if now - voice["last_play"] < voice["min_interval_ms"]:
+            self.dropped += 1
+            return None
+        voice["last_play"] = now
+
+        pool = self.pools.get(voice["category"])
+        if not pool:
+            return None
+        owner = self._owner
+        own_oldest = None
+        own_busy = 0
+        free = None
+        oldest = None
+        for i in pool:
+            channel = pygame.mixer.Channel(i)
+            if not channel.get_busy():
+                if free is None:
+                    free = i
+                continue
+            entry = owner.get(i)
+            start = entry[1] if entry else 0
+            if oldest is None or start < owner.get(oldest, (None, 0))[1]:
+                oldest = i
+            if entry and entry[0] == name:
+                own_busy += 1
+                if own_oldest is None or start < owner[own_oldest][1]:
+                    own_oldest = i
+
+        if own_busy >= voice["max_voices"]:
+            target = own_oldest
+            self.stolen += 1
+        elif free is not None:
+            target = free
+        else:
+            target = oldest
+            self.stolen += 1
+
+        try:
+            channel = pygame.mixer.Channel(target)
+            channel.play(voice["sound"])
+        except Exception:
+            return None
+        owner[target] = (name, now)
+        self.played += 1
+        return channel
+
+    def stats(self):
+        return {"played": self.played, "dropped": self.dropped, "stolen": self.stolen}
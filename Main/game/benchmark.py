@@ -0,0 +1,416 @@
+# game/benchmark.py
+"""Headless benchmark suite (SDL dummy video/audio drivers).
+
+Measures the hot game_loop functions in isolation, and whole frames of
+run_loop under scripted input. Each scenario runs in its own subprocess so
+that caches and pygame state start fresh. Results are written as JSON and
+can be compared against a stored baseline:
+
+    python -m game.benchmark --out bench.json
+    python -m game.benchmark --baseline bench.json [--threshold 0.15]
+    python -m game.benchmark --only draw_      # names containing "draw_"
+
+For a pass/fail gate against the committed baseline see game.perf_check.
+
+Saves made while benchmarking go to a temporary directory, never to the
+player's save.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Must be set before pygame initialises its drivers
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+REPORT_VERSION = 1
+FPS = 60
+WARMUP_FRAMES = 30
+SCENARIO_FRAMES = 600
+DEFAULT_THRESHOLD = 0.15  # flag results more than 15% slower than the baseline
+SEED = 1  # rng master seed, so every run sees the same particles and rolls
+
+
+class ScriptedClock:
+    """Stands in for pygame.time.Clock in run_loop.
+
+    Every tick advances the game by a fixed 1/FPS, posts the events that the
+    script returns for that frame, and records the wall time of the previous
+    frame. After `frames` frames it posts QUIT. Allocation counters are
+    sampled when warm-up ends and on the last frame.
+    """
+
+    def __init__(self, script, frames, warmup=0):
+        self.script = script
+        self.frames = frames
+        self.warmup = warmup
+        self.frame = 0
+        self.frame_ms = []
+        self.alloc = {}
+        self._last = None
+
+    def tick(self, framerate=0):
+        now = time.perf_counter()
+        if self._last is not None:
+            self.frame_ms.append((now - self._last) * 1000.0)
+        if self.frame in (self.warmup, self.frames):
+            self.alloc[self.frame] = (
+                sys.getallocatedblocks(),
+                gc.get_stats()[0]["collections"],
+            )
+        for event in self.script(self.frame):
+            pygame.event.post(event)
+        if self.frame == self.frames:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        self.frame += 1
+        # the script's own work isn't part of the frame
+        self._last = time.perf_counter()
+        return 1000.0 / FPS
+
+    tick_busy_loop = tick
+
+    def get_fps(self):
+        if not self.frame_ms:
+            return 0.0
+        return 1000.0 / (sum(self.frame_ms[-30:]) / len(self.frame_ms[-30:]))
+
+
+def _click_widget(wid):
+    """MOUSEBUTTONDOWN at the centre of a run_loop widget."""
+    from . import game_loop
+
+    pos = game_loop.widget_tree.rect(wid).center
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+def _idle(frame):
+    return ()
+
+
+def _clicking(frame):
+    # 20 clicks per second on the grass
+    if frame % (FPS // 20) == 0:
+        return (_click_widget("grass"),)
+    return ()
+
+
+def _overlay_open(frame):
+    if frame == 1:
+        return (_click_widget("shop_btn"),)
+    return ()
+
+
+def _particle_storm(frame):
+    # a click every frame keeps the particle list near its cap
+    return (_click_widget("grass"),)
+
+
+def _autosave_setup():
+    from . import game_loop
+
+    # one auto-save per second instead of every 30 s
+    game_loop.AUTOSAVE_INTERVAL = 1.0
+
+
+SCENARIOS = {
+    "frame.idle": _idle,
+    "frame.clicking_20cps": _clicking,
+    "frame.overlay_shop": _overlay_open,
+    "frame.particle_storm": _particle_storm,
+    "frame.autosave": _idle,
+}
+# Called in the scenario's process before run_loop starts
+SCENARIO_SETUP = {
+    "frame.autosave": _autosave_setup,
+}
+
+
+def _percentile(sorted_values, q):
+    i = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[i]
+
+
+def run_scenario(name, frames=SCENARIO_FRAMES):
+    """Run one scripted scenario in this process (see _child)."""
+    from . import assets, game_loop, rng
+    from .frame_profiler import CountingFont
+
+    rng.seed(SEED)
+    pygame.init()
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        pass  # the game's _safe_* helpers cope without a mixer
+    screen = pygame.display.set_mode((800, 600))
+    loaded = assets.load_assets(CountingFont)
+    if name in SCENARIO_SETUP:
+        SCENARIO_SETUP[name]()
+    end = frames + WARMUP_FRAMES
+    clock = ScriptedClock(SCENARIOS[name], end, WARMUP_FRAMES)
+    try:
+        game_loop.run_loop(screen, clock, loaded)
+    except SystemExit:
+        pass
+    times = sorted(clock.frame_ms[WARMUP_FRAMES:])
+    blocks_start, gen0_start = clock.alloc[WARMUP_FRAMES]
+    blocks_end, gen0_end = clock.alloc[end]
+    return {
+        "kind": "scenario",
+        "frames": len(times),
+        "mean_ms": round(statistics.fmean(times), 4),
+        "p50_ms": round(_percentile(times, 0.50), 4),
+        "p95_ms": round(_percentile(times, 0.95), 4),
+        "p99_ms": round(_percentile(times, 0.99), 4),
+        "max_ms": round(times[-1], 4),
+        # live allocated blocks gained after warm-up (leaks, unbounded caches)
+        "alloc_blocks_growth": blocks_end - blocks_start,
+        # young-generation collections: churn of short-lived objects
+        "gc_gen0_per_1k_frames": round((gen0_end - gen0_start) * 1000.0 / frames, 2),
+    }
+
+
+def _time_calls(fn, repeat=7, number=50, setup=None):
+    """Median/min ms per call over `repeat` batches of `number` calls."""
+    per_call = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(state)
+        per_call.append((time.perf_counter() - start) * 1000.0 / number)
+    return {
+        "kind": "function",
+        "calls": repeat * number,
+        "median_ms": round(statistics.median(per_call), 5),
+        "min_ms": round(min(per_call), 5),
+    }
+
+
+def _large_save():
+    data = {
+        "money": 123456789.0,
+        "total_clicks": 9876543,
+        "achievements": {
+            f"ach_{i}": {"unlocked": i % 3 == 0, "progress": i} for i in range(3000)
+        },
+        "stats_data": {f"stat_{i}": i * 1.5 for i in range(2000)},
+        "skills": {f"skill_{i}": {"level": i % 10} for i in range(200)},
+        "settings": {"screen_shake": True, "show_fps": False},
+    }
+    return data
+
+
+def run_functions(only=None):
+    """Benchmark the hot functions in this process."""
+    from . import assets, game_loop
+    from .frame_profiler import CountingFont
+    from .particle_governor import ParticleGovernor
+    from .paths import CUSTOM_FONT_PATH
+    from . import rng
+
+    rng.seed(SEED)
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    loaded = assets.load_assets(CountingFont)
+    font = assets.load_font(CUSTOM_FONT_PATH, 18, CountingFont)
+    grass = loaded["grass_img"]
+    results = {}
+
+    def fresh_governor():
+        game_loop.particle_governor = ParticleGovernor(game_loop.MAX_PARTICLES)
+
+    def particles(n):
+        fresh_governor()
+        p_list = []
+        while len(p_list) < n:
+            game_loop.spawn_particles(p_list, (400, 300), (120, 220, 120), count=50)
+        return p_list[:n]
+
+    def bench_spawn(state):
+        fresh_governor()
+        p_list = []
+        for _ in range(20):
+            game_loop.spawn_particles(p_list, (400, 300), (120, 220, 120), count=12)
+
+    def bench_update(p_list):
+        game_loop.update_particles(p_list, 1.0 / FPS)
+
+    def bench_draw_particles(p_list):
+        game_loop.draw_particles(screen, p_list)
+
+    rects = [pygame.Rect(560, 20 + i * 46, 220, 38) for i in range(7)]
+
+    def bench_draw_button(state):
+        for i, rect in enumerate(rects):
+            game_loop.draw_button(
+                screen,
+                rect,
+                (45, 120, 180),
+                (20, 20, 20),
+                f"Button {i} ($1234)",
+                font,
+                1.0 / FPS,
+                f"bench{i}",
+            )
+
+    def bench_draw_panel(state):
+        game_loop.draw_panel(screen, pygame.Rect(10, 10, 250, 160), (90, 90, 90))
+        game_loop.draw_panel(screen, pygame.Rect(150, 100, 500, 400), (90, 90, 90))
+
+    def bench_tint(state):
+        game_loop.tint_grass(grass, game_loop.GRASS_VARIANT_FACTORS[0])
+
+    save = _large_save()
+
+    def bench_save(state):
+        game_loop.save_game_data(save)
+
+    def bench_load(state):
+        game_loop.load_game_data()
+
+    cases = [
+        ("spawn_particles", bench_spawn, {}),
+        ("update_particles", bench_update, {"setup": lambda: particles(600)}),
+        ("draw_particles", bench_draw_particles, {"setup": lambda: particles(600)}),
+        ("draw_button", bench_draw_button, {}),
+        ("draw_panel", bench_draw_panel, {}),
+        ("tint_grass", bench_tint, {"repeat": 3, "number": 1}),
+        ("save_game_data", bench_save, {"repeat": 5, "number": 5}),
+        ("load_game_data", bench_load, {"repeat": 5, "number": 5}),
+    ]
+    for name, fn, kwargs in cases:
+        if only and only not in name:
+            continue
+        if name == "load_game_data":
+            game_loop.save_game_data(save)
+        results[name] = _time_calls(fn, **kwargs)
+    pygame.quit()
+    return results
+
+
+def _child(name, frames):
+    if name == "functions":
+        result = run_functions(os.environ.get("TTG_BENCH_ONLY") or None)
+    else:
+        result = {name: run_scenario(name, frames)}
+    sys.stdout.write("\nTTG_BENCH_RESULT " + json.dumps(result) + "\n")
+
+
+def _run_child(name, frames, save_dir, only=None):
+    env = dict(os.environ)
+    # get_save_dir() checks LOCALAPPDATA first on every platform
+    env["LOCALAPPDATA"] = save_dir
+    if only:
+        env["TTG_BENCH_ONLY"] = only
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = package_root + os.pathsep + env.get("PYTHONPATH", "")
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "game.benchmark",
+            "--child",
+            name,
+            "--frames",
+            str(frames),
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith("TTG_BENCH_RESULT "):
+            return json.loads(line[len("TTG_BENCH_RESULT ") :])
+    sys.stderr.write(proc.stdout[-2000:] + proc.stderr[-2000:])
+    raise RuntimeError(f"benchmark {name} failed (exit code {proc.returncode})")
+
+
+def run_all(only=None, frames=SCENARIO_FRAMES, functions=True):
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="ttg-bench-") as save_dir:
+        if functions:
+            results.update(_run_child("functions", frames, save_dir, only))
+        for name in SCENARIOS:
+            if only and only not in name:
+                continue
+            results.update(_run_child(name, frames, save_dir))
+    return {
+        "version": REPORT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def _metric(result):
+    # Scenarios compare on p95 frame time, functions on median call time
+    return result.get("p95_ms", result.get("median_ms"))
+
+
+def compare(old, new, threshold=DEFAULT_THRESHOLD):
+    """Return (report lines, names that regressed beyond threshold)."""
+    lines = [f"{'benchmark':<28}{'baseline':>12}{'current':>12}{'change':>9}"]
+    regressions = []
+    old_results = old.get("results", {})
+    for name, result in new.get("results", {}).items():
+        cur = _metric(result)
+        base = _metric(old_results[name]) if name in old_results else None
+        if not base:
+            lines.append(f"{name:<28}{'-':>12}{cur:>12.4f}{'new':>9}")
+            continue
+        change = (cur - base) / base
+        flag = ""
+        if change > threshold:
+            flag = "  SLOWER"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        lines.append(f"{name:<28}{base:>12.4f}{cur:>12.4f}{change:>+9.1%}{flag}")
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m game.benchmark")
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--only", help="run only benchmarks whose name contains this")
+    parser.add_argument("--frames", type=int, default=SCENARIO_FRAMES)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.child, args.frames)
+        return 0
+
+    report = run_all(args.only, args.frames)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Benchmark results written to {args.out}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        lines, regressions = compare(baseline, report, args.threshold)
+        print("\n".join(lines))
+        return 1 if regressions else 0
+    for name, result in report["results"].items():
+        print(f"{name:<28}{_metric(result):>12.4f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
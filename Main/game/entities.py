@@ -0,0 +1,250 @@
+# game/entities.py
+"""Pooled entity stores for short-lived game objects.
+
+Specials, damage numbers, notifications and mini-game targets are __slots__
+records kept in an EntityPool. Live records sit in a dense list. remove()
+swaps the last record into the freed slot, and retain() compacts in place
+keeping order, so clearing out a burst is O(n) instead of the O(n²) of
+list.remove inside a loop over a copy. Dead records go on a free-list and
+are re-initialised on the next spawn instead of being allocated again.
+
+Compare burst throughput against plain lists of dicts with:
+
+    python -m game.entities [spawns_per_frame]
+"""
+
+import random
+import sys
+import time
+
+
+class PoolRecord:
+    """Base for pooled records; `slot` is the index in the pool's dense list."""
+
+    __slots__ = ("slot",)
+
+
+class EntityPool:
+    """Dense list of live records plus a free-list of dead ones."""
+
+    def __init__(self, record_type):
+        self.record_type = record_type
+        self.items = []
+        self.free = []
+
+    def spawn(self, *args, **kwargs):
+        """Add a record built from record_type's __init__ arguments."""
+        if self.free:
+            rec = self.free.pop()
+            rec.__init__(*args, **kwargs)
+        else:
+            rec = self.record_type(*args, **kwargs)
+        rec.slot = len(self.items)
+        self.items.append(rec)
+        return rec
+
+    def remove(self, rec):
+        """O(1) removal: the last record moves into rec's slot (order changes)."""
+        items = self.items
+        i = rec.slot
+        if i < 0 or i >= len(items) or items[i] is not rec:
+            return False
+        last = items.pop()
+        if last is not rec:
+            items[i] = last
+            last.slot = i
+        rec.slot = -1
+        self.free.append(rec)
+        return True
+
+    def retain(self, keep):
+        """Drop every record for which keep(rec) is false; order is kept."""
+        items = self.items
+        free = self.free
+        n = 0
+        for rec in items:
+            if keep(rec):
+                items[n] = rec
+                rec.slot = n
+                n += 1
+            else:
+                rec.slot = -1
+                free.append(rec)
+        del items[n:]
+
+    def clear(self):
+        for rec in self.items:
+            rec.slot = -1
+        self.free.extend(self.items)
+        self.items.clear()
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+
+class Special(PoolRecord):
+    """Collectible that drifts around the play area until clicked or expired."""
+
+    __slots__ = (
+        "x",
+        "y",
+        "life",
+        "value",
+        "click_radius",
+        "surf",
+        "osc_amp",
+        "osc_speed",
+        "osc_phase",
+        "sway_amp",
+        "sway_speed",
+        "sway_phase",
+        "rot_amp",
+        "rot_speed",
+        "rot_phase",
+        "node",
+        "draw_pos",
+        "angle",
+    )
+
+    def __init__(self, x, y, life, value, click_radius=18, surf=None, node=None):
+        self.x = float(x)
+        self.y = float(y)
+        self.life = life
+        self.value = value
+        self.click_radius = click_radius
+        self.surf = surf
+        self.osc_amp = 0.0
+        self.osc_speed = 1.0
+        self.osc_phase = 0.0
+        self.sway_amp = 0.0
+        self.sway_speed = 1.0
+        self.sway_phase = 0.0
+        self.rot_amp = 0.0
+        self.rot_speed = 1.0
+        self.rot_phase = 0.0
+        self.node = node
+        self.draw_pos = (int(x), int(y))
+        self.angle = 0.0
+
+
+class DamageNumber(PoolRecord):
+    """Floating "+$N" label that rises, falls back and fades out."""
+
+    __slots__ = (
+        "x",
+        "y",
+        "vx",
+        "vy",
+        "value",
+        "count",
+        "text",
+        "color",
+        "life",
+        "max_life",
+        "render",
+    )
+
+    def __init__(self, x, y, vx, vy, text, color, life=1.2, value=0):
+        self.x = float(x)
+        self.y = float(y)
+        self.vx = vx
+        self.vy = vy
+        self.value = value
+        self.count = 1  # gains merged into this label (coalescing)
+        self.text = text
+        self.color = color
+        self.life = life
+        self.max_life = life
+        self.render = None  # cached text surface + alpha variants, set on draw
+
+
+class Notification(PoolRecord):
+    """Queued text message with a countdown timer."""
+
+    __slots__ = ("text", "color", "timer", "y_offset")
+
+    def __init__(self, text, color, timer):
+        self.text = text
+        self.color = color
+        self.timer = timer
+        self.y_offset = 0
+
+
+class Target(PoolRecord):
+    """Mini-game target (target practice) or falling coin (golden rush)."""
+
+    __slots__ = ("x", "y", "radius", "life", "color", "vy", "value")
+
+    def __init__(self, x, y, radius, life=0.0, color=(255, 215, 0), vy=0.0, value=1):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.life = life
+        self.color = color
+        self.vy = vy
+        self.value = value
+
+
+def _bench_lists(burst, frames, dt):
+    items = []
+    for _ in range(frames):
+        for _ in range(burst):
+            items.append(
+                {
+                    "pos": [0.0, 0.0],
+                    "vel": [random.uniform(-20, 20), random.uniform(-80, -40)],
+                    "life": random.uniform(0.05, 1.2),
+                }
+            )
+        for dmg in items[:]:
+            dmg["pos"][0] += dmg["vel"][0] * dt
+            dmg["pos"][1] += dmg["vel"][1] * dt
+            dmg["vel"][1] += 120 * dt
+            dmg["life"] -= dt
+            if dmg["life"] <= 0:
+                items.remove(dmg)
+    return len(items)
+
+
+def _bench_pool(burst, frames, dt):
+    pool = EntityPool(DamageNumber)
+    for _ in range(frames):
+        for _ in range(burst):
+            pool.spawn(
+                0.0,
+                0.0,
+                random.uniform(-20, 20),
+                random.uniform(-80, -40),
+                "",
+                None,
+                random.uniform(0.05, 1.2),
+            )
+        for dmg in pool.items:
+            dmg.x += dmg.vx * dt
+            dmg.y += dmg.vy * dt
+            dmg.vy += 120 * dt
+            dmg.life -= dt
+        pool.retain(lambda d: d.life > 0)
+    return len(pool)
+
+
+if __name__ == "__main__":
+    burst = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    frames = 120
+    dt = 1.0 / 60.0
+    for name, fn in (("list+dict", _bench_lists), ("EntityPool", _bench_pool)):
+        random.seed(1)
+        start = time.perf_counter()
+        alive = fn(burst, frames, dt)
+        elapsed = time.perf_counter() - start
+        spawned = burst * frames
+        print(
+            f"{name:>10}: {spawned} spawned, {alive} alive at end, "
+            f"{elapsed * 1000.0:.1f} ms ({spawned / elapsed:,.0f} spawns/s)"
+        )
@@ -0,0 +1,200 @@
+# game/frame_profiler.py
+"""In-game frame profiler overlay, toggled with F3.
+
+run_loop calls mark(name) at the boundaries between its phases. Each mark
+adds the time since the previous mark to that section. The overlay shows
+per-section averages, rolling p50/p95/p99 of the frame's work time, a
+sparkline of recent frames, and blits and font renders per frame.
+
+The same marks feed tracer spans when tracing is enabled, and the
+memory_tracker rows are added when it is on.
+
+When the profiler is off, begin_frame/mark/end_frame return immediately and
+drawing goes straight to the display. When it is on, the frame is drawn
+into a CountingSurface so that blits can be counted, then copied to the
+display under the overlay. Font renders are counted by CountingFont; the
+game passes it to load_font/load_assets for every game font.
+"""
+
+from collections import deque
+import time
+
+import pygame
+
+from . import memory_tracker, tracer
+
+HOTKEY = pygame.K_F3
+HISTORY = 240  # frames kept for percentiles and section averages
+SPARK_FRAMES = 120
+SPARK_MAX_MS = 1000.0 / 30.0  # sparkline full height
+REFRESH_FRAMES = 15  # overlay text is re-rendered this often
+
+# Per-frame counters, bumped by CountingSurface / CountingFont
+counters = {"blits": 0, "renders": 0}
+
+
+class CountingSurface(pygame.Surface):
+    """Surface that counts the blits drawn onto it."""
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        counters["blits"] += 1
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        blit_sequence = list(blit_sequence)
+        counters["blits"] += len(blit_sequence)
+        return super().blits(blit_sequence, doreturn)
+
+
+class CountingFont(pygame.font.Font):
+    """Font that counts render() calls."""
+
+    def render(self, *args, **kwargs):
+        counters["renders"] += 1
+        surf = super().render(*args, **kwargs)
+        if memory_tracker.ENABLED:
+            memory_tracker.note_surface(surf, 2)
+        return surf
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    i = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[i]
+
+
+class FrameProfiler:
+    """Section timers, frame-time history and the overlay that shows them."""
+
+    def __init__(self):
+        self.enabled = False
+        self._requested = False
+        self._timing = False  # overlay on, or tracer recording frame phases
+        self.frames = deque(maxlen=HISTORY)  # (work ms, {section: ms}, blits, renders)
+        self.sections = {}
+        self.order = []  # section names in first-seen order, for a stable layout
+        self._t = 0.0
+        self._frame_start = 0.0
+        self._target = None
+        self._panel = None
+        self._panel_age = 0
+        self._counts = (0, 0)
+
+    def toggle(self):
+        """Switch on/off from the next frame, so no frame is half-measured."""
+        self._requested = not self._requested
+
+    def begin_frame(self):
+        if self._requested != self.enabled:
+            self.enabled = self._requested
+            self.frames.clear()
+            self.order = []
+            self._panel = None
+            self._target = None
+        self._timing = self.enabled or tracer.ENABLED
+        if not self._timing:
+            return
+        self._frame_start = self._t = time.perf_counter()
+        self.sections = {}
+        counters["blits"] = 0
+        counters["renders"] = 0
+
+    def mark(self, name):
+        """Charge the time since the previous mark to section `name`."""
+        if not self._timing:
+            return
+        now = time.perf_counter()
+        if tracer.ENABLED:
+            tracer.complete(name, self._t, now)
+        if self.enabled:
+            self.sections[name] = (
+                self.sections.get(name, 0.0) + (now - self._t) * 1000.0
+            )
+            if name not in self.order:
+                self.order.append(name)
+        self._t = now
+
+    def end_frame(self):
+        if not self._timing:
+            return
+        now = time.perf_counter()
+        if tracer.ENABLED:
+            tracer.end_frame(self._frame_start, now)
+        if self.enabled:
+            work = (now - self._frame_start) * 1000.0
+            blits, renders = self._counts
+            self.frames.append((work, self.sections, blits, renders))
+
+    def target(self, display):
+        """Surface to draw this frame on: the display itself unless profiling."""
+        if not self.enabled:
+            return display
+        size = display.get_size()
+        if self._target is None or self._target.get_size() != size:
+            # same pixel format as the display so present() is a plain copy;
+            # like the panel below, it's the profiler's, not the game's
+            with memory_tracker.untracked():
+                self._target = CountingSurface(size, 0, display)
+        return self._target
+
+    def present(self, display, font):
+        """Copy the counted frame to the display and draw the overlay on top."""
+        if not self.enabled:
+            return
+        self._counts = (counters["blits"], counters["renders"])
+        if self._target is not None:
+            pygame.Surface.blit(display, self._target, (0, 0))
+        self._panel_age += 1
+        if self._panel is None or self._panel_age >= REFRESH_FRAMES:
+            self._panel = self._render_panel(font)
+            self._panel_age = 0
+        display.blit(self._panel, (10, 10))
+
+    def _render_panel(self, font):
+        frames = list(self.frames)
+        n = max(1, len(frames))
+        work = sorted(f[0] for f in frames)
+        lines = [
+            (
+                f"frame p50 {_percentile(work, 0.50):.2f}  p95 "
+                f"{_percentile(work, 0.95):.2f}  p99 {_percentile(work, 0.99):.2f} ms",
+                (255, 255, 255),
+            )
+        ]
+        for name in self.order:
+            avg = sum(f[1].get(name, 0.0) for f in frames) / n
+            lines.append((f"{name:<16}{avg:6.2f} ms", (200, 230, 200)))
+        lines.append(
+            (
+                f"blits {self._counts[0]}  font renders {self._counts[1]}",
+                (255, 220, 120),
+            )
+        )
+        if memory_tracker.ENABLED:
+            lines.extend(memory_tracker.overlay_lines())
+        # counted renders are the game's own; don't count the overlay's
+        texts = [pygame.font.Font.render(font, t, True, c) for t, c in lines]
+        line_h = font.get_linesize()
+        spark_h = 40
+        width = max(SPARK_FRAMES * 2, max(t.get_width() for t in texts)) + 16
+        height = len(texts) * line_h + spark_h + 20
+        with memory_tracker.untracked():
+            panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        y = 6
+        for t in texts:
+            panel.blit(t, (8, y))
+            y += line_h
+        # sparkline of the latest frames, with the 60 FPS budget as a guide
+        y += 6
+        budget_y = y + spark_h - int(spark_h * (1000.0 / 60.0) / SPARK_MAX_MS)
+        pygame.draw.line(panel, (90, 90, 90), (8, budget_y), (width - 8, budget_y))
+        recent = [f[0] for f in frames[-SPARK_FRAMES:]]
+        points = [
+            (8 + i * 2, y + spark_h - int(spark_h * min(1.0, ms / SPARK_MAX_MS)))
+            for i, ms in enumerate(recent)
+        ]
+        if len(points) > 1:
+            pygame.draw.lines(panel, (120, 220, 120), False, points)
+        return panel
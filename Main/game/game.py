@@ -1,20 +1,24 @@
 import pygame
 import sys
 import os
-from . import settings, assets, game_loop
+from . import settings, assets, game_loop, startup_profiler
+from .frame_profiler import CountingFont
 
 
 def run_game():
     # Initialize pygame
-    pygame.init()
+    with startup_profiler.phase("pygame.init"):
+        pygame.init()
     # Initialize audio safely. On some platforms (headless Linux, Wine) the
     # mixer backend can fail to initialize and raise. Try normal init first;
     # if it fails, try using the SDL dummy audio driver to allow the game to
     # run without sound. We expose a flag on game_loop to let the rest of the
     # code avoid audio operations when unavailable.
+    startup_profiler.begin("mixer.init")
     try:
         pygame.mixer.init()
         game_loop.MIXER_AVAILABLE = True
+        startup_profiler.note("driver", "default")
     except Exception:
         # Try dummy driver fallback so code that imports mixer functions
         # won't crash. Set MIXER_AVAILABLE=False so callers can skip audio.
@@ -22,14 +26,20 @@ def run_game():
         try:
             pygame.mixer.init()
             game_loop.MIXER_AVAILABLE = False
+            startup_profiler.note("driver", "dummy")
         except Exception:
             game_loop.MIXER_AVAILABLE = False
+            startup_profiler.note("driver", "unavailable")
+    startup_profiler.end()
     # Set up the game window using settings
-    screen = pygame.display.set_mode(settings.SCREEN_SIZE)
+    with startup_profiler.phase("display.set_mode"):
+        screen = pygame.display.set_mode(settings.SCREEN_SIZE)
     clock = pygame.time.Clock()
     
     # Load assets (images, fonts, etc.)
-    loaded_assets = assets.load_assets()
+    with startup_profiler.phase("load_assets"):
+        # CountingFont counts renders for the F3 overlay
+        loaded_assets = assets.load_assets(CountingFont)
     
     # Set window caption and icon using loaded assets (if available)
     pygame.display.set_caption("Touch The Grass   (Bet you can't touch it IRL!)")
@@ -1,17 +1,62 @@
 import os
 import sys
 import json
-import random
 import math
+from collections import OrderedDict
+
 import pygame
 
-from .assets import resource_path
-from .paths import BACK_SOUND_PATH, CLICK_SOUND_PATH, CUSTOM_FONT_PATH
+from . import memory_tracker, replay, rng, startup_profiler, tracer
+from .achievements import AchievementEngine
+from .assets import load_font, load_image, load_music
+from .audio import VoiceManager
+from .background import draw_background, get_background
+from .frame_profiler import HOTKEY as PROFILER_HOTKEY, CountingFont, FrameProfiler
+from .entities import DamageNumber, EntityPool, Notification, Special, Target
+from .particle_governor import ParticleGovernor
+from .popups import PopupRenderer, fade_alpha
+from .sound_bank import SoundBank
+from .specials import SpecialRenderer
+from .ui import LAYER_OVERLAY, LAYER_WORLD, WidgetTree
+from .paths import (
+    BACK_SOUND_PATH,
+    BUY_SOUND_PATH,
+    CHANGE_SOUND_PATH,
+    CLICK_SOUND_PATH,
+    CUSTOM_FONT_PATH,
+    MUSIC_OFF_IMG_PATH,
+    MUSIC_ON_IMG_PATH,
+)
 from .settings import SCREEN_SIZE, CENTER, MIN_SCALE, MAX_SCALE
 
 # Simple particle system (pooled) to support pixel-art particles.
 MAX_PARTICLES = 700
 _particle_pool = []
+# Scales spawn counts by settings["particle_density"] and frame time
+particle_governor = ParticleGovernor(MAX_PARTICLES)
+# F3 overlay: per-section frame timings, blit/font render counts
+frame_profiler = FrameProfiler()
+# Achievement, daily reward and Welcome Back popups, composed once each
+popup_renderer = PopupRenderer()
+# Widget tree of the running run_loop (None outside it); game.benchmark
+# resolves scripted click targets through it
+widget_tree = None
+
+# Decoded-PCM sound cache, created on first safe_load_sound()
+_sound_bank = None
+
+# Seconds between auto-saves (the benchmark's autosave scenario shortens it)
+AUTOSAVE_INTERVAL = 30.0
+
+
+# Uniforms each particle reads from its burst's block (fixed offsets, see
+# spawn_particles), so every branch consumes the same amount
+PARTICLE_DRAWS = 50
+
+
+def _clamp(v):
+    v = int(v)
+    return 0 if v < 0 else 255 if v > 255 else v
 
 
 def spawn_particles(p_list, position, color, count=12):
@@ -20,10 +65,23 @@ def spawn_particles(p_list, position, color, count=12):
     p_list: the active particles list (modified in place)
     position: (x,y) tuple
     color: (r,g,b)
+    count: requested amount; particle_governor decides how many are spawned
     """
-    for _ in range(count):
-        if len(p_list) >= MAX_PARTICLES:
-            break
+    requested = count
+    count = particle_governor.budget(count, len(p_list))
+    if tracer.ENABLED:
+        tracer.instant("particles", requested=requested, spawned=count)
+    if count <= 0:
+        return
+    # Whole burst's cosmetic randomness in one call; u[k] is a uniform in [0, 1)
+    block = rng.cosmetic.take(count * PARTICLE_DRAWS)
+    is_grass = color[1] > color[0] and color[1] > color[2] and color[1] >= 60
+    is_yellow = (color[0] >= 160 and color[1] >= 140 and color[2] <= 140) or (
+        color[0] > color[1] and color[1] > color[2] and color[1] >= 120
+    )
+    jitter = math.radians(35.0)
+    for n in range(count):
+        u = block[n * PARTICLE_DRAWS : (n + 1) * PARTICLE_DRAWS]
         if _particle_pool:
             p = _particle_pool.pop()
             # ensure no leftover keys from previous use
@@ -32,139 +90,118 @@ def spawn_particles(p_list, position, color, count=12):
             p = {}
 
         # Determine emission style: side (horizontal), pop-up (rise then fall), or fall-first
-        r = random.random()
+        r = u[0]
         if r < 0.20:
             # side emission: go directly left or right with strong horizontal velocity
-            dir_sign = random.choice((-1, 1))
-            vx = dir_sign * random.uniform(160.0, 320.0)
-            vy = random.uniform(-30.0, 30.0)
-            life = random.uniform(0.6, 1.1)
+            dir_sign = -1 if u[1] < 0.5 else 1
+            vx = dir_sign * (160.0 + 160.0 * u[2])
+            vy = -30.0 + 60.0 * u[3]
+            life = 0.6 + 0.5 * u[4]
             # make side particles tiny
-            size = random.randint(1, 2)
+            size = 1 + int(u[5] * 2)
             float_time = 0.0
             # keep pushing outward a bit
-            side_acc = dir_sign * random.uniform(40.0, 120.0)
+            side_acc = dir_sign * (40.0 + 80.0 * u[6])
         elif r < 0.65:
             # pop-up particles: milder upward velocity, stronger lateral spread
-            vx = random.uniform(-160.0, 160.0)
-            vy = -random.uniform(70.0, 160.0)  # negative = upward on screen
-            life = random.uniform(0.7, 1.3)
+            vx = -160.0 + 320.0 * u[1]
+            vy = -(70.0 + 90.0 * u[2])  # negative = upward on screen
+            life = 0.7 + 0.6 * u[3]
             # slightly larger but still small
-            size = random.randint(1, 3)
-            float_time = random.uniform(0.08, 0.22)  # reduced gravity window
-            side_acc = random.uniform(-120.0, 120.0)
+            size = 1 + int(u[4] * 3)
+            float_time = 0.08 + 0.14 * u[5]  # reduced gravity window
+            side_acc = -120.0 + 240.0 * u[6]
         else:
             # drifting/fall-first particles
-            vx = random.uniform(-100.0, 100.0)
-            vy = random.uniform(40.0, 160.0)  # positive = downward
-            life = random.uniform(0.5, 1.0)
-            size = random.randint(1, 3)
+            vx = -100.0 + 200.0 * u[1]
+            vy = 40.0 + 120.0 * u[2]  # positive = downward
+            life = 0.5 + 0.5 * u[3]
+            size = 1 + int(u[4] * 3)
             float_time = 0.0
-            side_acc = random.uniform(-40.0, 40.0)
+            side_acc = -40.0 + 80.0 * u[5]
 
         # create per-particle shade start/end for subtle tonal interpolation
-        def _clamp(v):
-            return max(0, min(255, int(v)))
-
         # small brighten/darken factors
-        b_factor = random.uniform(1.02, 1.22)
-        d_factor = random.uniform(0.45, 0.92)
-        shade_start = [
-            _clamp(color[0] * b_factor),
-            _clamp(color[1] * b_factor),
-            _clamp(color[2] * b_factor),
-        ]
-        shade_end = [
-            _clamp(color[0] * d_factor),
-            _clamp(color[1] * d_factor),
-            _clamp(color[2] * d_factor),
-        ]
-
+        b_factor = 1.02 + 0.20 * u[7]
+        d_factor = 0.45 + 0.47 * u[8]
         # add tiny per-channel jitter so not all particles have identical tones
-        for ci in range(3):
-            shade_start[ci] = _clamp(shade_start[ci] + random.randint(-8, 8))
-            shade_end[ci] = _clamp(shade_end[ci] + random.randint(-12, 12))
-        shade_start = tuple(shade_start)
-        shade_end = tuple(shade_end)
+        shade_start = (
+            _clamp(_clamp(color[0] * b_factor) + int(u[9] * 17) - 8),
+            _clamp(_clamp(color[1] * b_factor) + int(u[10] * 17) - 8),
+            _clamp(_clamp(color[2] * b_factor) + int(u[11] * 17) - 8),
+        )
+        shade_end = (
+            _clamp(_clamp(color[0] * d_factor) + int(u[12] * 25) - 12),
+            _clamp(_clamp(color[1] * d_factor) + int(u[13] * 25) - 12),
+            _clamp(_clamp(color[2] * d_factor) + int(u[14] * 25) - 12),
+        )
 
         # Increase particle size by 36% (user request)
         size = max(1, int(round(size * 1.36)))
 
         # Physics tuning: per-particle drag, wind, and small oscillation for natural motion
-        drag = random.uniform(0.6, 2.2)  # higher = slows quicker
-        wind = random.uniform(-28.0, 28.0)
-        osc_amp = random.uniform(0.0, 2.4)
-        osc_freq = random.uniform(1.2, 6.0)
+        drag = 0.6 + 1.6 * u[15]  # higher = slows quicker
+        wind = -28.0 + 56.0 * u[16]
+        osc_amp = 2.4 * u[17]
+        osc_freq = 1.2 + 4.8 * u[18]
 
         # Add angular jitter to spread directions so particles don't all go identical
-        try:
-            ang = math.atan2(vy, vx)
-        except Exception:
-            ang = 0.0
-        ang += random.uniform(math.radians(-35.0), math.radians(35.0))
-        speed = math.hypot(vx, vy) * random.uniform(0.78, 1.18)
+        ang = math.atan2(vy, vx) + jitter * (2.0 * u[19] - 1.0)
+        speed = math.hypot(vx, vy) * (0.78 + 0.40 * u[20])
         vx = math.cos(ang) * speed
         vy = math.sin(ang) * speed
 
         # If the source color looks like grass (green-dominant), add subtle green tone variations
-        is_grass = color[1] > color[0] and color[1] > color[2] and color[1] >= 60
-        if is_grass and random.random() < 0.35:
+        if is_grass and u[21] < 0.35:
             # create green-leaning shades
             g_base = max(80, color[1])
-            gs = (
-                _clamp(int(g_base * random.uniform(0.18, 0.55))),
-                _clamp(int(g_base * random.uniform(0.85, 1.15))),
-                _clamp(int(g_base * random.uniform(0.08, 0.45))),
+            shade_start = (
+                _clamp(int(g_base * (0.18 + 0.37 * u[22]))),
+                _clamp(int(g_base * (0.85 + 0.30 * u[23]))),
+                _clamp(int(g_base * (0.08 + 0.37 * u[24]))),
             )
-            ge = (
-                _clamp(int(g_base * random.uniform(0.35, 0.78))),
-                _clamp(int(g_base * random.uniform(0.42, 0.95))),
-                _clamp(int(g_base * random.uniform(0.05, 0.28))),
+            shade_end = (
+                _clamp(int(g_base * (0.35 + 0.43 * u[25]))),
+                _clamp(int(g_base * (0.42 + 0.53 * u[26]))),
+                _clamp(int(g_base * (0.05 + 0.23 * u[27]))),
             )
-            shade_start = gs
-            shade_end = ge
 
             # occasionally spawn a tiny vivid green fleck in addition
-            if random.random() < 0.12:
-                fleck = {}
-                fleck["pos"] = [float(position[0]), float(position[1])]
-                fleck["vel"] = [random.uniform(-80, 80), random.uniform(-60, 20)]
-                fleck["life"] = random.uniform(0.45, 0.9)
-                fleck["max_life"] = fleck["life"]
-                fleck["color"] = (180, 255, 120)
-                fleck["shade_start"] = (200, 255, 140)
-                fleck["shade_end"] = (100, 160, 80)
-                fleck["size"] = 1
-                fleck["age"] = 0.0
-                fleck["float_time"] = 0.0
-                fleck["side_acc"] = random.uniform(-20, 20)
-                fleck["drag"] = random.uniform(0.8, 2.2)
-                fleck["wind"] = random.uniform(-10, 10)
-                fleck["osc_amp"] = random.uniform(0.0, 1.2)
-                fleck["osc_freq"] = random.uniform(2.0, 6.0)
-                p_list.append(fleck)
+            if u[28] < 0.12 and particle_governor.allow_cosmetic(len(p_list)):
+                fleck_life = 0.45 + 0.45 * u[31]
+                p_list.append(
+                    {
+                        "pos": [float(position[0]), float(position[1])],
+                        "vel": [-80.0 + 160.0 * u[29], -60.0 + 80.0 * u[30]],
+                        "life": fleck_life,
+                        "max_life": fleck_life,
+                        "color": (180, 255, 120),
+                        "shade_start": (200, 255, 140),
+                        "shade_end": (100, 160, 80),
+                        "size": 1,
+                        "age": 0.0,
+                        "float_time": 0.0,
+                        "side_acc": -20.0 + 40.0 * u[32],
+                        "drag": 0.8 + 1.4 * u[33],
+                        "wind": -10.0 + 20.0 * u[34],
+                        "osc_amp": 1.2 * u[35],
+                        "osc_freq": 2.0 + 4.0 * u[36],
+                    }
+                )
 
         # If the source color looks yellow-ish, occasionally bias tones slightly green
-        is_yellow = (color[0] >= 160 and color[1] >= 140 and color[2] <= 140) or (
-            color[0] > color[1] and color[1] > color[2] and color[1] >= 120
-        )
-        if is_yellow and random.random() < 0.30:
-            # nudge toward greener yellows (subtle)
-            gs = (
-                _clamp(color[0] * random.uniform(0.92, 1.03)),
-                _clamp(color[1] * random.uniform(1.06, 1.28)),
-                _clamp(color[2] * random.uniform(0.45, 0.85)),
+        if is_yellow and u[37] < 0.30:
+            # nudge toward greener yellows (subtle), with small per-channel jitter too
+            shade_start = (
+                _clamp(_clamp(color[0] * (0.92 + 0.11 * u[38])) + int(u[44] * 13) - 6),
+                _clamp(_clamp(color[1] * (1.06 + 0.22 * u[39])) + int(u[45] * 13) - 6),
+                _clamp(_clamp(color[2] * (0.45 + 0.40 * u[40])) + int(u[46] * 13) - 6),
             )
-            ge = (
-                _clamp(color[0] * random.uniform(0.72, 0.95)),
-                _clamp(color[1] * random.uniform(0.88, 1.02)),
-                _clamp(color[2] * random.uniform(0.20, 0.55)),
+            shade_end = (
+                _clamp(_clamp(color[0] * (0.72 + 0.23 * u[41])) + int(u[47] * 21) - 10),
+                _clamp(_clamp(color[1] * (0.88 + 0.14 * u[42])) + int(u[48] * 21) - 10),
+                _clamp(_clamp(color[2] * (0.20 + 0.35 * u[43])) + int(u[49] * 21) - 10),
             )
-            # apply small per-channel jitter too
-            gs = tuple(_clamp(c + random.randint(-6, 6)) for c in gs)
-            ge = tuple(_clamp(c + random.randint(-10, 10)) for c in ge)
-            shade_start = gs
-            shade_end = ge
 
         p.update(
             {
@@ -279,9 +316,10 @@ def update_particles(p_list, dt):
             p_list.pop(i)
         else:
             i += 1
+    particle_governor.active = len(p_list)
 
 
-def draw_particles(surface, p_list):
+def draw_particles(surface, p_list, offset=(0, 0)):
     """Draw particles as pixel squares using a small surface cache."""
     # cache structure: { (size,color): {"base": Surface, "alpha": {alpha_int: Surface}} }
     if not hasattr(draw_particles, "cache"):
@@ -341,49 +379,11 @@ def draw_particles(surface, p_list):
         else:
             offset_x = 0.0
 
-        blit_x = int(round(p["pos"][0] - r + offset_x))
-        blit_y = int(round(p["pos"][1] - r))
+        blit_x = int(round(p["pos"][0] - r + offset_x)) + offset[0]
+        blit_y = int(round(p["pos"][1] - r)) + offset[1]
         surface.blit(draw_surf, (blit_x, blit_y))
 
 
-# create a cached background gradient to avoid per-frame fill calls
-def _get_bg_gradient(size):
-    if not hasattr(_get_bg_gradient, "cache"):
-        _get_bg_gradient.cache = {}
-    key = tuple(size)
-    if key in _get_bg_gradient.cache:
-        return _get_bg_gradient.cache[key]
-    surf = pygame.Surface(size)
-    # vertical gradient from darker to lighter - Mystic Nature Theme
-    # vertical gradient from darker to lighter - Mystic Nature Theme (Deep Forest)
-    top = (15, 25, 20)
-    bottom = (30, 45, 35)
-    for y in range(size[1]):
-        t = y / max(1, size[1] - 1)
-        col = (
-            int(top[0] * (1 - t) + bottom[0] * t),
-            int(top[1] * (1 - t) + bottom[1] * t),
-            int(top[2] * (1 - t) + bottom[2] * t),
-        )
-        pygame.draw.line(surf, col, (0, y), (size[0], y))
-
-    # Simple Vignette (darken corners) - REMOVED per user request
-    # try:
-    #     # Create a radial gradient approximation using a large texture scaled up
-    #     vig_tex = pygame.Surface((100, 100), pygame.SRCALPHA)
-    #     vig_tex.fill((0, 0, 0, 150))  # Dark corners
-    #     # Clear center circle
-    #     pygame.draw.circle(vig_tex, (0, 0, 0, 0), (50, 50), 45)
-    #     # Scale to screen size to create soft blur effect
-    #     vig_scaled = pygame.transform.smoothscale(vig_tex, size)
-    #     surf.blit(vig_scaled, (0, 0))
-    # except Exception:
-    #     pass
-
-    _get_bg_gradient.cache[key] = surf
-    return surf
-
-
 def smooth_damp(
     current, target, current_velocity, smooth_time, dt, max_speed=float("inf")
 ):
@@ -426,6 +426,52 @@ def smooth_damp(
 
 # global button states for hover/press animations
 button_states = {}
+# draw_button keeps at most this many rendered buttons (LRU). Labels with live
+# prices ("AFK Income +0.5 ($1234)") would otherwise add an entry per purchase.
+BUTTON_CACHE_SIZE = 48
+# Press animation scales are snapped to this step so squash frames are reused
+BUTTON_SCALE_STEP = 0.005
+
+
+def measure_text(font, text):
+    """font.size(text), memoized per (font, label) so steady frames skip it."""
+    if not hasattr(measure_text, "cache"):
+        measure_text.cache = {}
+    key = (id(font), text)
+    size = measure_text.cache.get(key)
+    if size is None:
+        if len(measure_text.cache) > 256:
+            # Labels with live prices keep changing; drop stale measurements
+            measure_text.cache.clear()
+        size = font.size(text)
+        measure_text.cache[key] = size
+    return size
+
+
+def layout_button_column(column, labels, right, top, padding=8, gap=8):
+    """Stack buttons sized to their labels, right-aligned, top to bottom.
+
+    labels: sequence of (name, text, font). Returns {name: Rect}. The result is
+    cached per column and only recomputed when a label (or the anchor) changes,
+    so callers must treat the rects as read-only.
+    """
+    if not hasattr(layout_button_column, "cache"):
+        layout_button_column.cache = {}
+    key = (tuple((name, text, id(font)) for name, text, font in labels), right, top)
+    cached = layout_button_column.cache.get(column)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    rects = {}
+    y = top
+    for name, text, font in labels:
+        text_w, text_h = measure_text(font, text)
+        rect = pygame.Rect(0, 0, text_w + 2 * padding, text_h + 2 * padding)
+        rect.topright = (right, y)
+        rects[name] = rect
+        y = rect.bottom + gap
+    layout_button_column.cache[column] = (key, rects)
+    return rects
 
 
 def draw_button(
@@ -471,7 +517,8 @@ def draw_button(
             "pos": 0.0,
         }
 
-    mouse_over = rect.collidepoint(pygame.mouse.get_pos())
+    mouse = replay.mouse_pos() if replay.ENABLED else pygame.mouse.get_pos()
+    mouse_over = rect.collidepoint(mouse)
     target = 1.0 if mouse_over else 0.0
     # smooth approach to hover using SmoothDamp for frame-rate independent smoothing
     hover_cur = state.get("hover_val", 0.0)
@@ -510,12 +557,14 @@ def draw_button(
 
     # Render base button once at base size and cache it. Minor per-frame scaling
     # (for press animation) will not bust the cache.
+    # cache structure: { key: {"base": Surface, "scaled": {scale_step: Surface}} }
     base_w, base_h = rect.width, rect.height
     if not hasattr(draw_button, "button_cache"):
-        draw_button.button_cache = {}
+        draw_button.button_cache = OrderedDict()
+    cache = draw_button.button_cache
     cache_key = (text, id(font), base_w, base_h, bg_color, border_color, text_color)
-    val = draw_button.button_cache.get(cache_key)
-    if val is None:
+    entry = cache.get(cache_key)
+    if entry is None:
         base_surf = pygame.Surface((base_w, base_h), pygame.SRCALPHA)
         pygame.draw.rect(
             base_surf, bg_color, pygame.Rect(0, 0, base_w, base_h), border_radius=6
@@ -532,13 +581,13 @@ def draw_button(
         txt_rect = text_surf.get_rect(center=(base_w // 2, base_h // 2))
         base_surf.blit(text_surf, txt_rect)
 
-        draw_button.button_cache[cache_key] = base_surf
+        entry = {"base": base_surf, "scaled": {}}
+        cache[cache_key] = entry
+        if len(cache) > BUTTON_CACHE_SIZE:
+            cache.popitem(last=False)
     else:
-        if isinstance(val, tuple):
-            # Legacy support if cache has tuple
-            base_surf, _ = val
-        else:
-            base_surf = val
+        cache.move_to_end(cache_key)
+    base_surf = entry["base"]
     # press impulse decays quickly
     press_impulse = state.get("press_impulse", 0.0)
     # If previous code set numeric 'press', map it to impulse (backcompat)
@@ -557,17 +606,23 @@ def draw_button(
     state["scale"] = new_scale
     state["scale_vel"] = new_scale_vel
 
-    # Compute final drawn size from smoothed scale
-    sw, sh = max(1, int(base_w * new_scale)), max(1, int(base_h * new_scale))
+    # Compute final drawn size from the smoothed scale, snapped to a step so the
+    # few distinct squash frames of a press are scaled once and then reused
+    scale_step = int(round(new_scale / BUTTON_SCALE_STEP))
+    snapped = scale_step * BUTTON_SCALE_STEP
+    sw, sh = max(1, int(base_w * snapped)), max(1, int(base_h * snapped))
 
     # scale the base surface for current frame. Use smoothscale for quality
     if sw == base_w and sh == base_h:
         btn_surf = base_surf
     else:
-        try:
-            btn_surf = pygame.transform.smoothscale(base_surf, (sw, sh))
-        except Exception:
-            btn_surf = pygame.transform.scale(base_surf, (sw, sh))
+        btn_surf = entry["scaled"].get(scale_step)
+        if btn_surf is None:
+            try:
+                btn_surf = pygame.transform.smoothscale(base_surf, (sw, sh))
+            except Exception:
+                btn_surf = pygame.transform.scale(base_surf, (sw, sh))
+            entry["scaled"][scale_step] = btn_surf
 
     surface.blit(btn_surf, draw_rect.topleft)
 
@@ -580,35 +635,118 @@ def draw_button(
     return text_rect
 
 
+# draw_panel keeps this many built panel skins (LRU)
+PANEL_CACHE_SIZE = 32
+
+
+def _panel_layer(size, color, radius, border_color=None, nine_slice=False):
+    """One SRCALPHA rounded-rect layer, optionally stretched from a small texture."""
+    w, h = size
+    if not nine_slice or w <= 2 * radius + 1 or h <= 2 * radius + 1:
+        layer = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(layer, color, layer.get_rect(), border_radius=radius)
+        if border_color is not None:
+            pygame.draw.rect(
+                layer, border_color, layer.get_rect(), 2, border_radius=radius
+            )
+        return layer
+
+    # Nine-slice: corners copied, edges/center stretched from a (2r+1)^2 texture
+    c = radius
+    tex = _panel_layer((2 * c + 1, 2 * c + 1), color, radius, border_color)
+    layer = pygame.Surface((w, h), pygame.SRCALPHA)
+    mid_w, mid_h = w - 2 * c, h - 2 * c
+    pieces = (
+        # (source rect in texture, destination rect)
+        ((0, 0, c, c), (0, 0, c, c)),
+        ((c + 1, 0, c, c), (w - c, 0, c, c)),
+        ((0, c + 1, c, c), (0, h - c, c, c)),
+        ((c + 1, c + 1, c, c), (w - c, h - c, c, c)),
+        ((c, 0, 1, c), (c, 0, mid_w, c)),
+        ((c, c + 1, 1, c), (c, h - c, mid_w, c)),
+        ((0, c, c, 1), (0, c, c, mid_h)),
+        ((c + 1, c, c, 1), (w - c, c, c, mid_h)),
+        ((c, c, 1, 1), (c, c, mid_w, mid_h)),
+    )
+    for src, dst in pieces:
+        piece = tex.subsurface(src)
+        if piece.get_size() != dst[2:]:
+            piece = pygame.transform.scale(piece, dst[2:])
+        # pieces don't overlap; RGBA_MAX onto a clear surface is an exact copy
+        layer.blit(piece, dst[:2], special_flags=pygame.BLEND_RGBA_MAX)
+    return layer
+
+
+def _panel_skin(size, border_color, bg_color, radius, shadow, nine_slice):
+    """Build the blit list [(surface, offset, flags)] for one panel look."""
+    border = pygame.Color(border_color)
+    border.a = 255  # border was always drawn opaque straight onto the screen
+    body = _panel_layer(size, bg_color, radius, border, nine_slice)
+    if not shadow:
+        return [(body, (0, 0), 0)]
+
+    shadow_surf = _panel_layer(size, (0, 0, 0, 80), radius, None, nine_slice)
+    if not hasattr(body, "premul_alpha"):
+        # Older pygame: keep shadow and body as two blits
+        return [(shadow_surf, (4, 4), 0), (body, (0, 0), 0)]
+    # Composite shadow + body once, premultiplied so it blends exactly like
+    # the two separate blits did
+    w, h = size
+    canvas = pygame.Surface((w + 4, h + 4), pygame.SRCALPHA)
+    canvas.blit(
+        shadow_surf.premul_alpha(), (4, 4), special_flags=pygame.BLEND_PREMULTIPLIED
+    )
+    canvas.blit(body.premul_alpha(), (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+    return [(canvas, (0, 0), pygame.BLEND_PREMULTIPLIED)]
+
+
 def draw_panel(
     surface,
     rect,
     border_color=(100, 150, 120),
     bg_color=(30, 40, 35, 230),
     draw_shadow=True,
+    radius=8,
+    nine_slice=False,
 ):
-    """Draws a unified panel background with border and shadow."""
-    # Shadow
-    if draw_shadow:
-        shadow_rect = rect.copy()
-        shadow_rect.x += 4
-        shadow_rect.y += 4
-        s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(s, (0, 0, 0, 80), s.get_rect(), border_radius=8)
-        surface.blit(s, (shadow_rect.x, shadow_rect.y))
+    """Draws a unified panel background with border and shadow.
 
-    # Background
-    bg = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(bg, bg_color, bg.get_rect(), border_radius=8)
-    surface.blit(bg, rect.topleft)
+    The chrome is built once per (size, colors, radius, shadow) and cached, so a
+    steady frame costs a single blit. nine_slice builds new sizes by stretching
+    a small texture instead of rasterizing rounded rects (for resizable panels).
+    """
+    if not hasattr(draw_panel, "skin_cache"):
+        draw_panel.skin_cache = OrderedDict()
+    cache = draw_panel.skin_cache
+    key = (
+        rect.size,
+        tuple(border_color),
+        tuple(bg_color),
+        radius,
+        bool(draw_shadow),
+        bool(nine_slice),
+    )
+    skin = cache.get(key)
+    if skin is None:
+        skin = _panel_skin(
+            rect.size, border_color, bg_color, radius, draw_shadow, nine_slice
+        )
+        cache[key] = skin
+        if len(cache) > PANEL_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
 
-    # Border
-    pygame.draw.rect(surface, border_color, rect, 2, border_radius=8)
+    for surf, (ox, oy), flags in skin:
+        surface.blit(surf, (rect.x + ox, rect.y + oy), special_flags=flags)
 
 
 def safe_load_sound(path, default_volume=0.08):
+    global _sound_bank
     try:
-        s = pygame.mixer.Sound(resource_path(path))
+        if _sound_bank is None:
+            _sound_bank = SoundBank(os.path.join(get_save_dir(), "sound_cache"))
+        s = _sound_bank.load(path)
         _safe_set_volume(s, default_volume)
         return s
     except Exception:
@@ -622,15 +760,17 @@ def safe_load_sound(path, default_volume=0.08):
 
 def run_loop(screen, clock, assets):
     """Ana oyun döngüsü. Ekranda animasyon ve para sayacını günceller."""
+    global widget_tree
 
-    random_weather_change = random.randint(1, 3)
+    startup_profiler.begin("run_loop.setup")
+    random_weather_change = rng.weather.randint(1, 3)
     weather_multiplier = 1.0
     # Try to initialize music; on headless/Linux/Wine installs this may fail.
     music_enabled = True
     try:
         try:
             if getattr(globals().get("game_loop", None), "MIXER_AVAILABLE", True):
-                pygame.mixer.music.load(resource_path(BACK_SOUND_PATH))
+                load_music(BACK_SOUND_PATH)
                 pygame.mixer.music.play(-1)  # Sonsuz döngüde çal
                 pygame.mixer.music.set_volume(
                     0.01596705
@@ -643,19 +783,19 @@ def run_loop(screen, clock, assets):
     panel_open = False
     panel_scale = 0
     panel_speed = 0.1
-    sound_on_image = pygame.image.load(
-        resource_path("Assets/images/musicOn.png")
-    ).convert_alpha()
-    sound_off_image = pygame.image.load(
-        resource_path("Assets/images/musicOff.png")
-    ).convert_alpha()
+    sound_on_image = load_image(MUSIC_ON_IMG_PATH).convert_alpha()
+    sound_off_image = load_image(MUSIC_OFF_IMG_PATH).convert_alpha()
     sound_on_image = pygame.transform.scale(sound_on_image, (30, 30))
     sound_off_image = pygame.transform.scale(sound_off_image, (30, 30))
     current_sound_state = "on"
     sound_image = sound_on_image
 
     # Oyun verilerini yükleme
-    game_data = load_game_data()
+    with startup_profiler.phase("load_game_data"):
+        game_data = load_game_data()
+    if replay.ENABLED:
+        # recording: remember the starting save; replay: start from the recorded one
+        game_data = replay.start(game_data, os.path.join(get_save_dir(), "recordings"))
     money = game_data.get("money", 0)
     multiplier = game_data.get("multiplier", 1)
     auto_income = game_data.get("auto_income", 0.0)
@@ -846,19 +986,23 @@ def run_loop(screen, clock, assets):
     # NEW: Power-up system
     active_powerups = []
     powerup_spawn_timer = 0.0
-    POWERUP_SPAWN_INTERVAL = random.uniform(45, 90)  # Random spawn time
+    POWERUP_SPAWN_INTERVAL = rng.powerups.uniform(45, 90)  # Random spawn time
 
     # NEW: Daily rewards
     import datetime
 
     last_login_str = game_data.get("last_login_date", None)
     login_streak = game_data.get("login_streak", 0)
-    today = datetime.date.today().isoformat()
+    # a replay checks the daily free spin against the recording's date
+    today = replay.today() if replay.ENABLED else datetime.date.today().isoformat()
     show_daily_reward = False
     daily_reward_amount = 0
 
     # Check daily reward
-    if last_login_str:
+    if replay.ENABLED:
+        # wall-clock bonuses are skipped while recording/replaying (replay.py)
+        pass
+    elif last_login_str:
         last_login = datetime.date.fromisoformat(last_login_str)
         today_date = datetime.date.today()
         days_diff = (today_date - last_login).days
@@ -880,7 +1024,7 @@ def run_loop(screen, clock, assets):
     daily_reward_timer = 3.0 if show_daily_reward else 0.0
 
     # NEW: Floating damage numbers
-    damage_numbers = []
+    damage_numbers = EntityPool(DamageNumber)
 
     # NEW: Screen shake
     screen_shake_intensity = 0.0
@@ -888,7 +1032,7 @@ def run_loop(screen, clock, assets):
     screen_offset = [0, 0]
 
     # NEW: Notification system
-    notifications = []  # {text, color, timer, y_offset}
+    notifications = EntityPool(Notification)
 
     # NEW: Tooltips
     current_tooltip = None
@@ -902,13 +1046,14 @@ def run_loop(screen, clock, assets):
             "show_fps": False,
             "particle_density": 1.0,
             "master_volume": 1.0,
+            "coalesce_damage_numbers": False,
         },
     )
     show_settings = False
+    particle_governor.set_density(settings.get("particle_density", 1.0))
 
     # NEW: Auto-save
     autosave_timer = 0.0
-    AUTOSAVE_INTERVAL = 30.0
     save_indicator_timer = 0.0
 
     # ============================================================
@@ -925,7 +1070,7 @@ def run_loop(screen, clock, assets):
     last_play_time_str = game_data.get("last_play_time", None)
     show_offline_progress = False
     offline_earnings = 0
-    if last_play_time_str and auto_income > 0:
+    if last_play_time_str and auto_income > 0 and not replay.ENABLED:
         try:
             last_play_time = datetime.datetime.fromisoformat(last_play_time_str)
             now = datetime.datetime.now()
@@ -949,7 +1094,7 @@ def run_loop(screen, clock, assets):
     minigame_active = False
     minigame_timer = 0.0
     minigame_score = 0
-    minigame_targets = []  # For target practice
+    minigame_targets = EntityPool(Target)  # targets / golden rush coins
     minigame_click_count = 0  # For click frenzy
     minigame_result = None  # Store result after game ends
     minigame_result_timer = 0.0
@@ -1330,6 +1475,32 @@ def run_loop(screen, clock, assets):
         if ach_id not in achievements:
             achievements[ach_id] = {"unlocked": False, "progress": 0}
 
+    # Threshold achievements are unlocked in batches by the engine (once per
+    # frame, see UPDATE STATISTICS); event achievements use check_achievement
+    achievement_engine = AchievementEngine(achievements, achievement_defs)
+    achievement_engine.add_rules(
+        "money",
+        {
+            "money_1k": 1000,
+            "money_10k": 10000,
+            "money_100k": 100000,
+            "money_1m": 1000000,
+        },
+    )
+    achievement_engine.add_rules(
+        "total_clicks", {"click_100": 100, "click_1000": 1000, "click_10000": 10000}
+    )
+    achievement_engine.add_rules(
+        "combo_count", {"combo_10": 10, "combo_25": 25, "combo_50": 50}
+    )
+    achievement_engine.add_rules(
+        "total_playtime", {"playtime_1h": 3600, "playtime_10h": 36000}
+    )
+    achievement_engine.add_rules(
+        "critical_hit_count", {"crit_100": 100, "crit_1000": 1000}
+    )
+    achievement_engine.add_rules("special_collected_count", {"special_10": 10})
+
     # === POWER-UP DEFINITIONS ===
     powerup_types = [
         {
@@ -1378,15 +1549,17 @@ def run_loop(screen, clock, assets):
 
     # === PRESTIGE BUTTON ===
     show_prestige_confirm = False
-    prestige_button_rect = pygame.Rect(0, 0, 100, 30)
+    prestige_button_rect = pygame.Rect(0, 0, 80, 25)
+    prestige_button_rect.bottomleft = (10, SCREEN_SIZE[1] - 45)
 
     # Assets dictionary'den gerekli görselleri ve fontu al
     grass_img_original = assets["grass_img"]
     custom_font = assets["custom_font"]
-    font_path = resource_path(CUSTOM_FONT_PATH)
-    small_font = pygame.font.Font(font_path, 18)  # Daha küçük fontlar kullan
-    extra_small_font = pygame.font.Font(font_path, 14)  # Extra küçük font
-    medium_font = pygame.font.Font(font_path, 22)  # Orta boyut
+    with startup_profiler.phase("fonts"):
+        # CountingFont: renders show up in the F3 overlay
+        small_font = load_font(CUSTOM_FONT_PATH, 18, CountingFont)  # Daha küçük
+        extra_small_font = load_font(CUSTOM_FONT_PATH, 14, CountingFont)  # Extra küçük
+        medium_font = load_font(CUSTOM_FONT_PATH, 22, CountingFont)  # Orta boyut
 
     # Farklı çim görselleri
     grass_images = [grass_img_original]  # İlk görsel varsayılan
@@ -1407,86 +1580,11 @@ def run_loop(screen, clock, assets):
         "Blackhole Grass",
     ]  # Çim isimleri
 
-    # Altın çim oluştur
-    golden_grass = grass_img_original.copy()
-    for x in range(golden_grass.get_width()):
-        for y in range(golden_grass.get_height()):
-            color = golden_grass.get_at((x, y))
-            if color.a != 0:  # Sadece görünür pikselleri işle
-                # Yeşil değerleri altın tonlarına dönüştür
-                green_value = color.g
-                new_color = pygame.Color(
-                    min(255, int(green_value * 1.2)),  # Kırmızı bileşeni artır
-                    min(255, int(green_value * 0.9)),  # Yeşil bileşeni biraz azalt
-                    min(255, int(green_value * 0.3)),  # Mavi bileşeni azalt
-                )
-                golden_grass.set_at((x, y), new_color)
-    grass_images.append(golden_grass)
-
-    # Gökkuşağı çim oluştur
-    rainbow_grass = grass_img_original.copy()
-    for x in range(rainbow_grass.get_width()):
-        for y in range(rainbow_grass.get_height()):
-            color = rainbow_grass.get_at((x, y))
-            if color.a != 0:  # Sadece görünür pikselleri işle
-                # Yeşil değerleri gökkuşağı tonlarına dönüştür
-                green_value = color.g
-                new_color = pygame.Color(
-                    min(255, int(green_value * 0.3)),  # Kırmızı bileşeni artır
-                    min(255, int(green_value * 1.1)),  # Yeşil bileşeni biraz azalt
-                    min(255, int(green_value * 5)),  # Mavi bileşeni azalt
-                )
-                rainbow_grass.set_at((x, y), new_color)
-    grass_images.append(rainbow_grass)
-
-    # Elmas çim oluştur
-    diamond_grass = grass_img_original.copy()
-    for x in range(diamond_grass.get_width()):
-        for y in range(diamond_grass.get_height()):
-            color = diamond_grass.get_at((x, y))
-            if color.a != 0:  # Sadece görünür pikselleri işle
-                # Yeşil değerleri elmas tonlarına dönüştür
-                green_value = color.g
-                new_color = pygame.Color(
-                    min(255, int(green_value * 0.1)),  # Kırmızı bileşeni artır
-                    min(255, int(green_value * 1)),  # Yeşil bileşeni biraz azalt
-                    min(255, int(green_value * 1.8)),  # Mavi bileşeni azalt
-                )
-                diamond_grass.set_at((x, y), new_color)
-    grass_images.append(diamond_grass)
-
-    # Gizemli çim oluştur
-    # Mystic Grass oluştur
-    mystic_grass = grass_img_original.copy()
-    for x in range(mystic_grass.get_width()):
-        for y in range(mystic_grass.get_height()):
-            color = mystic_grass.get_at((x, y))
-            if color.a != 0:  # Sadece görünür pikselleri işle
-                # Yeşil değerleri gizemli tonlara dönüştür
-                green_value = color.g
-                new_color = pygame.Color(
-                    min(255, int(green_value * 0.5)),  # Kırmızı bileşeni azalt
-                    min(255, int(green_value * 0.2)),  # Yeşil bileşeni azalt
-                    min(255, int(green_value * 1.5)),  # Mavi bileşeni artır
-                )
-                mystic_grass.set_at((x, y), new_color)
-    grass_images.append(mystic_grass)
-
-    # Blackhole Grass oluştur
-    blackhole_grass = grass_img_original.copy()
-    for x in range(blackhole_grass.get_width()):
-        for y in range(blackhole_grass.get_height()):
-            color = blackhole_grass.get_at((x, y))
-            if color.a != 0:  # Sadece görünür pikselleri işle
-                # Yeşil değerleri siyah delik tonlarına dönüştür
-                green_value = color.g
-                new_color = pygame.Color(
-                    min(255, int(green_value * 0.1)),  # Kırmızı bileşeni azalt
-                    min(255, int(green_value * 0.1)),  # Yeşil bileşeni azalt
-                    min(255, int(green_value * 0.1)),  # Mavi bileşeni azalt
-                )
-                blackhole_grass.set_at((x, y), new_color)
-    grass_images.append(blackhole_grass)
+    # Altın, donmuş, elmas, gizemli ve kara delik çimlerini oluştur
+    startup_profiler.begin("grass_variants")
+    for factors in GRASS_VARIANT_FACTORS:
+        grass_images.append(tint_grass(grass_img_original, factors))
+    startup_profiler.end()
 
     # Aktif çim görselini ayarla
     if current_grass_index < len(grass_images):
@@ -1495,22 +1593,25 @@ def run_loop(screen, clock, assets):
         active_grass_img = grass_images[0]
         current_grass_index = 0
 
-    # sesleri yükle ve çal
-    try:
-        if getattr(globals().get("game_loop", None), "MIXER_AVAILABLE", True):
-            pygame.mixer.music.load(resource_path(BACK_SOUND_PATH))
-            pygame.mixer.music.play(-1)  # Sonsuz döngüde çal
-            pygame.mixer.music.set_volume(
-                0.01596705
-            )  # Ses seviyesini ayarla (0.0 - 1.0)
-    except Exception:
-        pass
-    # use configured CLICK_SOUND_PATH constant when available
-    click_effect = safe_load_sound(CLICK_SOUND_PATH) or safe_load_sound(
-        "assets/sounds/click.mp3"
+    # sesleri yükle (müzik run_loop başında zaten başlatıldı)
+    startup_profiler.begin("sounds")
+    click_effect = safe_load_sound(CLICK_SOUND_PATH)
+    weather_change_effect = safe_load_sound(CHANGE_SOUND_PATH)
+    buy_effect = safe_load_sound(BUY_SOUND_PATH)
+    # Voice-limited playback: volumes are precomputed from master_volume, and
+    # rapid clicks reuse a small channel pool instead of stacking voices.
+    voices = VoiceManager(master_volume=settings.get("master_volume", 1.0))
+    voices.register(
+        "click", click_effect, "click", 0.0896705, max_voices=3, min_interval=0.03
+    )
+    voices.register(
+        "ui", click_effect, "ui", 0.0896705, max_voices=2, min_interval=0.05
+    )
+    voices.register(
+        "buy", buy_effect, "sfx", 0.0896705, max_voices=2, min_interval=0.05
     )
-    weather_change_effect = safe_load_sound("assets/sounds/change.mp3")
-    buy_effect = safe_load_sound("assets/sounds/buy.mp3")
+    voices.register("weather", weather_change_effect, "sfx", 0.0696705, max_voices=1)
+    startup_profiler.end()
 
     weather_index = 0  # Hava durumu indeksi
     weather_timer = 0  # Hava durumu zamanlayıcısı
@@ -1572,6 +1673,166 @@ def run_loop(screen, clock, assets):
     # İstatistik ekranı ve mağaza ekranı görünürlüğü
     show_stats = False
     show_shop = False
+
+    # Widget tree: every clickable rect lives here, shared by drawing and hit tests.
+    # HUD/grass rects are updated where they are laid out; overlays are fixed.
+    ui = WidgetTree()
+    widget_tree = ui
+    for wid in (
+        "afk",
+        "mult",
+        "save",
+        "stats_btn",
+        "shop_btn",
+        "skills_btn",
+        "wheel_btn",
+        "prestige",
+        "sound",
+    ):
+        ui.add(wid, (0, 0, 0, 0))
+    ui.add("wipe", wipe_button_rect)
+    ui.add("grass", grass_rect, layer=LAYER_WORLD)
+
+    def _add_overlay(wid, size):
+        rect = pygame.Rect((0, 0), size)
+        rect.center = (SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
+        ui.add(wid, rect, layer=LAYER_OVERLAY, clickable=False, visible=False)
+
+    _add_overlay("stats", (500, 400))
+    ui.add_local("stats.close", "stats", (200, 350, 100, 40))
+    for k in range(7):
+        # rows run to the overlay's right edge: values at x=300 get 200 px
+        ui.add_local(
+            f"stats.row.{k}", "stats", (50, 80 + k * 40, 450, 40), clickable=False
+        )
+    _add_overlay("shop", (500, 605))
+    ui.add_local("shop.close", "shop", (200, 555, 100, 40))
+    for i in range(len(grass_names)):
+        ui.add_local(
+            f"shop.item.{i}", "shop", (50, 80 + i * 80, 400, 70), clickable=False
+        )
+        # Select/Buy button, right-aligned in its row
+        ui.add_local(f"shop.buy.{i}", f"shop.item.{i}", (300, 15, 80, 40))
+    _add_overlay("skills", (500, 450))
+    for i, sid in enumerate(skills):
+        ui.add_local(
+            f"skills.{sid}", "skills", (50 + (i % 2) * 220, 80 + (i // 2) * 90, 200, 80)
+        )
+    _add_overlay("wheel", (400, 400))
+    ui.add_local("wheel.spin", "wheel", (140, 360, 120, 40))
+
+    # Overlay render cache: rows are rendered onto their own nodes and only
+    # re-rendered when their inputs change; the overlay is re-composed from its
+    # chrome and rows only when some row changed.
+    overlay_chrome = {}
+
+    def _overlay_chrome(wid):
+        chrome = overlay_chrome.get(wid)
+        if chrome is not None:
+            return chrome
+        rect = ui.rect(wid)
+        chrome = pygame.Surface(rect.size)
+        if wid == "skills":
+            chrome.fill((20, 20, 40))
+            pygame.draw.rect(
+                chrome, (100, 50, 200), chrome.get_rect(), 3, border_radius=5
+            )
+        else:
+            chrome.fill((30, 48, 34))
+            pygame.draw.rect(chrome, (40, 58, 44), chrome.get_rect(), border_radius=3)
+            pygame.draw.rect(
+                chrome, (80, 98, 84), chrome.get_rect(), 2, border_radius=3
+            )
+
+            # Başlık
+            title = "Game Statistics" if wid == "stats" else "Grass Shop"
+            title_text = custom_font.render(title, True, TEXT_COLOR)
+            chrome.blit(
+                title_text, (chrome.get_width() // 2 - title_text.get_width() // 2, 20)
+            )
+
+            # Kapat butonu - Pixel art tarzı için daha keskin kenarlar
+            close_text = small_font.render("Close", True, TEXT_COLOR)
+            close_rect = ui.local_rect(f"{wid}.close", wid)
+            pygame.draw.rect(chrome, (200, 50, 50), close_rect, border_radius=3)
+            pygame.draw.rect(
+                chrome, BUTTON_BORDER_COLOR, close_rect, 2, border_radius=3
+            )
+            chrome.blit(
+                close_text,
+                (
+                    close_rect.centerx - close_text.get_width() // 2,
+                    close_rect.centery - close_text.get_height() // 2,
+                ),
+            )
+        overlay_chrome[wid] = chrome
+        return chrome
+
+    def _compose_overlay(wid, title=None):
+        surf = _overlay_chrome(wid).copy()
+        if title is not None:
+            surf.blit(title, (surf.get_width() // 2 - title.get_width() // 2, 20))
+        origin = ui.rect(wid)
+        for child in ui.get(wid).children:
+            if child.surface is not None:
+                surf.blit(
+                    child.surface, (child.rect.x - origin.x, child.rect.y - origin.y)
+                )
+        return surf
+
+    def _render_stats_row(wid, label, value):
+        row = pygame.Surface(ui.rect(wid).size, pygame.SRCALPHA)
+        row.blit(small_font.render(label + ":", True, TEXT_COLOR), (0, 0))
+        row.blit(small_font.render(value, True, MONEY_COLOR), (250, 0))
+        return row
+
+    def _render_shop_row(i, active, status, status_color, button_text, button_color):
+        row_id = f"shop.item.{i}"
+        row = pygame.Surface(ui.rect(row_id).size, pygame.SRCALPHA)
+        # Çim öğesi arka planı - Pixel art tarzı için daha keskin kenarlar
+        item_color = (50, 100, 50) if active else (40, 70, 40)
+        pygame.draw.rect(row, item_color, row.get_rect(), border_radius=3)
+        pygame.draw.rect(row, (60, 90, 60), row.get_rect(), 2, border_radius=3)
+
+        # Çim adı ve fiyatı
+        row.blit(small_font.render(grass_names[i], True, TEXT_COLOR), (15, 10))
+        row.blit(small_font.render(status, True, status_color), (15, 40))
+
+        # Satın alma/seçme butonu
+        button_rect = ui.local_rect(f"shop.buy.{i}", row_id)
+        pygame.draw.rect(row, button_color, button_rect, border_radius=3)
+        pygame.draw.rect(row, BUTTON_BORDER_COLOR, button_rect, 2, border_radius=3)
+        button_text_render = small_font.render(button_text, True, TEXT_COLOR)
+        row.blit(
+            button_text_render,
+            (
+                button_rect.centerx - button_text_render.get_width() // 2,
+                button_rect.centery - button_text_render.get_height() // 2,
+            ),
+        )
+        return row
+
+    def _render_skill_row(sid, color, status):
+        sdata = skills[sid]
+        row = pygame.Surface(ui.rect(f"skills.{sid}").size, pygame.SRCALPHA)
+        pygame.draw.rect(row, color, row.get_rect(), border_radius=5)
+        pygame.draw.rect(row, (200, 200, 200), row.get_rect(), 1, border_radius=5)
+        row.blit(extra_small_font.render(sdata["name"], True, (255, 255, 255)), (5, 5))
+        row.blit(
+            extra_small_font.render(f"Cost: {sdata['cost']} SP", True, (255, 215, 0)),
+            (5, 25),
+        )
+        row.blit(extra_small_font.render(status, True, (200, 200, 200)), (5, 45))
+        return row
+
+    def _sync_overlays():
+        ui.set_visible("stats", show_stats)
+        ui.set_visible("shop", show_shop)
+        ui.set_visible("skills", show_skill_tree)
+        ui.set_visible("wheel", show_lucky_wheel)
+
+    # Each special gets its own node id
+    special_serial = 0
     # non-blocking save message timer (seconds)
     save_msg_timer = 0.0
     save_msg_text = None
@@ -1579,16 +1840,46 @@ def run_loop(screen, clock, assets):
     running = True
     particles = []
     # Special collectibles (golden cookie like)
-    specials = []
+    specials = EntityPool(Special)
+    special_renderer = SpecialRenderer()
     # probabilistic spawn: chance per second to spawn a special
     SPAWN_CHANCE_PER_SECOND = 0.10
     anim_time = 0.0
+    startup_profiler.end()
+    startup_profiler.begin("first_frame")
+    # Trace dumps land next to the save unless --trace/TTG_TRACE named a folder
+    tracer.set_default_dir(os.path.join(get_save_dir(), "traces"))
+    if memory_tracker.ENABLED:
+        memory_tracker.set_default_dir(os.path.join(get_save_dir(), "memory"))
+        # caches whose pixel bytes show in the F3 overlay and memory reports
+        memory_tracker.track_caches(
+            {
+                "particles": lambda: getattr(draw_particles, "cache", None),
+                "buttons": lambda: getattr(draw_button, "button_cache", None),
+                "panels": lambda: getattr(draw_panel, "skin_cache", None),
+                "damage_text": lambda: getattr(draw_damage_numbers, "cache", None),
+                "wheel": lambda: getattr(draw_wheel, "cache", None),
+                "background": lambda: getattr(get_background, "cache", None),
+                "specials": lambda: (special_renderer.sprites, special_renderer.frames),
+                "overlays": lambda: [n.surface for n in ui.widgets.values()],
+                "grass_variants": lambda: grass_images,
+                "popups": lambda: popup_renderer.cache,
+            }
+        )
+    # Only call set_cursor when the cursor actually changes
+    current_cursor = None
+    # Frames are drawn on `screen`; it is the display unless the profiler is on
+    display = screen
+    if replay.ENABLED:
+        clock = replay.wrap_clock(clock)
     while running:
         # Try to run up to 144 FPS for high-refresh displays. Use busy loop when available.
         try:
             ms = clock.tick_busy_loop(144)
         except Exception:
             ms = clock.tick(144)
+        frame_profiler.begin_frame()
+        screen = frame_profiler.target(display)
         dt = ms / 1000.0
         # clamp dt to avoid huge steps
         if dt > 0.1:
@@ -1629,6 +1920,9 @@ def run_loop(screen, clock, assets):
                 achievement_queue.pop(0)
                 if achievement_queue:
                     achievement_display_timer = 3.0
+        if len(achievement_queue) > 1:
+            # have the next toasts ready before they're shown
+            popup_renderer.precompose(achievement_queue, small_font)
 
         # NEW: Update daily reward display
         if daily_reward_timer > 0:
@@ -1763,43 +2057,39 @@ def run_loop(screen, clock, assets):
 
             if current_minigame == "target_practice":
                 # Spawn random targets
-                if len(minigame_targets) < 5 and random.random() < 2 * dt:
-                    target = {
-                        "x": random.randint(150, SCREEN_SIZE[0] - 150),
-                        "y": random.randint(150, SCREEN_SIZE[1] - 150),
-                        "radius": random.randint(15, 35),
-                        "life": random.uniform(1.5, 3.0),
-                        "color": (
-                            random.randint(100, 255),
-                            random.randint(100, 255),
-                            random.randint(50, 150),
+                if len(minigame_targets) < 5 and rng.minigames.random() < 2 * dt:
+                    minigame_targets.spawn(
+                        rng.minigames.randint(150, SCREEN_SIZE[0] - 150),
+                        rng.minigames.randint(150, SCREEN_SIZE[1] - 150),
+                        rng.minigames.randint(15, 35),
+                        life=rng.minigames.uniform(1.5, 3.0),
+                        color=(
+                            rng.minigames.randint(100, 255),
+                            rng.minigames.randint(100, 255),
+                            rng.minigames.randint(50, 150),
                         ),
-                    }
-                    minigame_targets.append(target)
+                    )
 
                 # Update targets
-                for target in minigame_targets[:]:
-                    target["life"] -= dt
-                    if target["life"] <= 0:
-                        minigame_targets.remove(target)
+                for target in minigame_targets:
+                    target.life -= dt
+                minigame_targets.retain(lambda t: t.life > 0)
 
             elif current_minigame == "golden_rush":
                 # Spawn falling gold coins
-                if len(minigame_targets) < 8 and random.random() < 3 * dt:
-                    coin = {
-                        "x": random.randint(100, SCREEN_SIZE[0] - 100),
-                        "y": -20,
-                        "vy": random.uniform(100, 200),
-                        "radius": 15,
-                        "value": random.randint(1, 5),
-                    }
-                    minigame_targets.append(coin)
+                if len(minigame_targets) < 8 and rng.minigames.random() < 3 * dt:
+                    minigame_targets.spawn(
+                        rng.minigames.randint(100, SCREEN_SIZE[0] - 100),
+                        -20,
+                        15,
+                        vy=rng.minigames.uniform(100, 200),
+                        value=rng.minigames.randint(1, 5),
+                    )
 
                 # Update coins
-                for coin in minigame_targets[:]:
-                    coin["y"] += coin["vy"] * dt
-                    if coin["y"] > SCREEN_SIZE[1] + 20:
-                        minigame_targets.remove(coin)
+                for coin in minigame_targets:
+                    coin.y += coin.vy * dt
+                minigame_targets.retain(lambda c: c.y <= SCREEN_SIZE[1] + 20)
 
             # Check if minigame ended
             if minigame_timer <= 0:
@@ -1853,7 +2143,7 @@ def run_loop(screen, clock, assets):
                     notifications, f"Mini-game over! +${int(reward)}", (100, 255, 100)
                 )
                 current_minigame = None
-                minigame_targets = []
+                minigame_targets.clear()
 
         # === UPDATE MINIGAME RESULT DISPLAY ===
         if minigame_result_timer > 0:
@@ -1921,99 +2211,45 @@ def run_loop(screen, clock, assets):
         # === UPDATE STATISTICS ===
         stats_data["total_playtime"] = stats_data.get("total_playtime", 0) + dt
 
-        # Check playtime achievements
-        if stats_data["total_playtime"] >= 3600 and not achievements.get(
-            "playtime_1h", {}
-        ).get("unlocked", False):
-            reward = check_achievement(
-                achievements,
-                achievement_defs,
-                "playtime_1h",
-                achievement_queue,
-                notifications,
-                money,
-            )
-            money += reward
-        if stats_data["total_playtime"] >= 36000 and not achievements.get(
-            "playtime_10h", {}
-        ).get("unlocked", False):
-            reward = check_achievement(
-                achievements,
-                achievement_defs,
-                "playtime_10h",
-                achievement_queue,
-                notifications,
-                money,
-            )
-            money += reward
-
         # Update particle physics before rendering so visuals reflect current state
+        frame_profiler.mark("update")
+        particle_governor.observe_frame(dt)
         update_particles(particles, dt)
+        frame_profiler.mark("particles.update")
 
         # En yüksek para miktarını güncelley
         if money > highest_money:
             highest_money = money
 
-        # NEW: Check money achievements
-        if money >= 1000 and not achievements.get("money_1k", {}).get(
-            "unlocked", False
-        ):
-            reward = check_achievement(
-                achievements,
-                achievement_defs,
-                "money_1k",
-                achievement_queue,
-                notifications,
-                money,
-            )
-            money += reward
-        if money >= 10000 and not achievements.get("money_10k", {}).get(
-            "unlocked", False
-        ):
-            reward = check_achievement(
-                achievements,
-                achievement_defs,
-                "money_10k",
-                achievement_queue,
-                notifications,
-                money,
-            )
-            money += reward
-        if money >= 100000 and not achievements.get("money_100k", {}).get(
-            "unlocked", False
-        ):
-            reward = check_achievement(
-                achievements,
-                achievement_defs,
-                "money_100k",
-                achievement_queue,
-                notifications,
-                money,
-            )
-            money += reward
-        if money >= 1000000 and not achievements.get("money_1m", {}).get(
-            "unlocked", False
-        ):
-            reward = check_achievement(
-                achievements,
+        # Threshold achievements: everything crossed since last frame unlocks
+        # in one batch (rewards can cross more money thresholds)
+        ach_values = {
+            "money": money,
+            "total_clicks": total_clicks,
+            "combo_count": combo_count,
+            "total_playtime": stats_data["total_playtime"],
+            "critical_hit_count": critical_hit_count,
+            "special_collected_count": special_collected_count,
+        }
+        ach_unlocked, ach_reward = achievement_engine.evaluate(ach_values)
+        if ach_unlocked:
+            money += ach_reward
+            queue_achievements(
                 achievement_defs,
-                "money_1m",
+                ach_unlocked,
+                ach_reward,
                 achievement_queue,
                 notifications,
-                money,
             )
-            money += reward
 
-        # draw cached gradient background for nicer visuals
-        # Use a slightly larger size to prevent black edges during screen shake
-        bg_width = SCREEN_SIZE[0] + 60
-        bg_height = SCREEN_SIZE[1] + 60
-        bg = _get_bg_gradient((bg_width, bg_height))
+        # Camera offset for this frame. Shake moves the world layer (background,
+        # grass, specials, particles, damage numbers); the HUD stays put.
+        camera = (int(screen_offset[0]), int(screen_offset[1]))
 
-        # Center the background relative to the screen, then apply shake offset
-        bg_x = -30 + int(screen_offset[0])
-        bg_y = -30 + int(screen_offset[1])
-        screen.blit(bg, (bg_x, bg_y))
+        frame_profiler.mark("update")
+        # cached gradient background; same one-screen copy whether shaking or not
+        draw_background(screen, camera)
+        frame_profiler.mark("background")
 
         # İstatistik paneli çizimi - Enhanced
         draw_panel(
@@ -2035,74 +2271,43 @@ def run_loop(screen, clock, assets):
             draw_shadow=False,
         )
 
-        # AFK Gelir butonu çizimi
-        padding = 8  # Daha az padding
+        # Sağ buton sütunu: label'lar değişmedikçe yeniden ölçülmez
         afk_text = f"AFK Income +0.5 (${int(afk_upgrade_cost)})"
-        afk_button_text_rect = (
-            small_font.get_rect(afk_text) if hasattr(small_font, "get_rect") else None
-        )
-        afk_text_surf = small_font.render(afk_text, True, TEXT_COLOR)
-        afk_text_rect = afk_text_surf.get_rect()
-        button_width = afk_text_rect.width + 2 * padding
-        button_height = afk_text_rect.height + 2 * padding
-        afk_button_rect = pygame.Rect(0, 0, button_width, button_height)
-        afk_button_rect.topright = (SCREEN_SIZE[0] - 20, 20)
-
-        deneme_text_surf = extra_small_font.render("Test", True, TEXT_COLOR)
-        deneme_text_rect = deneme_text_surf.get_rect()
-        button_width = deneme_text_rect.width + 2 * padding
-        button_height = deneme_text_rect.height + 2 * padding
-        deneme_button_rect = pygame.Rect(0, 0, button_width, button_height)
-        deneme_button_rect.topright = (
-            SCREEN_SIZE[0] - 20,
-            wipe_button_rect.top - 38,
-        )  # Daha az boşluk
-        deneme_text_rect.center = deneme_button_rect.center
-
         multiplier_text = (
             f"Click Power x{multiplier + 0.5} (${int(multiplier_upgrade_cost)})"
         )
-        multiplier_text_surf = small_font.render(multiplier_text, True, TEXT_COLOR)
-        multiplier_text_rect = multiplier_text_surf.get_rect()
-        button_width = multiplier_text_rect.width + 2 * padding
-        button_height = multiplier_text_rect.height + 2 * padding
-        multiplier_button_rect = pygame.Rect(0, 0, button_width, button_height)
-        multiplier_button_rect.topright = (
-            SCREEN_SIZE[0] - 20,
-            afk_button_rect.bottom + 8,
-        )  # Daha az boşluk
-        multiplier_text_rect.center = multiplier_button_rect.center
-
         save_text = "Save Game"
-        save_text_surf = small_font.render(save_text, True, TEXT_COLOR)
-        save_text_rect = save_text_surf.get_rect()
-        button_width = save_text_rect.width + 2 * padding
-        button_height = save_text_rect.height + 2 * padding
-        save_button_rect = pygame.Rect(0, 0, button_width, button_height)
-        save_button_rect.topright = (
-            SCREEN_SIZE[0] - 20,
-            multiplier_button_rect.bottom + 8,
-        )  # Daha az boşluk
-        save_text_rect.center = save_button_rect.center
-
         stats_text = "Statistics"
-        stats_text_surf = small_font.render(stats_text, True, TEXT_COLOR)
-        stats_text_rect = stats_text_surf.get_rect()
-        button_width = stats_text_rect.width + 2 * padding
-        button_height = stats_text_rect.height + 2 * padding
-        stats_button_rect = pygame.Rect(0, 0, button_width, button_height)
-        stats_button_rect.topright = (
+        shop_text = "Grass Shop"
+        skills_text = f"Skills ({skill_points} SP)"
+        wheel_text = "Lucky Wheel"
+        column_rects = layout_button_column(
+            "right",
+            (
+                ("afk", afk_text, small_font),
+                ("mult", multiplier_text, small_font),
+                ("save", save_text, small_font),
+                ("stats", stats_text, small_font),
+                ("shop", shop_text, small_font),
+                ("skills", skills_text, small_font),
+                ("wheel", wheel_text, small_font),
+            ),
             SCREEN_SIZE[0] - 20,
-            save_button_rect.bottom + 8,
-        )  # Daha az boşluk
-        stats_text_rect.center = stats_button_rect.center
+            20,
+        )
+        afk_button_rect = column_rects["afk"]
+        multiplier_button_rect = column_rects["mult"]
+        save_button_rect = column_rects["save"]
+        stats_button_rect = column_rects["stats"]
+        shop_button_rect = column_rects["shop"]
+        skills_button_rect = column_rects["skills"]
+        wheel_button_rect = column_rects["wheel"]
 
         weather_timer += dt
         if weather_timer >= 50:  # 50 sn bekle
-            _safe_set_volume(weather_change_effect, 0.0696705)
-            _safe_play(weather_change_effect)
+            voices.play("weather")
             weather_timer = 0
-            random_weather_change = random.randint(0, 7)
+            random_weather_change = rng.weather.randint(0, 7)
             if (
                 random_weather_change == 3
                 or random_weather_change == 4
@@ -2125,18 +2330,8 @@ def run_loop(screen, clock, assets):
             ):
                 weather_index = 0
                 weather_multiplier = 1.0
-
-        shop_text = "Grass Shop"
-        shop_text_surf = small_font.render(shop_text, True, TEXT_COLOR)
-        shop_text_rect = shop_text_surf.get_rect()
-        button_width = shop_text_rect.width + 2 * padding
-        button_height = shop_text_rect.height + 2 * padding
-        shop_button_rect = pygame.Rect(0, 0, button_width, button_height)
-        shop_button_rect.topright = (
-            SCREEN_SIZE[0] - 20,
-            stats_button_rect.bottom + 8,
-        )  # Daha az boşluk
-        shop_text_rect.center = shop_button_rect.center
+            if tracer.ENABLED:
+                tracer.instant("weather", index=weather_index)
 
         # Draw AFK button
         draw_button(
@@ -2201,17 +2396,6 @@ def run_loop(screen, clock, assets):
         # === NEW BUTTONS FOR ENHANCED SYSTEMS ===
 
         # Skill Tree button
-        skills_text = f"Skills ({skill_points} SP)"
-        skills_text_surf = small_font.render(skills_text, True, TEXT_COLOR)
-        skills_text_rect = skills_text_surf.get_rect()
-        button_width = skills_text_rect.width + 2 * padding
-        button_height = skills_text_rect.height + 2 * padding
-        skills_button_rect = pygame.Rect(0, 0, button_width, button_height)
-        skills_button_rect.topright = (
-            SCREEN_SIZE[0] - 20,
-            shop_button_rect.bottom + 8,
-        )
-
         draw_button(
             screen,
             skills_button_rect,
@@ -2224,17 +2408,6 @@ def run_loop(screen, clock, assets):
         )
 
         # Lucky Wheel button
-        wheel_text = "Lucky Wheel"
-        wheel_text_surf = small_font.render(wheel_text, True, TEXT_COLOR)
-        wheel_text_rect = wheel_text_surf.get_rect()
-        button_width = wheel_text_rect.width + 2 * padding
-        button_height = wheel_text_rect.height + 2 * padding
-        wheel_button_rect = pygame.Rect(0, 0, button_width, button_height)
-        wheel_button_rect.topright = (
-            SCREEN_SIZE[0] - 20,
-            skills_button_rect.bottom + 8,
-        )
-
         draw_button(
             screen,
             wheel_button_rect,
@@ -2248,20 +2421,12 @@ def run_loop(screen, clock, assets):
 
         # Prestige button (if can prestige - money >= 100k)
         if money >= 100000:
-            prestige_text = "PRESTIGE"
-            prestige_text_surf = extra_small_font.render(
-                prestige_text, True, TEXT_COLOR
-            )
-            prestige_text_rect = prestige_text_surf.get_rect()
-            prestige_button_rect = pygame.Rect(0, 0, 80, 25)
-            prestige_button_rect.bottomleft = (10, SCREEN_SIZE[1] - 45)
-
             draw_button(
                 screen,
                 prestige_button_rect,
                 (210, 180, 60),  # Gold
                 BUTTON_BORDER_COLOR,
-                prestige_text,
+                "PRESTIGE",
                 extra_small_font,
                 dt,
                 effect_name="prestige",
@@ -2270,10 +2435,6 @@ def run_loop(screen, clock, assets):
         weather_surface = pygame.Surface((100, 30))
 
         # Wipe Save butonu çizimi
-        wipe_button_text = extra_small_font.render("Wipe Save", True, TEXT_COLOR)
-        wipe_text_rect = wipe_button_text.get_rect()
-        wipe_text_rect.center = wipe_button_rect.center
-
         draw_button(
             screen,
             wipe_button_rect,
@@ -2304,39 +2465,57 @@ def run_loop(screen, clock, assets):
         )
         rotated_img = pygame.transform.rotate(scaled_img, rotation_angle)
         grass_rect = rotated_img.get_rect(center=(CENTER[0], CENTER[1] + int(bob)))
+        # where the grass is drawn this frame; grass_rect stays in world space
+        grass_draw_rect = grass_rect.move(camera)
 
         sound_button = sound_image.get_rect(topleft=(SCREEN_SIZE[0] - 130, 560))
         # sound button rect
 
+        # Sync widget rects; the grid is only touched for rects that moved
+        ui.set_rect("afk", afk_button_rect)
+        ui.set_rect("mult", multiplier_button_rect)
+        ui.set_rect("save", save_button_rect)
+        ui.set_rect("stats_btn", stats_button_rect)
+        ui.set_rect("shop_btn", shop_button_rect)
+        ui.set_rect("skills_btn", skills_button_rect)
+        ui.set_rect("wheel_btn", wheel_button_rect)
+        ui.set_rect("prestige", prestige_button_rect)
+        ui.set_visible("prestige", money >= 100000)
+        ui.set_rect("grass", grass_draw_rect)
+        ui.set_rect("sound", sound_button)
+        _sync_overlays()
+
         # === İMLEÇ KONTROLÜ ===
-        mouse_pos = pygame.mouse.get_pos()
-        if (
-            afk_button_rect.collidepoint(mouse_pos)
-            or multiplier_button_rect.collidepoint(mouse_pos)
-            or save_button_rect.collidepoint(mouse_pos)
-            or stats_button_rect.collidepoint(mouse_pos)
-            or shop_button_rect.collidepoint(mouse_pos)
-            or skills_button_rect.collidepoint(mouse_pos)
-            or wheel_button_rect.collidepoint(mouse_pos)
-            or (money >= 100000 and prestige_button_rect.collidepoint(mouse_pos))
-            or wipe_button_rect.collidepoint(mouse_pos)
-            or grass_rect.collidepoint(mouse_pos)
-            or sound_button.collidepoint(mouse_pos)
-        ):
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)  # El işareti
+        if replay.ENABLED:
+            mouse_pos = replay.mouse_pos()
+        else:
+            mouse_pos = pygame.mouse.get_pos()
+        hovered = ui.get(ui.hit_test(mouse_pos))
+        if hovered is not None and hovered.clickable:
+            wanted_cursor = pygame.SYSTEM_CURSOR_HAND  # El işareti
         else:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)  # Normal ok
+            wanted_cursor = pygame.SYSTEM_CURSOR_ARROW  # Normal ok
+        if wanted_cursor != current_cursor:
+            current_cursor = wanted_cursor
+            try:
+                pygame.mouse.set_cursor(wanted_cursor)
+            except pygame.error:
+                # No system cursors (e.g. SDL dummy video driver)
+                pass
 
+        frame_profiler.mark("hud")
         # Resmi ekrana çiz
-        screen.blit(rotated_img, grass_rect.topleft)
+        screen.blit(rotated_img, grass_draw_rect.topleft)
         # draw sound icon
         screen.blit(sound_image, (SCREEN_SIZE[0] - 130, 560))
+        frame_profiler.mark("world")
 
         # draw particles behind UI
-        draw_particles(screen, particles)
+        draw_particles(screen, particles, camera)
 
         # NEW: Draw damage numbers
-        draw_damage_numbers(screen, damage_numbers, small_font)
+        draw_damage_numbers(screen, damage_numbers, small_font, camera)
+        frame_profiler.mark("particles.draw")
 
         # NEW: Draw combo meter (above grass)
         if combo_count > 0:
@@ -2364,39 +2543,14 @@ def run_loop(screen, clock, assets):
 
         # NEW: Draw daily reward popup (smaller, at top)
         if daily_reward_timer > 0:
-            alpha = int(255 * min(1.0, daily_reward_timer / 0.5))
-            reward_surf = pygame.Surface((300, 100), pygame.SRCALPHA)
-            pygame.draw.rect(
-                reward_surf,
-                (40, 100, 40, alpha),
-                reward_surf.get_rect(),
-                border_radius=8,
-            )
-            pygame.draw.rect(
-                reward_surf,
-                (100, 255, 100, alpha),
-                reward_surf.get_rect(),
-                2,
-                border_radius=8,
-            )
-
-            title = small_font.render("Daily Reward!", True, (255, 255, 100))
-            title.set_alpha(alpha)
-            streak_text = small_font.render(
-                f"Streak: {login_streak} days", True, (255, 255, 255)
-            )
-            streak_text.set_alpha(alpha)
-            reward_text = small_font.render(
-                f"+${int(daily_reward_amount)}", True, (100, 255, 100)
+            popup_renderer.draw(
+                screen,
+                popup_renderer.daily_reward(
+                    login_streak, daily_reward_amount, small_font
+                ),
+                (SCREEN_SIZE[0] // 2 - 150, 50),  # top-center instead of center
+                fade_alpha(daily_reward_timer),
             )
-            reward_text.set_alpha(alpha)
-
-            reward_surf.blit(title, (150 - title.get_width() // 2, 15))
-            reward_surf.blit(streak_text, (150 - streak_text.get_width() // 2, 45))
-            reward_surf.blit(reward_text, (150 - reward_text.get_width() // 2, 70))
-
-            # Position at top-center instead of center
-            screen.blit(reward_surf, (SCREEN_SIZE[0] // 2 - 150, 50))
 
         # NEW: Draw save indicator
         if save_indicator_timer > 0:
@@ -2410,6 +2564,16 @@ def run_loop(screen, clock, assets):
             fps = int(clock.get_fps())
             fps_text = extra_small_font.render(f"FPS: {fps}", True, (255, 255, 255))
             screen.blit(fps_text, (SCREEN_SIZE[0] - 70, SCREEN_SIZE[1] - 25))
+            pstats = particle_governor.stats()
+            particle_text = extra_small_font.render(
+                f"P: {pstats['active']} +{pstats['spawned']} -{pstats['culled']}",
+                True,
+                (255, 255, 255),
+            )
+            screen.blit(
+                particle_text,
+                (SCREEN_SIZE[0] - 10 - particle_text.get_width(), SCREEN_SIZE[1] - 45),
+            )
 
         # NEW: Draw active power-ups indicator
         if active_powerups:
@@ -2525,41 +2689,11 @@ def run_loop(screen, clock, assets):
 
         # === OFFLINE PROGRESS POPUP ===
         if offline_progress_timer > 0 and offline_earnings > 0:
-            alpha = int(255 * min(1.0, offline_progress_timer / 0.5))
-            offline_surf = pygame.Surface((320, 120), pygame.SRCALPHA)
-            pygame.draw.rect(
-                offline_surf,
-                (40, 60, 100, alpha),
-                offline_surf.get_rect(),
-                border_radius=10,
-            )
-            pygame.draw.rect(
-                offline_surf,
-                (100, 150, 255, alpha),
-                offline_surf.get_rect(),
-                3,
-                border_radius=10,
-            )
-
-            offline_title = medium_font.render("Welcome Back!", True, (255, 255, 100))
-            offline_title.set_alpha(alpha)
-            offline_msg = small_font.render(
-                "While you were away...", True, (200, 200, 255)
-            )
-            offline_msg.set_alpha(alpha)
-            offline_amount = medium_font.render(
-                f"+${int(offline_earnings)}", True, (100, 255, 100)
-            )
-            offline_amount.set_alpha(alpha)
-
-            offline_surf.blit(offline_title, (160 - offline_title.get_width() // 2, 15))
-            offline_surf.blit(offline_msg, (160 - offline_msg.get_width() // 2, 50))
-            offline_surf.blit(
-                offline_amount, (160 - offline_amount.get_width() // 2, 80)
-            )
-
-            screen.blit(
-                offline_surf, (SCREEN_SIZE[0] // 2 - 160, SCREEN_SIZE[1] // 2 - 60)
+            popup_renderer.draw(
+                screen,
+                popup_renderer.offline(offline_earnings, small_font, medium_font),
+                (SCREEN_SIZE[0] // 2 - 160, SCREEN_SIZE[1] // 2 - 60),
+                fade_alpha(offline_progress_timer),
             )
 
         # === MINIGAME OVERLAY ===
@@ -2598,18 +2732,18 @@ def run_loop(screen, clock, assets):
             # Draw targets for target practice
             if current_minigame == "target_practice":
                 for target in minigame_targets:
-                    alpha = int(255 * min(1.0, target["life"] / 0.5))
+                    alpha = int(255 * min(1.0, target.life / 0.5))
                     pygame.draw.circle(
                         screen,
-                        target["color"],
-                        (int(target["x"]), int(target["y"])),
-                        target["radius"],
+                        target.color,
+                        (int(target.x), int(target.y)),
+                        target.radius,
                     )
                     pygame.draw.circle(
                         screen,
                         (255, 255, 255),
-                        (int(target["x"]), int(target["y"])),
-                        target["radius"],
+                        (int(target.x), int(target.y)),
+                        target.radius,
                         2,
                     )
 
@@ -2619,20 +2753,20 @@ def run_loop(screen, clock, assets):
                     pygame.draw.circle(
                         screen,
                         (255, 215, 0),
-                        (int(coin["x"]), int(coin["y"])),
-                        coin["radius"],
+                        (int(coin.x), int(coin.y)),
+                        coin.radius,
                     )
                     pygame.draw.circle(
                         screen,
                         (200, 170, 0),
-                        (int(coin["x"]), int(coin["y"])),
-                        coin["radius"],
+                        (int(coin.x), int(coin.y)),
+                        coin.radius,
                         2,
                     )
                     value_text = extra_small_font.render(
-                        f"+{coin['value']}", True, (255, 255, 255)
+                        f"+{coin.value}", True, (255, 255, 255)
                     )
-                    screen.blit(value_text, (coin["x"] - 10, coin["y"] - 8))
+                    screen.blit(value_text, (coin.x - 10, coin.y - 8))
 
             # Instructions
             if current_minigame == "click_frenzy":
@@ -2684,42 +2818,17 @@ def run_loop(screen, clock, assets):
                 result_surf, (SCREEN_SIZE[0] // 2 - 150, SCREEN_SIZE[1] // 2 - 75)
             )
 
+        frame_profiler.mark("hud")
         # Draw and update specials (behind UI but above grass)
         # Use vertical bobbing, horizontal sway and subtle rotation for livelier visuals
-        now_specials = []
+        special_renderer.animate(specials, anim_time)
+        special_renderer.draw(screen, specials, camera)
         for s in specials:
-            # vertical bobbing
-            v_amp = s.get("osc_amp", 0.0)
-            v_speed = s.get("osc_speed", 1.0)
-            v_phase = s.get("osc_phase", 0.0)
-            bob = math.sin(anim_time * v_speed + v_phase) * v_amp
-            # horizontal sway
-            sway_amp = s.get("sway_amp", 0.0)
-            sway_speed = s.get("sway_speed", 1.0)
-            sway_phase = s.get("sway_phase", 0.0)
-            sway = math.sin(anim_time * sway_speed + sway_phase) * sway_amp
-            # rotation (degrees) that oscillates left-right
-            rot_amp = s.get("rot_amp", 0.0)
-            rot_speed = s.get("rot_speed", 1.0)
-            rot_phase = s.get("rot_phase", 0.0)
-            angle = math.sin(anim_time * rot_speed + rot_phase) * rot_amp
-
-            surf = s.get("surf")
-            cx = int(s["pos"][0] + sway)
-            cy = int(s["pos"][1] + bob)
-            if surf:
-                # rotate the sprite around its center
-                rotated = pygame.transform.rotate(surf, angle)
-                rect = rotated.get_rect(center=(cx, cy))
-                screen.blit(rotated, rect.topleft)
-            else:
-                # fallback: draw a small gold circle whose radius reflects click area
-                pygame.draw.circle(
-                    screen, (240, 200, 64), (cx, cy), max(6, s.get("click_radius", 10))
-                )
-            if s.get("life", 0.0) > 0:
-                now_specials.append(s)
-        specials = now_specials
+            # hit-testing uses this same drawn position
+            r = s.click_radius
+            cx = s.draw_pos[0] + camera[0]
+            cy = s.draw_pos[1] + camera[1]
+            ui.set_rect(s.node, (cx - r, cy - r, 2 * r, 2 * r))
 
         # draw save message if any
         if save_msg_timer > 0:
@@ -2731,8 +2840,23 @@ def run_loop(screen, clock, assets):
                 (SCREEN_SIZE[0] // 2 - save_msg_surf.get_width() // 2, 10),
             )
 
+        frame_profiler.mark("world")
         # Kullanıcı girişlerini kontrol et
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if replay.ENABLED:
+            events = replay.frame_events(events)
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == PROFILER_HOTKEY:
+                frame_profiler.toggle()
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                # dump the last few seconds of trace events (TTG_TRACE=1)
+                tracer.dump("manual")
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                # surface/cache/heap report (TTG_MEMTRACK=1)
+                memory_tracker.dump("manual")
+                continue
             if event.type == pygame.QUIT:
                 # Çıkış yapmadan önce oyunu kaydet - TÜM VERİLERİ KAYDET
                 save_game_data(
@@ -2760,24 +2884,16 @@ def run_loop(screen, clock, assets):
                 )
                 running = False
             if event.type == pygame.MOUSEBUTTONDOWN:
+                # Topmost widget under the cursor; overlays shadow everything below
+                _sync_overlays()
+                hit = ui.hit_test(event.pos)
+
                 # Check specials first (click to collect)
-                # iterate copy because we may modify list
-                for si, s in list(enumerate(specials)):
-                    # account for bobbing and sway when checking click hit
-                    v_amp = s.get("osc_amp", 0.0)
-                    v_speed = s.get("osc_speed", 1.0)
-                    v_phase = s.get("osc_phase", 0.0)
-                    bob = math.sin(anim_time * v_speed + v_phase) * v_amp
-                    sway_amp = s.get("sway_amp", 0.0)
-                    sway_speed = s.get("sway_speed", 1.0)
-                    sway_phase = s.get("sway_phase", 0.0)
-                    sway = math.sin(anim_time * sway_speed + sway_phase) * sway_amp
-                    sx = s.get("pos", (0, 0))[0] + sway
-                    sy = s.get("pos", (0, 0))[1] + bob
-                    r = s.get("click_radius", 14)
-                    if (event.pos[0] - sx) ** 2 + (event.pos[1] - sy) ** 2 <= r * r:
+                for s in specials:
+                    if s.node == hit:
+                        sx, sy = s.draw_pos
                         # collect
-                        val = s.get("value", 1000)
+                        val = s.value
                         money += val
                         special_collected_count += 1
 
@@ -2794,44 +2910,26 @@ def run_loop(screen, clock, assets):
                                 money,
                             )
                             money += reward
-                        if special_collected_count >= 10 and not achievements.get(
-                            "special_10", {}
-                        ).get("unlocked", False):
-                            reward = check_achievement(
-                                achievements,
-                                achievement_defs,
-                                "special_10",
-                                achievement_queue,
-                                notifications,
-                                money,
-                            )
-                            money += reward
 
                         # spawn particles and sound feedback
                         spawn_particles(particles, (sx, sy), (255, 215, 80), count=20)
                         spawn_damage_number(
-                            damage_numbers, (sx, sy), val, (255, 215, 0)
+                            damage_numbers,
+                            (sx, sy),
+                            val,
+                            (255, 215, 0),
+                            settings.get("coalesce_damage_numbers", False),
                         )
-                        try:
-                            _safe_play(buy_effect)
-                        except Exception:
-                            pass
+                        voices.play("buy")
                         # remove special
-                        try:
-                            specials.pop(si)
-                        except Exception:
-                            pass
+                        ui.remove(hit)
+                        specials.remove(s)
                         # stop further click handling for this event
                         break
-                if afk_button_rect.collidepoint(event.pos):
+                if hit == "afk":
                     if money >= afk_upgrade_cost:
                         if current_sound_state == "on":
-                            if buy_effect:
-                                try:
-                                    _safe_set_volume(buy_effect, 0.0896705)
-                                    _safe_play(buy_effect)
-                                except Exception:
-                                    pass
+                            voices.play("buy")
                         # press animation + particles
                         button_states.setdefault("afk", {"hover": 0.0, "press": 0.0})[
                             "press"
@@ -2862,7 +2960,7 @@ def run_loop(screen, clock, assets):
                             auto_income += 0.5 * multiplier * current_grass_index * 1.5
                             afk_upgrade_cost *= 1.2
 
-                elif sound_button.collidepoint(event.pos):
+                elif hit == "sound":
                     if current_sound_state == "on":
                         # Müziği duraklat
                         try:
@@ -2870,21 +2968,7 @@ def run_loop(screen, clock, assets):
                         except Exception:
                             pass
                         # Tüm efekt seslerini kapat
-                        if click_effect:
-                            try:
-                                _safe_set_volume(click_effect, 0)
-                            except Exception:
-                                pass
-                        if weather_change_effect:
-                            try:
-                                _safe_set_volume(weather_change_effect, 0)
-                            except Exception:
-                                pass
-                        if buy_effect:
-                            try:
-                                _safe_set_volume(buy_effect, 0)
-                            except Exception:
-                                pass
+                        voices.set_muted(True)
                         current_sound_state = "off"
                         sound_image = sound_off_image
                         screen.blit(sound_image, (SCREEN_SIZE[0] - 130, 560))
@@ -2896,36 +2980,17 @@ def run_loop(screen, clock, assets):
                         except Exception:
                             pass
                         # Tüm efekt seslerini aç
-                        if click_effect:
-                            try:
-                                _safe_set_volume(click_effect, 0.0896705)
-                            except Exception:
-                                pass
-                        if weather_change_effect:
-                            try:
-                                _safe_set_volume(weather_change_effect, 0.0696705)
-                            except Exception:
-                                pass
-                        if buy_effect:
-                            try:
-                                _safe_set_volume(buy_effect, 0.0896705)
-                            except Exception:
-                                pass
+                        voices.set_muted(False)
                         current_sound_state = "on"
                         sound_image = sound_on_image
                         screen.blit(sound_image, (SCREEN_SIZE[0] - 130, 560))
 
                 # end sound/multiplier/save handling
 
-                elif multiplier_button_rect.collidepoint(event.pos):
+                elif hit == "mult":
                     if money >= multiplier_upgrade_cost:
                         if current_sound_state == "on":
-                            if buy_effect:
-                                try:
-                                    _safe_set_volume(buy_effect, 0.0896705)
-                                    _safe_play(buy_effect)
-                                except Exception:
-                                    pass
+                            voices.play("buy")
                         # press animation + particles
                         button_states.setdefault("mult", {"hover": 0.0, "press": 0.0})[
                             "press"
@@ -2974,210 +3039,123 @@ def run_loop(screen, clock, assets):
                 # === OVERLAY HANDLING ===
                 # Check active overlays first to prevent clicking through them
                 if show_stats:
-                    # Check Close button on Stats
-                    # Recompute rects as in drawing code
-                    stats_surface_rect = pygame.Rect(0, 0, 500, 400)
-                    stats_surface_rect.center = (
-                        SCREEN_SIZE[0] // 2,
-                        SCREEN_SIZE[1] // 2,
-                    )
-
-                    close_rect = pygame.Rect(
-                        stats_surface_rect.width // 2 - 50,
-                        stats_surface_rect.height - 50,
-                        100,
-                        40,
-                    )
-                    # Adjust to screen coordinates
-                    close_rect.x += stats_surface_rect.x
-                    close_rect.y += stats_surface_rect.y
-
-                    if close_rect.collidepoint(event.pos):
+                    if hit == "stats.close":
                         show_stats = False
-                        _safe_set_volume(click_effect, 0.0896705)
-                        _safe_play(click_effect)
+                        voices.play("ui")
 
                 elif show_shop:
-                    # Recompute Shop Rects
-                    shop_surface_rect = pygame.Rect(0, 0, 500, 605)
-                    shop_surface_rect.center = (
-                        SCREEN_SIZE[0] // 2,
-                        SCREEN_SIZE[1] // 2,
-                    )
-
-                    close_rect = pygame.Rect(
-                        shop_surface_rect.width // 2 - 50,
-                        shop_surface_rect.height - 50,
-                        100,
-                        40,
-                    )
-                    close_rect.x += shop_surface_rect.x
-                    close_rect.y += shop_surface_rect.y
-
-                    if close_rect.collidepoint(event.pos):
+                    if hit == "shop.close":
                         show_shop = False
-                        _safe_set_volume(click_effect, 0.0896705)
-                        _safe_play(click_effect)
-                    else:
-                        # Check Shop Items
-                        y_pos = 80 + shop_surface_rect.y
-                        item_height = 70
-                        for i, (name, cost) in enumerate(zip(grass_names, grass_costs)):
-                            # Calculate button rect in screen coordinates
-                            # Item rect relative to shop surface is (50, y_pos_local, 400, item_height)
-                            # Button is right aligned in item rect
-                            item_x = shop_surface_rect.x + 50
-
-                            # Button logic from drawing:
-                            # button_rect = pygame.Rect(item_rect.right - 100, item_rect.centery - 20, 80, 40)
-                            # item_rect.right = item_x + 400
-                            # item_rect.centery = y_pos + item_height // 2
-
-                            btn_x = (item_x + 400) - 100
-                            btn_y = (y_pos + item_height // 2) - 20
-                            button_rect = pygame.Rect(btn_x, btn_y, 80, 40)
-
-                            if button_rect.collidepoint(event.pos):
-                                if (
-                                    current_grass_index != i
-                                    and current_grass_index >= i
-                                ):
-                                    current_grass_index = i
-                                    active_grass_img = grass_images[current_grass_index]
-                                    _safe_set_volume(click_effect, 0.0896705)
-                                    _safe_play(click_effect)
-                                elif (
-                                    i > 0 and current_grass_index < i and money >= cost
-                                ):
-                                    old_index = current_grass_index
-                                    money -= cost
-                                    current_grass_index = i
-                                    active_grass_img = grass_images[current_grass_index]
-                                    _safe_set_volume(buy_effect, 0.0896705)
-                                    _safe_play(buy_effect)
-
-                                    # Achievements
-                                    if old_index == 0 and not achievements.get(
-                                        "buy_grass", {}
-                                    ).get("unlocked", False):
-                                        reward = check_achievement(
-                                            achievements,
-                                            achievement_defs,
-                                            "buy_grass",
-                                            achievement_queue,
-                                            notifications,
-                                            money,
-                                        )
-                                        money += reward
-                                    if current_grass_index >= len(
-                                        grass_images
-                                    ) - 1 and not achievements.get("all_grass", {}).get(
-                                        "unlocked", False
-                                    ):
-                                        reward = check_achievement(
-                                            achievements,
-                                            achievement_defs,
-                                            "all_grass",
-                                            achievement_queue,
-                                            notifications,
-                                            money,
-                                        )
-                                        money += reward
-
-                            y_pos += item_height + 10
+                        voices.play("ui")
+                    elif hit is not None and hit.startswith("shop.buy."):
+                        i = int(hit[len("shop.buy.") :])
+                        cost = grass_costs[i]
+                        if current_grass_index != i and current_grass_index >= i:
+                            current_grass_index = i
+                            active_grass_img = grass_images[current_grass_index]
+                            voices.play("ui")
+                        elif i > 0 and current_grass_index < i and money >= cost:
+                            old_index = current_grass_index
+                            money -= cost
+                            current_grass_index = i
+                            active_grass_img = grass_images[current_grass_index]
+                            voices.play("buy")
+
+                            # Achievements
+                            if old_index == 0 and not achievements.get(
+                                "buy_grass", {}
+                            ).get("unlocked", False):
+                                reward = check_achievement(
+                                    achievements,
+                                    achievement_defs,
+                                    "buy_grass",
+                                    achievement_queue,
+                                    notifications,
+                                    money,
+                                )
+                                money += reward
+                            if current_grass_index >= len(
+                                grass_images
+                            ) - 1 and not achievements.get("all_grass", {}).get(
+                                "unlocked", False
+                            ):
+                                reward = check_achievement(
+                                    achievements,
+                                    achievement_defs,
+                                    "all_grass",
+                                    achievement_queue,
+                                    notifications,
+                                    money,
+                                )
+                                money += reward
 
                 # REMOVED: Minigame Menu Logic
                 # elif show_minigame_menu: ...
 
                 elif show_skill_tree:
                     # Skill Tree Clicks
-                    st_rect = pygame.Rect(0, 0, 500, 450)
-                    st_rect.center = (SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
-
-                    y_start = 80 + st_rect.y
-                    x_start = 50 + st_rect.x
-
-                    for i, (sid, sdata) in enumerate(skills.items()):
-                        row = i // 2
-                        col = i % 2
-                        x = x_start + col * 220
-                        y = y_start + row * 90
-                        skill_rect = pygame.Rect(x, y, 200, 80)
-
-                        if skill_rect.collidepoint(event.pos):
-                            # Buy Skill Logic
-                            if (
-                                skill_points >= sdata["cost"]
-                                and not sdata.get("unlocked", False)
-                                and (
-                                    not sdata.get("parent")
-                                    or skills[sdata["parent"]].get("unlocked", False)
-                                )
-                            ):
+                    if hit is not None and hit.startswith("skills."):
+                        sid = hit[len("skills.") :]
+                        sdata = skills[sid]
+                        # Buy Skill Logic
+                        if (
+                            skill_points >= sdata["cost"]
+                            and not sdata.get("unlocked", False)
+                            and (
+                                not sdata.get("parent")
+                                or skills[sdata["parent"]].get("unlocked", False)
+                            )
+                        ):
+
+                            skill_points -= sdata["cost"]
+                            sdata["unlocked"] = True
+                            voices.play("buy")
+                            add_notification(
+                                notifications,
+                                f"Learned {sdata['name']}!",
+                                (50, 255, 50),
+                            )
+
+                            # Apply skill effect immediately
+                            if sdata["type"] == "multiplier":
+                                multiplier += sdata["effect"]
+                            # (Other types handled elsewhere)
 
-                                skill_points -= sdata["cost"]
-                                sdata["unlocked"] = True
-                                _safe_play(buy_effect)
-                                add_notification(
+                            # Skill Achievements
+                            if not achievements.get("skill_first", {}).get(
+                                "unlocked", False
+                            ):
+                                money += check_achievement(
+                                    achievements,
+                                    achievement_defs,
+                                    "skill_first",
+                                    achievement_queue,
                                     notifications,
-                                    f"Learned {sdata['name']}!",
-                                    (50, 255, 50),
+                                    money,
                                 )
 
-                                # Apply skill effect immediately
-                                if sdata["type"] == "multiplier":
-                                    multiplier += sdata["effect"]
-                                # (Other types handled elsewhere)
-
-                                # Skill Achievements
-                                if not achievements.get("skill_first", {}).get(
-                                    "unlocked", False
-                                ):
-                                    money += check_achievement(
-                                        achievements,
-                                        achievement_defs,
-                                        "skill_first",
-                                        achievement_queue,
-                                        notifications,
-                                        money,
-                                    )
-
-                    if not st_rect.collidepoint(event.pos):
+                    if not ui.is_under(hit, "skills"):
                         show_skill_tree = False
 
                 elif show_lucky_wheel:
-                    # Recompute Wheel Rects
-                    wh_rect = pygame.Rect(0, 0, 400, 400)
-                    wh_rect.center = (SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
-
-                    # Spin Button (140, 360, 120, 40) relative to surface
-                    spin_rect = pygame.Rect(140, 360, 120, 40)
-                    spin_rect.x += wh_rect.x
-                    spin_rect.y += wh_rect.y
-
-                    if spin_rect.collidepoint(event.pos):
+                    if hit == "wheel.spin":
                         if not wheel_spinning and free_spins_today > 0:
                             wheel_spinning = True
-                            wheel_speed = random.uniform(600, 900)
+                            wheel_speed = rng.wheel.uniform(600, 900)
                             wheel_result = None
                             free_spins_today -= 1
                             # Update save data for free spins
                             game_data["free_spins_today"] = free_spins_today
                             game_data["last_spin_date"] = today
-                            _safe_play(click_effect)
-                    elif not wh_rect.collidepoint(event.pos):
+                            voices.play("ui")
+                    elif not ui.is_under(hit, "wheel"):
                         # Click outside to close
                         show_lucky_wheel = False
 
                 # === MAIN MENU BUTTONS ===
-                elif save_button_rect.collidepoint(event.pos):
+                elif hit == "save":
                     if current_sound_state == "on":
-                        if click_effect:
-                            try:
-                                _safe_set_volume(click_effect, 0.0896705)
-                            except Exception:
-                                pass
-                        _safe_play(click_effect)
+                        voices.play("ui")
                     # visual feedback
                     button_states.setdefault("save", {"hover": 0.0, "press": 0.0})[
                         "press"
@@ -3212,10 +3190,9 @@ def run_loop(screen, clock, assets):
                     # Non-blocking save confirmation
                     save_msg_timer = 0.9
                     save_msg_text = "Game Saved!"
-                elif stats_button_rect.collidepoint(event.pos):
+                elif hit == "stats_btn":
                     if current_sound_state == "on":
-                        _safe_set_volume(click_effect, 0.0896705)
-                        _safe_play(click_effect)
+                        voices.play("ui")
                     # visual feedback
                     button_states.setdefault("stats", {"hover": 0.0, "press": 0.0})[
                         "press"
@@ -3225,10 +3202,9 @@ def run_loop(screen, clock, assets):
                     )
                     show_stats = not show_stats  # İstatistik ekranını aç/kapat
                     show_shop = False  # Mağaza ekranını kapat
-                elif shop_button_rect.collidepoint(event.pos):
+                elif hit == "shop_btn":
                     if current_sound_state == "on":
-                        _safe_set_volume(click_effect, 0.0896705)
-                        _safe_play(click_effect)
+                        voices.play("ui")
                     # visual feedback
                     button_states.setdefault("shop", {"hover": 0.0, "press": 0.0})[
                         "press"
@@ -3244,10 +3220,9 @@ def run_loop(screen, clock, assets):
                 # REMOVED: Minigame Button Handler
                 # elif minigame_button_rect.collidepoint(event.pos): ...
 
-                elif skills_button_rect.collidepoint(event.pos):
+                elif hit == "skills_btn":
                     if current_sound_state == "on":
-                        _safe_set_volume(click_effect, 0.0896705)
-                        _safe_play(click_effect)
+                        voices.play("ui")
                     button_states.setdefault("skills", {"hover": 0.0, "press": 0.0})[
                         "press"
                     ] = 1.0
@@ -3258,10 +3233,9 @@ def run_loop(screen, clock, assets):
                     show_minigame_menu = False
                     show_lucky_wheel = False
 
-                elif wheel_button_rect.collidepoint(event.pos):
+                elif hit == "wheel_btn":
                     if current_sound_state == "on":
-                        _safe_set_volume(click_effect, 0.0896705)
-                        _safe_play(click_effect)
+                        voices.play("ui")
                     button_states.setdefault("wheel", {"hover": 0.0, "press": 0.0})[
                         "press"
                     ] = 1.0
@@ -3274,11 +3248,10 @@ def run_loop(screen, clock, assets):
                     show_shop = False
                     show_stats = False
 
-                elif money >= 100000 and prestige_button_rect.collidepoint(event.pos):
+                elif money >= 100000 and hit == "prestige":
                     # (Rest of prestige logic)
                     if current_sound_state == "on":
-                        _safe_set_volume(click_effect, 0.0896705)
-                        _safe_play(click_effect)
+                        voices.play("ui")
                     button_states.setdefault("prestige", {"hover": 0.0, "press": 0.0})[
                         "press"
                     ] = 1.0
@@ -3288,6 +3261,8 @@ def run_loop(screen, clock, assets):
 
                     # Prestige!
                     prestige_level += 1
+                    if tracer.ENABLED:
+                        tracer.instant("prestige", level=prestige_level)
                     prestige_multiplier = 1.0 + (prestige_level * 0.1)
                     grass_seeds_earned = int(math.sqrt(money) / 10)
                     grass_seeds += grass_seeds_earned
@@ -3360,47 +3335,46 @@ def run_loop(screen, clock, assets):
                 # === MINIGAME TARGET/COIN CLICKS ===
                 elif minigame_active:
                     if current_minigame == "target_practice":
-                        for target in minigame_targets[:]:
+                        for target in minigame_targets:
                             dist = math.sqrt(
-                                (event.pos[0] - target["x"]) ** 2
-                                + (event.pos[1] - target["y"]) ** 2
+                                (event.pos[0] - target.x) ** 2
+                                + (event.pos[1] - target.y) ** 2
                             )
-                            if dist <= target["radius"]:
+                            if dist <= target.radius:
                                 minigame_targets.remove(target)
                                 minigame_score += 1
                                 spawn_particles(
                                     particles,
-                                    (target["x"], target["y"]),
-                                    target["color"],
+                                    (target.x, target.y),
+                                    target.color,
                                     count=10,
                                 )
                                 if current_sound_state == "on":
-                                    _safe_play(click_effect)
+                                    voices.play("click")
                                 break
 
                     elif current_minigame == "golden_rush":
-                        for coin in minigame_targets[:]:
+                        for coin in minigame_targets:
                             dist = math.sqrt(
-                                (event.pos[0] - coin["x"]) ** 2
-                                + (event.pos[1] - coin["y"]) ** 2
+                                (event.pos[0] - coin.x) ** 2
+                                + (event.pos[1] - coin.y) ** 2
                             )
-                            if dist <= coin["radius"]:
+                            if dist <= coin.radius:
                                 minigame_targets.remove(coin)
-                                minigame_score += coin["value"]
+                                minigame_score += coin.value
                                 spawn_particles(
                                     particles,
-                                    (coin["x"], coin["y"]),
+                                    (coin.x, coin.y),
                                     (255, 215, 0),
                                     count=8,
                                 )
                                 if current_sound_state == "on":
-                                    _safe_play(click_effect)
+                                    voices.play("click")
                                 break
 
-                elif grass_rect.collidepoint(event.pos):
+                elif hit == "grass":
                     if current_sound_state == "on":
-                        _safe_set_volume(click_effect, 0.0896705)
-                        _safe_play(click_effect)
+                        voices.play("click")
 
                     # Handle minigame clicks
                     if minigame_active and current_minigame == "click_frenzy":
@@ -3449,7 +3423,7 @@ def run_loop(screen, clock, assets):
                         critical_hit_chance + luck_skill_bonus + extra_crit_chance
                     )
 
-                    is_critical = random.random() < total_crit_chance
+                    is_critical = rng.crits.random() < total_crit_chance
                     crit_mult_bonus = calculate_skill_bonus("luck_2", skills)
                     current_crit_mult = (
                         critical_hit_multiplier + crit_mult_bonus
@@ -3576,6 +3550,13 @@ def run_loop(screen, clock, assets):
 
                     money += total_gain
                     total_clicks += 1
+                    if tracer.ENABLED:
+                        tracer.instant(
+                            "click",
+                            gain=round(total_gain, 2),
+                            crit=is_critical,
+                            combo=combo_count,
+                        )
                     stats_data["total_clicks_all_time"] = (
                         stats_data.get("total_clicks_all_time", 0) + 1
                     )
@@ -3594,9 +3575,9 @@ def run_loop(screen, clock, assets):
                         # Bigger particles for critical
                         if rainbow_mode:
                             crit_color = (
-                                random.randint(100, 255),
-                                random.randint(100, 255),
-                                random.randint(100, 255),
+                                rng.cosmetic.randint(100, 255),
+                                rng.cosmetic.randint(100, 255),
+                                rng.cosmetic.randint(100, 255),
                             )
                         else:
                             crit_color = (255, 50, 50)
@@ -3604,7 +3585,11 @@ def run_loop(screen, clock, assets):
                             particles, grass_rect.center, crit_color, count=30
                         )
                         spawn_damage_number(
-                            damage_numbers, grass_rect.center, total_gain, (255, 50, 50)
+                            damage_numbers,
+                            grass_rect.center,
+                            total_gain,
+                            (255, 50, 50),
+                            settings.get("coalesce_damage_numbers", False),
                         )
 
                         if settings.get("screen_shake", True):
@@ -3625,42 +3610,22 @@ def run_loop(screen, clock, assets):
                                 money,
                             )
                             money += reward
-                        if critical_hit_count >= 100 and not achievements.get(
-                            "crit_100", {}
-                        ).get("unlocked", False):
-                            reward = check_achievement(
-                                achievements,
-                                achievement_defs,
-                                "crit_100",
-                                achievement_queue,
-                                notifications,
-                                money,
-                            )
-                            money += reward
-                        if critical_hit_count >= 1000 and not achievements.get(
-                            "crit_1000", {}
-                        ).get("unlocked", False):
-                            reward = check_achievement(
-                                achievements,
-                                achievement_defs,
-                                "crit_1000",
-                                achievement_queue,
-                                notifications,
-                                money,
-                            )
-                            money += reward
                     else:
                         # Normal damage number
                         if rainbow_mode:
                             dmg_color = (
-                                random.randint(150, 255),
-                                random.randint(150, 255),
-                                random.randint(50, 255),
+                                rng.cosmetic.randint(150, 255),
+                                rng.cosmetic.randint(150, 255),
+                                rng.cosmetic.randint(50, 255),
                             )
                         else:
                             dmg_color = (255, 255, 100)
                         spawn_damage_number(
-                            damage_numbers, grass_rect.center, total_gain, dmg_color
+                            damage_numbers,
+                            grass_rect.center,
+                            total_gain,
+                            dmg_color,
+                            settings.get("coalesce_damage_numbers", False),
                         )
 
                     # NEW: Screen shake (intensity based on combo and critical)
@@ -3700,82 +3665,9 @@ def run_loop(screen, clock, assets):
                             money,
                         )
                         money += reward
-                    if total_clicks >= 100 and not achievements.get(
-                        "click_100", {}
-                    ).get("unlocked", False):
-                        reward = check_achievement(
-                            achievements,
-                            achievement_defs,
-                            "click_100",
-                            achievement_queue,
-                            notifications,
-                            money,
-                        )
-                        money += reward
-                    if total_clicks >= 1000 and not achievements.get(
-                        "click_1000", {}
-                    ).get("unlocked", False):
-                        reward = check_achievement(
-                            achievements,
-                            achievement_defs,
-                            "click_1000",
-                            achievement_queue,
-                            notifications,
-                            money,
-                        )
-                        money += reward
-                    if total_clicks >= 10000 and not achievements.get(
-                        "click_10000", {}
-                    ).get("unlocked", False):
-                        reward = check_achievement(
-                            achievements,
-                            achievement_defs,
-                            "click_10000",
-                            achievement_queue,
-                            notifications,
-                            money,
-                        )
-                        money += reward
-                    if combo_count >= 10 and not achievements.get("combo_10", {}).get(
-                        "unlocked", False
-                    ):
-                        reward = check_achievement(
-                            achievements,
-                            achievement_defs,
-                            "combo_10",
-                            achievement_queue,
-                            notifications,
-                            money,
-                        )
-                        money += reward
-                    if combo_count >= 25 and not achievements.get("combo_25", {}).get(
-                        "unlocked", False
-                    ):
-                        reward = check_achievement(
-                            achievements,
-                            achievement_defs,
-                            "combo_25",
-                            achievement_queue,
-                            notifications,
-                            money,
-                        )
-                        money += reward
-                    if combo_count >= 50 and not achievements.get("combo_50", {}).get(
-                        "unlocked", False
-                    ):
-                        reward = check_achievement(
-                            achievements,
-                            achievement_defs,
-                            "combo_50",
-                            achievement_queue,
-                            notifications,
-                            money,
-                        )
-                        money += reward
-                elif wipe_button_rect.collidepoint(event.pos):
+                elif hit == "wipe":
                     if current_sound_state == "on":
-                        _safe_set_volume(click_effect, 0.0896705)
-                        _safe_play(click_effect)
+                        voices.play("ui")
                     # visual feedback
                     button_states.setdefault("wipe", {"hover": 0.0, "press": 0.0})[
                         "press"
@@ -3805,6 +3697,7 @@ def run_loop(screen, clock, assets):
                         combo_count = 0
                         max_combo = 0
                         achievements = {}
+                        achievement_engine.reset(achievements)
                         achievement_queue = []
                         prestige_level = 0
                         grass_seeds = 0
@@ -3833,6 +3726,7 @@ def run_loop(screen, clock, assets):
                             notifications, "Save Wiped! Restarting...", (255, 0, 0)
                         )
 
+        frame_profiler.mark("input")
         # Stats Panel Background
         draw_panel(screen, stats_panel_rect, bg_color=PANEL_BG_COLOR)
 
@@ -3916,35 +3810,9 @@ def run_loop(screen, clock, assets):
         screen.blit(weather_text, (weather_panel_rect.x + 15, weather_panel_rect.y + 9))
         screen.blit(timer_text, (weather_panel_rect.x + 6, weather_panel_rect.y + 43))
 
+        frame_profiler.mark("hud")
         # İstatistik ekranını göster - Pixel art tarzı için daha keskin kenarlar
         if show_stats:
-            stats_surface = pygame.Surface((500, 400))
-            stats_surface.fill((30, 48, 34))
-            stats_rect = stats_surface.get_rect(
-                center=(SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
-            )
-            pygame.draw.rect(
-                stats_surface, (40, 58, 44), stats_surface.get_rect(), border_radius=3
-            )
-            pygame.draw.rect(
-                stats_surface,
-                (80, 98, 84),
-                stats_surface.get_rect(),
-                2,
-                border_radius=3,
-            )
-
-            # İstatistik başlığı
-            title_text = custom_font.render("Game Statistics", True, TEXT_COLOR)
-            stats_surface.blit(
-                title_text,
-                (stats_surface.get_width() // 2 - title_text.get_width() // 2, 20),
-            )
-
-            # İstatistik bilgileri - Daha iyi hizalama
-            y_pos = 80
-            line_height = 40
-
             stats_list = [
                 ("Total Clicks", str(total_clicks)),
                 ("Highest Money", "$" + str(int(highest_money))),
@@ -3954,89 +3822,29 @@ def run_loop(screen, clock, assets):
                 ("AFK Upgrade Cost", "$" + str(int(afk_upgrade_cost))),
                 ("Multiplier Upgrade Cost", "$" + str(int(multiplier_upgrade_cost))),
             ]
-
-            for label, value in stats_list:
-                label_text = small_font.render(label + ":", True, TEXT_COLOR)
-                value_text = small_font.render(value, True, MONEY_COLOR)
-                stats_surface.blit(label_text, (50, y_pos))
-                stats_surface.blit(value_text, (300, y_pos))
-                y_pos += line_height
-
-            # Kapat butonu - Pixel art tarzı için daha keskin kenarlar
-            close_text = small_font.render("Close", True, TEXT_COLOR)
-            close_rect = pygame.Rect(
-                stats_surface.get_width() // 2 - 50,
-                stats_surface.get_height() - 50,
-                100,
-                40,
-            )
-            pygame.draw.rect(stats_surface, (200, 50, 50), close_rect, border_radius=3)
-            pygame.draw.rect(
-                stats_surface, BUTTON_BORDER_COLOR, close_rect, 2, border_radius=3
-            )
-            stats_surface.blit(
-                close_text,
-                (
-                    close_rect.centerx - close_text.get_width() // 2,
-                    close_rect.centery - close_text.get_height() // 2,
-                ),
+            # İstatistik bilgileri: sadece değişen satırlar yeniden çizilir
+            for k, (label, value) in enumerate(stats_list):
+                row_id = f"stats.row.{k}"
+                ui.cached(
+                    row_id, (label, value), _render_stats_row, row_id, label, value
+                )
+            stats_surface = ui.cached(
+                "stats", tuple(stats_list), _compose_overlay, "stats"
             )
 
             # İstatistik ekranını ana ekrana çiz
-            screen.blit(stats_surface, stats_rect.topleft)
+            screen.blit(stats_surface, ui.rect("stats").topleft)
 
         # Mağaza ekranını göster - Pixel art tarzı için daha keskin kenarlar.
         if show_shop:
-            shop_surface = pygame.Surface((500, 605))
-            shop_surface.fill((30, 48, 34))
-            shop_rect = shop_surface.get_rect(
-                center=(SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
-            )
-            pygame.draw.rect(
-                shop_surface, (40, 58, 44), shop_surface.get_rect(), border_radius=3
-            )
-            pygame.draw.rect(
-                shop_surface, (80, 98, 84), shop_surface.get_rect(), 2, border_radius=3
-            )
-
-            # Mağaza başlığı
-            title_text = custom_font.render("Grass Shop", True, TEXT_COLOR)
-            shop_surface.blit(
-                title_text,
-                (shop_surface.get_width() // 2 - title_text.get_width() // 2, 20),
-            )
-
-            # Çim seçenekleri - Daha iyi hizalama
-            y_pos = 80
-            item_height = 70
-
-            for i, (name, cost) in enumerate(zip(grass_names, grass_costs)):
-                # Çim öğesi arka planı - Pixel art tarzı için daha keskin kenarlar
-                item_rect = pygame.Rect(50, y_pos, 400, item_height)
-                if current_grass_index == i:
-                    # Aktif çim için farklı renk
-                    pygame.draw.rect(
-                        shop_surface, (50, 100, 50), item_rect, border_radius=3
-                    )
-                else:
-                    pygame.draw.rect(
-                        shop_surface, (40, 70, 40), item_rect, border_radius=3
-                    )
-                pygame.draw.rect(
-                    shop_surface, (60, 90, 60), item_rect, 2, border_radius=3
-                )
-
-                # Çim adı ve fiyatı
-                name_text = small_font.render(name, True, TEXT_COLOR)
-                shop_surface.blit(name_text, (item_rect.x + 15, item_rect.y + 10))
-
+            # Çim seçenekleri: her satır kendi girdileri değişince yeniden çizilir
+            shop_key = []
+            for i, cost in enumerate(grass_costs):
                 if i == 0 or current_grass_index >= i:
-                    status_text = small_font.render("Owned", True, (50, 205, 50))
+                    status, status_color = "Owned", (50, 205, 50)
                 else:
-                    status_text = small_font.render(f"Cost: ${cost}", True, MONEY_COLOR)
-                shop_surface.blit(status_text, (item_rect.x + 15, item_rect.y + 40))
+                    status, status_color = f"Cost: ${cost}", MONEY_COLOR
 
-                # Satın alma/seçme butonu - Pixel art tarzı için daha keskin kenarlar
                 if current_grass_index != i and current_grass_index >= i:
                     button_text = "Select"
                     button_color = (50, 150, 255)
@@ -4047,48 +3855,19 @@ def run_loop(screen, clock, assets):
                     button_text = "Selected"
                     button_color = (150, 150, 150)
 
-                button_text_render = small_font.render(button_text, True, TEXT_COLOR)
-                button_rect = pygame.Rect(
-                    item_rect.right - 100, item_rect.centery - 20, 80, 40
-                )
-                pygame.draw.rect(
-                    shop_surface, button_color, button_rect, border_radius=3
-                )
-                pygame.draw.rect(
-                    shop_surface, BUTTON_BORDER_COLOR, button_rect, 2, border_radius=3
-                )
-                shop_surface.blit(
-                    button_text_render,
-                    (
-                        button_rect.centerx - button_text_render.get_width() // 2,
-                        button_rect.centery - button_text_render.get_height() // 2,
-                    ),
+                row_key = (
+                    current_grass_index == i,
+                    status,
+                    status_color,
+                    button_text,
+                    button_color,
                 )
-
-                y_pos += item_height + 10
-
-            # Kapat butonu - Pixel art tarzı için daha keskin kenarlar
-            close_text = small_font.render("Close", True, TEXT_COLOR)
-            close_rect = pygame.Rect(
-                shop_surface.get_width() // 2 - 50,
-                shop_surface.get_height() - 50,
-                100,
-                40,
-            )
-            pygame.draw.rect(shop_surface, (200, 50, 50), close_rect, border_radius=3)
-            pygame.draw.rect(
-                shop_surface, BUTTON_BORDER_COLOR, close_rect, 2, border_radius=3
-            )
-            shop_surface.blit(
-                close_text,
-                (
-                    close_rect.centerx - close_text.get_width() // 2,
-                    close_rect.centery - close_text.get_height() // 2,
-                ),
-            )
+                ui.cached(f"shop.item.{i}", row_key, _render_shop_row, i, *row_key)
+                shop_key.append(row_key)
+            shop_surface = ui.cached("shop", tuple(shop_key), _compose_overlay, "shop")
 
             # Mağaza ekranını ana ekrana çiz
-            screen.blit(shop_surface, shop_rect.topleft)
+            screen.blit(shop_surface, ui.rect("shop").topleft)
 
         if show_minigame_menu:
             # Minigame Menu Overlay
@@ -4188,32 +3967,9 @@ def run_loop(screen, clock, assets):
             screen.blit(mg_surf, mg_rect.topleft)
 
         if show_skill_tree:
-            # Skill Tree Overlay
-            st_surf = pygame.Surface((500, 450))
-            st_surf.fill((20, 20, 40))
-            st_rect = st_surf.get_rect(
-                center=(SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
-            )
-            pygame.draw.rect(
-                st_surf, (100, 50, 200), st_surf.get_rect(), 3, border_radius=5
-            )
-
-            title = medium_font.render(
-                f"Skill Tree (SP: {skill_points})", True, (200, 150, 255)
-            )
-            st_surf.blit(title, (250 - title.get_width() // 2, 20))
-
-            # Draw skills in a grid
-            y_start = 80
-            x_start = 50
-            for i, (sid, sdata) in enumerate(skills.items()):
-                row = i // 2
-                col = i % 2
-                x = x_start + col * 220
-                y = y_start + row * 90
-
-                # Skill Box
-                skill_rect = pygame.Rect(x, y, 200, 80)
+            # Skill Tree Overlay: boxes re-render only when their state changes
+            skills_key = [skill_points]
+            for sid, sdata in skills.items():
                 color = (50, 100, 50) if sdata.get("unlocked", False) else (80, 80, 80)
                 if (
                     skill_points >= sdata["cost"]
@@ -4225,26 +3981,26 @@ def run_loop(screen, clock, assets):
                 ):
                     color = (50, 150, 50)  # Affordable
 
-                pygame.draw.rect(st_surf, color, skill_rect, border_radius=5)
-                pygame.draw.rect(
-                    st_surf, (200, 200, 200), skill_rect, 1, border_radius=5
-                )
-
-                name_txt = extra_small_font.render(sdata["name"], True, (255, 255, 255))
-                st_surf.blit(name_txt, (x + 5, y + 5))
-
-                desc_txt = extra_small_font.render(
-                    f"Cost: {sdata['cost']} SP", True, (255, 215, 0)
-                )
-                st_surf.blit(desc_txt, (x + 5, y + 25))
-
                 status = "Owned" if sdata.get("unlocked", False) else "Locked"
                 if not sdata.get("unlocked", False) and skill_points >= sdata["cost"]:
                     status = "Buy!"
-                stat_txt = extra_small_font.render(status, True, (200, 200, 200))
-                st_surf.blit(stat_txt, (x + 5, y + 45))
+                ui.cached(
+                    f"skills.{sid}",
+                    (color, status),
+                    _render_skill_row,
+                    sid,
+                    color,
+                    status,
+                )
+                skills_key.append((color, status))
 
-            screen.blit(st_surf, st_rect.topleft)
+            skills_key = tuple(skills_key)
+            if ui.get("skills").cache_key != skills_key:
+                title = medium_font.render(
+                    f"Skill Tree (SP: {skill_points})", True, (200, 150, 255)
+                )
+                ui.cached("skills", skills_key, _compose_overlay, "skills", title)
+            screen.blit(ui.get("skills").surface, ui.rect("skills").topleft)
 
         # === WHEEL PHYSICS ===
         if wheel_spinning:
@@ -4293,98 +4049,61 @@ def run_loop(screen, clock, assets):
                     )
 
                 add_notification(notifications, f"Won: {res['name']}", res["color"])
-                _safe_play(buy_effect)
+                voices.play("buy")
 
         if show_lucky_wheel:
             # Wheel Overlay
-            wh_surf = pygame.Surface((400, 400))
-            wh_surf.fill((20, 60, 40))
-            wh_rect = wh_surf.get_rect(
-                center=(SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
-            )
-            pygame.draw.rect(
-                wh_surf, (50, 200, 100), wh_surf.get_rect(), 3, border_radius=10
-            )
-
-            title = medium_font.render("Lucky Wheel", True, (100, 255, 100))
-            wh_surf.blit(title, (200 - title.get_width() // 2, 20))
-
-            # Draw Wheel Circle
+            wh_rect = ui.rect("wheel")
+            wh_node = ui.get("wheel")
             center_x, center_y = 200, 220
             radius = 120
-            pygame.draw.circle(
-                wh_surf, (200, 200, 200), (center_x, center_y), radius + 5
-            )
-
-            # Segments with text
-            for i in range(8):
-                prize = wheel_prizes[i]
-                start_angle = i * 45 + wheel_angle
-
-                # Draw filled sector (polygon)
-                points = [(center_x, center_y)]
-                for k in range(5):
-                    sub_a = start_angle + k * (45 / 4)
-                    rad_a = math.radians(sub_a)
-                    px = center_x + radius * math.cos(rad_a)
-                    py = center_y + radius * math.sin(rad_a)
-                    points.append((px, py))
-
-                p_col = prize.get("color", (100, 100, 100))
-                pygame.draw.polygon(wh_surf, p_col, points)
-                pygame.draw.polygon(wh_surf, (40, 40, 40), points, 2)
-
-                # Draw text
-                mid_angle = start_angle + 22.5
-                rad_mid = math.radians(mid_angle)
-                dist = radius * 0.7
-                tx = center_x + dist * math.cos(rad_mid)
-                ty = center_y + dist * math.sin(rad_mid)
-
-                # Prepare short text
-                txt = prize["name"]
-                txt = txt.replace("Money", "").replace("Click Power", "Pow").strip()
-                if txt.startswith("+$"):
-                    txt = txt[1:]
-
-                # Text shadow (black) + Text (white)
-                t_shad = extra_small_font.render(txt, True, (0, 0, 0))
-                t_surf = extra_small_font.render(txt, True, (255, 255, 255))
-
-                t_r_shad = pygame.transform.rotate(t_shad, -mid_angle)
-                t_r = pygame.transform.rotate(t_surf, -mid_angle)
-
-                # Centered blit
-                wh_surf.blit(
-                    t_r_shad,
-                    (
-                        tx - t_r_shad.get_width() // 2 + 1,
-                        ty - t_r_shad.get_height() // 2 + 1,
-                    ),
+            if wh_node.surface is None:
+                chrome = pygame.Surface(wh_rect.size)
+                chrome.fill((20, 60, 40))
+                pygame.draw.rect(
+                    chrome, (50, 200, 100), chrome.get_rect(), 3, border_radius=10
                 )
-                wh_surf.blit(
-                    t_r, (tx - t_r.get_width() // 2, ty - t_r.get_height() // 2)
+
+                title = medium_font.render("Lucky Wheel", True, (100, 255, 100))
+                chrome.blit(title, (200 - title.get_width() // 2, 20))
+
+                # Draw Wheel Circle
+                pygame.draw.circle(
+                    chrome, (200, 200, 200), (center_x, center_y), radius + 5
                 )
+                wh_node.surface = chrome
+            screen.blit(wh_node.surface, wh_rect.topleft)
+
+            # Segments with text: baked once, only rotated while spinning
+            draw_wheel(
+                screen,
+                (wh_rect.x + center_x, wh_rect.y + center_y),
+                radius,
+                wheel_prizes,
+                wheel_angle,
+                extra_small_font,
+            )
 
             # Spin Button
-            spin_btn = pygame.Rect(140, 360, 120, 40)
+            spin_btn = ui.rect("wheel.spin")
             btn_color = (
                 (255, 215, 0)
                 if free_spins_today > 0 and not wheel_spinning
                 else (100, 100, 100)
             )
-            pygame.draw.rect(wh_surf, btn_color, spin_btn, border_radius=5)
+            pygame.draw.rect(screen, btn_color, spin_btn, border_radius=5)
 
             btn_txt = small_font.render(
                 "SPIN!" if not wheel_spinning else "...", True, (0, 0, 0)
             )
-            wh_surf.blit(
+            screen.blit(
                 btn_txt,
-                (200 - btn_txt.get_width() // 2, 380 - btn_txt.get_height() // 2),
+                (
+                    spin_btn.centerx - btn_txt.get_width() // 2,
+                    spin_btn.centery - btn_txt.get_height() // 2,
+                ),
             )
 
-            screen.blit(wh_surf, wh_rect.topleft)
-
             # User Request: Improved Spin Feedback
             if wheel_result:
                 # Show result popup over the wheel
@@ -4410,83 +4129,99 @@ def run_loop(screen, clock, assets):
                     res_surf, (SCREEN_SIZE[0] // 2 - 150, SCREEN_SIZE[1] // 2 - 50)
                 )
 
+        frame_profiler.mark("overlays")
+        frame_profiler.present(display, extra_small_font)
         pygame.display.flip()
+        frame_profiler.mark("flip")
+        if startup_profiler.ENABLED:
+            startup_profiler.finish(get_save_dir())
 
         # decrement save message timer
         if save_msg_timer > 0:
             save_msg_timer = max(0.0, save_msg_timer - dt)
 
         # spawn/update specials (probabilistic per-second chance)
-        if random.random() < 0.013 * dt:
+        if rng.specials.random() < 0.013 * dt:
             # spawn a special at a random position near the grass area
-            gx = random.randint(120, SCREEN_SIZE[0] - 120)
-            gy = random.randint(120, SCREEN_SIZE[1] - 220)
+            gx = rng.specials.randint(120, SCREEN_SIZE[0] - 120)
+            gy = rng.specials.randint(120, SCREEN_SIZE[1] - 220)
             # try to use asset if loaded
             gsurf = assets.get("watercan") if assets else None
-            special = {
-                "pos": [float(gx), float(gy)],
-                "life": random.uniform(10.0, 20.0),
-                "value": random.randint(800, 3500),
+            special = specials.spawn(
+                gx,
+                gy,
+                life=rng.specials.uniform(10.0, 20.0),
+                value=rng.specials.randint(800, 3500),
                 # default, may be adjusted after surf scaling
-                "click_radius": 18,
-                "surf": None,
-            }
+                click_radius=18,
+            )
             if gsurf:
-                # cap visual size so it doesn't dominate the screen
-                max_dim = 64
-                gw, gh = gsurf.get_width(), gsurf.get_height()
-                scale = min(0.8, max_dim / max(gw, gh)) if max(gw, gh) > 0 else 0.8
-                new_w = max(8, int(gw * scale))
-                new_h = max(8, int(gh * scale))
-                special["surf"] = pygame.transform.smoothscale(gsurf, (new_w, new_h))
+                # scaled sprite and its rotation frames are shared by all specials
+                special.surf = special_renderer.sprite_for(gsurf)
                 # adjust click radius to match sprite size
-                special["click_radius"] = max(18, int(max(new_w, new_h) / 2) + 4)
+                new_w, new_h = special.surf.get_size()
+                special.click_radius = max(18, int(max(new_w, new_h) / 2) + 4)
             # add bobbing/oscillation params for animation
-            special["osc_amp"] = random.uniform(4.0, 10.0)
-            special["osc_speed"] = random.uniform(0.8, 1.8)
-            special["osc_phase"] = random.uniform(0.0, math.pi * 2)
+            special.osc_amp = rng.specials.uniform(4.0, 10.0)
+            special.osc_speed = rng.specials.uniform(0.8, 1.8)
+            special.osc_phase = rng.specials.uniform(0.0, math.pi * 2)
             # horizontal sway parameters (left-right motion)
-            special["sway_amp"] = random.uniform(6.0, 18.0)
-            special["sway_speed"] = random.uniform(0.6, 1.6)
-            special["sway_phase"] = random.uniform(0.0, math.pi * 2)
+            special.sway_amp = rng.specials.uniform(6.0, 18.0)
+            special.sway_speed = rng.specials.uniform(0.6, 1.6)
+            special.sway_phase = rng.specials.uniform(0.0, math.pi * 2)
             # subtle rotation left-right
-            special["rot_amp"] = random.uniform(6.0, 20.0)  # degrees
-            special["rot_speed"] = random.uniform(0.8, 1.6)
-            special["rot_phase"] = random.uniform(0.0, math.pi * 2)
-            specials.append(special)
+            special.rot_amp = rng.specials.uniform(6.0, 20.0)  # degrees
+            special.rot_speed = rng.specials.uniform(0.8, 1.6)
+            special.rot_phase = rng.specials.uniform(0.0, math.pi * 2)
+            special_serial += 1
+            special.node = f"special.{special_serial}"
+            r = special.click_radius
+            ui.add(
+                special.node,
+                (gx - r, gy - r, 2 * r, 2 * r),
+                layer=LAYER_WORLD,
+                radius=r,
+            )
 
         # decay life for specials
-        for s in list(specials):
-            s["life"] -= dt
-            if s["life"] <= 0:
-                try:
-                    specials.remove(s)
-                except Exception:
-                    pass
-
+        for s in specials:
+            s.life -= dt
+            if s.life <= 0:
+                ui.remove(s.node)
+        specials.retain(lambda s: s.life > 0)
+        frame_profiler.mark("update")
+        frame_profiler.end_frame()
+        if memory_tracker.ENABLED:
+            memory_tracker.end_frame()
+
+    widget_tree = None
     pygame.quit()
     sys.exit()
 
 
 def save_game_data(data):
     """Oyun verilerini JSON formatında kaydeder."""
-    try:
-        # Cross-platform application data directory
-        app_data = get_save_dir()
-        # Ensure directory exists
-        os.makedirs(app_data, exist_ok=True)
-        save_path = os.path.join(app_data, "save_data.json")
-        # Write atomically: write to temp file then rename
-        tmp_path = save_path + ".tmp"
-        # Dump pretty (multi-line, indented) JSON for readability
-        pretty = json.dumps(data, indent=2, ensure_ascii=False)
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            f.write(pretty)
-        os.replace(tmp_path, save_path)
-        return True
-    except Exception as e:
-        print(f"Kaydetme hatası: {e}")
-        return False
+    with tracer.span("save_game_data", "io"):
+        try:
+            # Cross-platform application data directory
+            app_data = get_save_dir()
+            # Ensure directory exists
+            os.makedirs(app_data, exist_ok=True)
+            save_path = os.path.join(app_data, "save_data.json")
+            if replay.ENABLED:
+                # a recording session must not touch the login streak/dates
+                data = replay.keep_wall_clock(data)
+            # Write atomically: write to temp file then rename
+            tmp_path = save_path + ".tmp"
+            # Dump pretty (multi-line, indented) JSON for readability
+            pretty = json.dumps(data, indent=2, ensure_ascii=False)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(pretty)
+            os.replace(tmp_path, save_path)
+            return True
+        except Exception as e:
+            print(f"Kaydetme hatası: {e}")
+            return False
 
 
 def get_save_dir():
@@ -4528,6 +4263,34 @@ def load_game_data():
     return {}  # Varsayılan boş veri
 
 
+# Grass variant tints: each RGB channel = original green channel x factor
+GRASS_VARIANT_FACTORS = (
+    (1.2, 0.9, 0.3),  # golden
+    (0.3, 1.1, 5),  # frozen ("rainbow")
+    (0.1, 1, 1.8),  # diamond
+    (0.5, 0.2, 1.5),  # mystic
+    (0.1, 0.1, 0.1),  # blackhole
+)
+
+
+def tint_grass(image, factors):
+    """Recolour the visible pixels of a grass image from its green channel."""
+    fr, fg, fb = factors
+    tinted = image.copy()
+    for x in range(tinted.get_width()):
+        for y in range(tinted.get_height()):
+            color = tinted.get_at((x, y))
+            if color.a != 0:  # Sadece görünür pikselleri işle
+                green_value = color.g
+                new_color = pygame.Color(
+                    min(255, int(green_value * fr)),
+                    min(255, int(green_value * fg)),
+                    min(255, int(green_value * fb)),
+                )
+                tinted.set_at((x, y), new_color)
+    return tinted
+
+
 def colorize(image, color):
     """Bir görselin rengini değiştirir."""
     colorized = image.copy()
@@ -4540,25 +4303,23 @@ def colorize(image, color):
 
 def add_notification(notifications, text, color=(255, 255, 255), duration=2.5):
     """Add a notification to the queue."""
-    notifications.append(
-        {"text": text, "color": color, "timer": duration, "y_offset": 0}
-    )
+    notifications.spawn(text, color, duration)
 
 
 def update_notifications(notifications, dt):
     """Update and remove expired notifications."""
-    for notif in notifications[:]:
-        notif["timer"] -= dt
-        if notif["timer"] <= 0:
-            notifications.remove(notif)
+    for notif in notifications:
+        notif.timer -= dt
+    # retain() keeps queue order for the stacked layout in draw_notifications
+    notifications.retain(lambda n: n.timer > 0)
 
 
 def draw_notifications(surface, notifications, font):
     """Draw all active notifications."""
     y_start = 10
     for i, notif in enumerate(notifications):
-        alpha = min(255, int(notif["timer"] * 255)) if notif["timer"] < 1.0 else 255
-        text_surf = font.render(notif["text"], True, notif["color"])
+        alpha = min(255, int(notif.timer * 255)) if notif.timer < 1.0 else 255
+        text_surf = font.render(notif.text, True, notif.color)
         text_surf.set_alpha(alpha)
         y_pos = y_start + (i * 22)  # Reduced spacing from 30 to 22
         surface.blit(
@@ -4566,38 +4327,103 @@ def draw_notifications(surface, notifications, font):
         )
 
 
-def spawn_damage_number(damage_numbers, pos, value, color=(255, 255, 100)):
-    """Spawn a floating damage number."""
-    damage_numbers.append(
-        {
-            "pos": [float(pos[0]), float(pos[1])],
-            "vel": [random.uniform(-20, 20), random.uniform(-80, -40)],
-            "text": f"+${int(value)}",
-            "color": color,
-            "life": 1.2,
-            "max_life": 1.2,
-        }
+# draw_damage_numbers keeps this many rendered labels (LRU); repeated click
+# gains share one entry
+DAMAGE_TEXT_CACHE_SIZE = 64
+# Fade-out steps; each is one cached alpha copy of a label
+DAMAGE_ALPHA_BUCKETS = 16
+# Coalescing (settings["coalesce_damage_numbers"]): once this many labels are
+# alive, a gain joins a label younger than DAMAGE_COALESCE_AGE seconds within
+# DAMAGE_COALESCE_RADIUS pixels
+DAMAGE_COALESCE_MIN = 12
+DAMAGE_COALESCE_AGE = 0.3
+DAMAGE_COALESCE_RADIUS = 48
+
+
+def spawn_damage_number(
+    damage_numbers, pos, value, color=(255, 255, 100), coalesce=False
+):
+    """Spawn a floating damage number.
+
+    With coalesce on and a burst in progress, the gain is merged into a young
+    nearby label that then reads "+$N xk" instead of adding another label.
+    """
+    if coalesce and len(damage_numbers) >= DAMAGE_COALESCE_MIN:
+        # newest labels are at the end; only look at the last few
+        for dmg in reversed(damage_numbers.items[-8:]):
+            if dmg.max_life - dmg.life > DAMAGE_COALESCE_AGE:
+                continue
+            if (
+                abs(dmg.x - pos[0]) > DAMAGE_COALESCE_RADIUS
+                or abs(dmg.y - pos[1]) > DAMAGE_COALESCE_RADIUS
+            ):
+                continue
+            dmg.value += value
+            dmg.count += 1
+            dmg.text = f"+${int(dmg.value)} x{dmg.count}"
+            dmg.color = color
+            dmg.life = dmg.max_life
+            dmg.render = None
+            return dmg
+    return damage_numbers.spawn(
+        pos[0],
+        pos[1],
+        rng.cosmetic.uniform(-20, 20),
+        rng.cosmetic.uniform(-80, -40),
+        f"+${int(value)}",
+        color,
+        1.2,
+        value,
     )
 
 
 def update_damage_numbers(damage_numbers, dt):
     """Update floating damage numbers."""
-    for dmg in damage_numbers[:]:
-        dmg["pos"][0] += dmg["vel"][0] * dt
-        dmg["pos"][1] += dmg["vel"][1] * dt
-        dmg["vel"][1] += 120 * dt  # gravity
-        dmg["life"] -= dt
-        if dmg["life"] <= 0:
-            damage_numbers.remove(dmg)
+    for dmg in damage_numbers:
+        dmg.x += dmg.vx * dt
+        dmg.y += dmg.vy * dt
+        dmg.vy += 120 * dt  # gravity
+        dmg.life -= dt
+    damage_numbers.retain(lambda d: d.life > 0)
+
 
+def draw_damage_numbers(surface, damage_numbers, font, offset=(0, 0)):
+    """Draw floating damage numbers.
 
-def draw_damage_numbers(surface, damage_numbers, font):
-    """Draw floating damage numbers."""
+    Each label is rendered once (shared by every number with the same text and
+    colour) and fades through DAMAGE_ALPHA_BUCKETS cached alpha copies.
+    """
+    # cache structure: {(font, text, color): {"base": Surface, "alpha": {bucket: Surface}}}
+    if not hasattr(draw_damage_numbers, "cache"):
+        draw_damage_numbers.cache = OrderedDict()
+    cache = draw_damage_numbers.cache
+    top = DAMAGE_ALPHA_BUCKETS - 1
+    ox, oy = offset
     for dmg in damage_numbers:
-        alpha = int(255 * (dmg["life"] / dmg["max_life"]))
-        text_surf = font.render(dmg["text"], True, dmg["color"])
-        text_surf.set_alpha(alpha)
-        surface.blit(text_surf, (int(dmg["pos"][0]), int(dmg["pos"][1])))
+        entry = dmg.render
+        if entry is None:
+            key = (id(font), dmg.text, dmg.color)
+            entry = cache.get(key)
+            if entry is None:
+                entry = {"base": font.render(dmg.text, True, dmg.color), "alpha": {}}
+                cache[key] = entry
+                if len(cache) > DAMAGE_TEXT_CACHE_SIZE:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            # live numbers keep their entry even if the LRU drops it
+            dmg.render = entry
+
+        bucket = int(top * max(0.0, dmg.life) / dmg.max_life + 0.5)
+        if bucket >= top:
+            text_surf = entry["base"]
+        else:
+            text_surf = entry["alpha"].get(bucket)
+            if text_surf is None:
+                text_surf = entry["base"].copy()
+                text_surf.set_alpha(255 * bucket // top)
+                entry["alpha"][bucket] = text_surf
+        surface.blit(text_surf, (int(dmg.x) + ox, int(dmg.y) + oy))
 
 
 def update_screen_shake(screen_offset, shake_intensity, shake_duration, dt):
@@ -4605,8 +4431,8 @@ def update_screen_shake(screen_offset, shake_intensity, shake_duration, dt):
     if shake_duration > 0:
         shake_duration -= dt
         if shake_duration > 0:
-            screen_offset[0] = random.uniform(-shake_intensity, shake_intensity)
-            screen_offset[1] = random.uniform(-shake_intensity, shake_intensity)
+            screen_offset[0] = rng.cosmetic.uniform(-shake_intensity, shake_intensity)
+            screen_offset[1] = rng.cosmetic.uniform(-shake_intensity, shake_intensity)
         else:
             screen_offset[0] = 0
             screen_offset[1] = 0
@@ -4636,59 +4462,53 @@ def check_achievement(
 
     # Unlock!
     achievements[ach_id]["unlocked"] = True
+    if tracer.ENABLED:
+        tracer.instant("achievement", id=ach_id)
     ach_data = achievement_defs[ach_id]
     achievement_queue.append(ach_data)
     add_notification(notifications, f"Achievement: {ach_data['name']}!", (255, 215, 0))
     return ach_data.get("reward", 0)
 
 
+def queue_achievements(
+    achievement_defs, unlocked, reward, achievement_queue, notifications
+):
+    """One popup and one notification for a batch of unlocked achievements."""
+    if tracer.ENABLED:
+        tracer.instant("achievements", ids=unlocked, reward=reward)
+    if len(unlocked) == 1:
+        ach_data = achievement_defs[unlocked[0]]
+        achievement_queue.append(ach_data)
+        add_notification(
+            notifications, f"Achievement: {ach_data['name']}!", (255, 215, 0)
+        )
+        return
+    first = achievement_defs[unlocked[0]]["name"]
+    achievement_queue.append(
+        {"name": f"{first} +{len(unlocked) - 1} more", "reward": reward}
+    )
+    add_notification(
+        notifications, f"{len(unlocked)} achievements unlocked!", (255, 215, 0)
+    )
+
+
 def draw_achievement_popup(surface, achievement_data, timer, font, small_font):
-    """Draw achievement unlock popup."""
+    """Draw achievement unlock popup (composed once by popup_renderer)."""
     if timer <= 0:
         return
 
     # Slide in from right
     progress = min(1.0, (3.0 - timer) / 0.5)  # 0.5s slide in
-    fade_out = 1.0 if timer > 0.5 else (timer / 0.5)
 
-    # Smaller size
-    width = 280
-    height = 70
+    popup = popup_renderer.achievement(achievement_data, small_font)
+    width, height = popup.get_size()
     # Position at bottom-right corner
     x = surface.get_width() - width - 10
     y = surface.get_height() - height - 80  # Above wipe button
 
     # Slide animation from right
     x_offset = int((1.0 - progress) * width)
-
-    # Draw panel
-    panel_surf = pygame.Surface((width, height), pygame.SRCALPHA)
-    alpha = int(255 * fade_out)
-    pygame.draw.rect(
-        panel_surf, (40, 40, 40, alpha), panel_surf.get_rect(), border_radius=8
-    )
-    pygame.draw.rect(
-        panel_surf, (255, 215, 0, alpha), panel_surf.get_rect(), 2, border_radius=8
-    )
-
-    # Draw text - smaller and more compact
-    title = small_font.render("Achievement!", True, (255, 215, 0))
-    title.set_alpha(alpha)
-    name = small_font.render(achievement_data["name"], True, (255, 255, 255))
-    name.set_alpha(alpha)
-
-    panel_surf.blit(title, (10, 8))
-    panel_surf.blit(name, (10, 28))
-
-    # Show reward if any
-    if achievement_data.get("reward", 0) > 0:
-        reward_text = small_font.render(
-            f"+${achievement_data['reward']}", True, (100, 255, 100)
-        )
-        reward_text.set_alpha(alpha)
-        panel_surf.blit(reward_text, (10, 48))
-
-    surface.blit(panel_surf, (x + x_offset, y))
+    popup_renderer.draw(surface, popup, (x + x_offset, y), fade_alpha(timer))
 
 
 def get_combo_multiplier(combo_count):
@@ -4705,6 +4525,79 @@ def get_combo_multiplier(combo_count):
         return 1.2
 
 
+def _bake_wheel(radius, prizes, font):
+    """Draw the 8 prize sectors and their labels at angle 0 onto a texture."""
+    size = 2 * radius + 8
+    c = size // 2
+    tex = pygame.Surface((size, size), pygame.SRCALPHA)
+    for i in range(8):
+        prize = prizes[i]
+        start_angle = i * 45
+
+        # Draw filled sector (polygon)
+        points = [(c, c)]
+        for k in range(5):
+            rad_a = math.radians(start_angle + k * (45 / 4))
+            points.append((c + radius * math.cos(rad_a), c + radius * math.sin(rad_a)))
+
+        p_col = prize.get("color", (100, 100, 100))
+        pygame.draw.polygon(tex, p_col, points)
+        pygame.draw.polygon(tex, (40, 40, 40), points, 2)
+
+        # Draw text
+        mid_angle = start_angle + 22.5
+        rad_mid = math.radians(mid_angle)
+        dist = radius * 0.7
+        tx = c + dist * math.cos(rad_mid)
+        ty = c + dist * math.sin(rad_mid)
+
+        # Prepare short text
+        txt = prize["name"]
+        txt = txt.replace("Money", "").replace("Click Power", "Pow").strip()
+        if txt.startswith("+$"):
+            txt = txt[1:]
+
+        # Text shadow (black) + Text (white)
+        t_r_shad = pygame.transform.rotate(
+            font.render(txt, True, (0, 0, 0)), -mid_angle
+        )
+        t_r = pygame.transform.rotate(
+            font.render(txt, True, (255, 255, 255)), -mid_angle
+        )
+        tex.blit(
+            t_r_shad,
+            (tx - t_r_shad.get_width() // 2 + 1, ty - t_r_shad.get_height() // 2 + 1),
+        )
+        tex.blit(t_r, (tx - t_r.get_width() // 2, ty - t_r.get_height() // 2))
+    return tex
+
+
+def draw_wheel(surface, center, radius, prizes, angle, font):
+    """Draw the lucky wheel rotated by angle (degrees, clockwise).
+
+    The sectors and labels are baked once; a frame is one rotate + blit, and
+    none at all while the angle stays put.
+    """
+    if not hasattr(draw_wheel, "cache"):
+        draw_wheel.cache = {"key": None, "texture": None, "angle": None, "frame": None}
+    cache = draw_wheel.cache
+    key = (
+        radius,
+        id(font),
+        tuple((p["name"], tuple(p.get("color", ()))) for p in prizes[:8]),
+    )
+    if cache["key"] != key:
+        cache["key"] = key
+        cache["texture"] = _bake_wheel(radius, prizes, font)
+        cache["angle"] = None
+    if cache["angle"] != angle:
+        # pygame rotates counter-clockwise; the wheel angle grows clockwise
+        cache["frame"] = pygame.transform.rotate(cache["texture"], -angle)
+        cache["angle"] = angle
+    frame = cache["frame"]
+    surface.blit(frame, frame.get_rect(center=center))
+
+
 def draw_combo_meter(surface, combo_count, combo_timer, combo_timeout, font, pos):
     """Draw combo counter and timer bar."""
     if combo_count <= 0:
@@ -0,0 +1,336 @@
+# game/memory_tracker.py
+"""Opt-in allocation and surface-memory tracker.
+
+Enable with TTG_MEMTRACK=1 (or a directory to write dumps to), or by
+passing --memtrack [dir] to the game. While enabled it:
+
+- counts Surface allocations per frame by call site (file:line function).
+  It covers pygame.Surface(), the pygame.transform functions and game font
+  renders;
+- adds up the pixel bytes held by every cache registered with
+  track_caches() (particles, buttons, panels, text, background, ...);
+- runs tracemalloc and takes a snapshot every SNAPSHOT_INTERVAL_S, so
+  Python heap growth can be traced back to the lines that allocate.
+
+The numbers appear in the F3 profiler overlay. F5 writes the full report
+as JSON (memory-<time>-manual.json), and one is written on exit as well.
+
+Patching is done in enable(), so call it before the game creates its
+surfaces (__main__ does). Like tracer, keep this module free of game
+imports.
+"""
+
+from collections import deque
+import atexit
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ENABLED = False
+HISTORY = 240  # frames in the per-frame allocation averages
+CACHE_SAMPLE_FRAMES = 30  # re-measure cache sizes this often
+SNAPSHOT_INTERVAL_S = 30.0
+TRACE_FRAMES = 1  # tracemalloc stack depth; deeper is much slower
+TOP_SITES = 20  # rows per table in the dump
+TRANSFORMS = (
+    "scale",
+    "smoothscale",
+    "scale_by",
+    "smoothscale_by",
+    "rotate",
+    "rotozoom",
+    "flip",
+)
+
+_dump_dir = None
+_frame_sites = {}  # this frame: site -> [count, bytes]
+_totals = {}  # since enable: site -> [count, bytes]
+_frames = deque(maxlen=HISTORY)  # per-frame _frame_sites
+_caches = {}  # name -> callable returning the cache's root object
+_cache_bytes = {}
+_frame_count = 0
+_timeline = []
+_base_snapshot = None
+_last_snapshot_t = 0.0
+_t0 = time.perf_counter()
+_Surface = None  # pygame's own Surface class, before patching
+_paused = 0  # > 0 inside untracked()
+
+
+def enable(dump_dir=None):
+    """Patch the Surface factories and start tracemalloc."""
+    global ENABLED, _dump_dir, _Surface, _base_snapshot, _last_snapshot_t
+    import pygame
+
+    if ENABLED:
+        return
+    ENABLED = True
+    _dump_dir = dump_dir
+    _Surface = pygame.Surface
+
+    class TrackedSurface(_Surface):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            note_surface(self, 2)
+
+    pygame.Surface = TrackedSurface
+    for name in TRANSFORMS:
+        fn = getattr(pygame.transform, name, None)
+        if fn is not None:
+            setattr(pygame.transform, name, _tracked(fn))
+    tracemalloc.start(TRACE_FRAMES)
+    _base_snapshot = tracemalloc.take_snapshot()
+    _last_snapshot_t = time.perf_counter()
+    atexit.register(dump, "exit")
+
+
+def enable_from_env(argv=None):
+    """Enable if TTG_MEMTRACK or --memtrack is set. Strips the flag."""
+    argv = sys.argv if argv is None else argv
+    path = None
+    requested = False
+    if "--memtrack" in argv:
+        i = argv.index("--memtrack")
+        requested = True
+        del argv[i]
+        if i < len(argv) and not argv[i].startswith("-"):
+            path = argv.pop(i)
+    env = os.environ.get("TTG_MEMTRACK", "")
+    if env and env != "0":
+        requested = True
+        if env != "1":
+            path = path or env
+    if requested:
+        enable(path)
+    return requested
+
+
+def set_default_dir(path):
+    """Where dumps go when no directory was given on enable."""
+    global _dump_dir
+    if _dump_dir is None:
+        _dump_dir = path
+
+
+def track_caches(caches):
+    """Register {name: callable returning the cache object} for byte counts."""
+    _caches.update(caches)
+
+
+def _tracked(fn):
+    def wrapper(*args, **kwargs):
+        surf = fn(*args, **kwargs)
+        note_surface(surf, 2)
+        return surf
+
+    wrapper.__name__ = fn.__name__
+    wrapper.__doc__ = fn.__doc__
+    return wrapper
+
+
+def _site(depth):
+    frame = sys._getframe(depth + 1)
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{frame.f_lineno} {code.co_name}"
+
+
+def surface_bytes(surf):
+    if surf.get_parent() is not None:
+        return 0  # subsurfaces share their parent's pixels
+    return surf.get_pitch() * surf.get_height()
+
+
+@contextlib.contextmanager
+def untracked():
+    """Don't count surfaces made inside (the profiling tools' own drawing)."""
+    global _paused
+    _paused += 1
+    try:
+        yield
+    finally:
+        _paused -= 1
+
+
+def note_surface(surf, depth=1):
+    """Count a new surface against the call site `depth` frames up."""
+    if _paused:
+        return
+    site = _site(depth)
+    entry = _frame_sites.get(site)
+    if entry is None:
+        entry = _frame_sites[site] = [0, 0]
+    entry[0] += 1
+    entry[1] += surface_bytes(surf)
+
+
+def _measure(obj, seen):
+    """Pixel bytes of every Surface reachable through dicts/lists/tuples/attrs."""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, _Surface):
+        return surface_bytes(obj)
+    if isinstance(obj, dict):
+        return sum(_measure(v, seen) for v in obj.values())
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        return sum(_measure(v, seen) for v in obj)
+    return 0
+
+
+def measure_caches():
+    seen = set()
+    sizes = {}
+    for name, get in _caches.items():
+        try:
+            sizes[name] = _measure(get(), seen)
+        except Exception:
+            sizes[name] = 0
+    _cache_bytes.clear()
+    _cache_bytes.update(sizes)
+    return sizes
+
+
+def end_frame():
+    """Close this frame's allocation counts; sample caches and the heap."""
+    global _frame_sites, _frame_count, _last_snapshot_t
+    for site, (count, size) in _frame_sites.items():
+        total = _totals.get(site)
+        if total is None:
+            total = _totals[site] = [0, 0]
+        total[0] += count
+        total[1] += size
+    _frames.append(_frame_sites)
+    _frame_sites = {}
+    _frame_count += 1
+    if _frame_count % CACHE_SAMPLE_FRAMES == 0:
+        measure_caches()
+    now = time.perf_counter()
+    if now - _last_snapshot_t >= SNAPSHOT_INTERVAL_S:
+        _last_snapshot_t = now
+        _sample(now)
+
+
+def _sample(now):
+    current, peak = tracemalloc.get_traced_memory()
+    _timeline.append(
+        {
+            "t": round(now - _t0, 1),
+            "frames": _frame_count,
+            "traced_kib": current // 1024,
+            "traced_peak_kib": peak // 1024,
+            "cache_kib": sum(_cache_bytes.values()) // 1024,
+            "surface_allocs": sum(t[0] for t in _totals.values()),
+        }
+    )
+
+
+def _window():
+    """Per-frame averages over the recent frames: site -> (count, bytes)."""
+    n = max(1, len(_frames))
+    sums = {}
+    for frame in _frames:
+        for site, (count, size) in frame.items():
+            entry = sums.get(site)
+            if entry is None:
+                entry = sums[site] = [0, 0]
+            entry[0] += count
+            entry[1] += size
+    return {site: (c / n, b / n) for site, (c, b) in sums.items()}
+
+
+def overlay_lines():
+    """(text, colour) rows for the F3 overlay."""
+    window = _window()
+    allocs = sum(c for c, _ in window.values())
+    alloc_kib = sum(b for _, b in window.values()) / 1024.0
+    current, peak = tracemalloc.get_traced_memory()
+    caches_mib = sum(_cache_bytes.values()) / 1048576.0
+    lines = [
+        (
+            f"surf allocs/frame {allocs:.1f} ({alloc_kib:.0f} KB)  caches "
+            f"{caches_mib:.1f} MB  py {current / 1048576.0:.1f}/"
+            f"{peak / 1048576.0:.1f} MB",
+            (160, 200, 255),
+        )
+    ]
+    top = sorted(window.items(), key=lambda kv: kv[1][1], reverse=True)[:3]
+    for site, (count, size) in top:
+        lines.append(
+            (f"  {site[:34]:<34}{count:5.1f}/f {size / 1024:6.0f} KB", (160, 200, 255))
+        )
+    biggest = sorted(_cache_bytes.items(), key=lambda kv: kv[1], reverse=True)[:4]
+    if biggest:
+        lines.append(
+            (
+                "  "
+                + "  ".join(f"{name} {b / 1048576.0:.1f}" for name, b in biggest)
+                + " MB",
+                (160, 200, 255),
+            )
+        )
+    return lines
+
+
+def build_report(reason="manual"):
+    measure_caches()
+    now = time.perf_counter()
+    _sample(now)
+    frames = max(1, _frame_count)
+    window = _window()
+    sites = sorted(_totals.items(), key=lambda kv: kv[1][1], reverse=True)
+    snapshot = tracemalloc.take_snapshot()
+    growth = snapshot.compare_to(_base_snapshot, "lineno")[:TOP_SITES]
+    return {
+        "reason": reason,
+        "frames": _frame_count,
+        "elapsed_s": round(now - _t0, 1),
+        "surface_allocs": [
+            {
+                "site": site,
+                "count": count,
+                "kib": size // 1024,
+                "per_frame": round(count / frames, 3),
+                "recent_per_frame": round(window.get(site, (0.0, 0))[0], 3),
+            }
+            for site, (count, size) in sites[:TOP_SITES]
+        ],
+        "caches_kib": {
+            name: size // 1024
+            for name, size in sorted(
+                _cache_bytes.items(), key=lambda kv: kv[1], reverse=True
+            )
+        },
+        "timeline": _timeline,
+        # Python heap growth since tracking started, by allocating line
+        "tracemalloc_growth": [
+            {
+                "site": str(stat.traceback),
+                "size_diff_kib": stat.size_diff // 1024,
+                "size_kib": stat.size // 1024,
+                "count_diff": stat.count_diff,
+            }
+            for stat in growth
+        ],
+    }
+
+
+def dump(reason="manual"):
+    """Write the report as JSON. Returns the file path."""
+    if not ENABLED:
+        return None
+    directory = _dump_dir or os.getcwd()
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(directory, f"memory-{stamp}-{reason}.json")
+    try:
+        report = build_report(reason)
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Memory report written to {path}")
+    except Exception as e:
+        print(f"Memory report could not be written: {e}")
+        return None
+    return path
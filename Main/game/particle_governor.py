@@ -0,0 +1,84 @@
+# game/particle_governor.py
+"""Particle budget governor.
+
+Scales requested spawn counts by the particle_density setting, by the
+measured frame time and by how full the particle list already is, so bursts
+thin out gradually instead of being truncated at MAX_PARTICLES. Cosmetic
+extras (green flecks) are the first thing dropped under pressure.
+"""
+
+from . import rng
+
+# Frame time the governor tries to stay under (ms). Above this, spawn counts
+# shrink linearly until SLOW_FRAME_MS, where they bottom out at MIN_FRAME_SCALE.
+TARGET_FRAME_MS = 1000.0 / 60.0
+SLOW_FRAME_MS = 1000.0 / 30.0
+MIN_FRAME_SCALE = 0.25
+# Below this overall scale cosmetic particles are skipped entirely
+COSMETIC_THRESHOLD = 0.75
+
+
+class ParticleGovernor:
+    """Decides how many particles each spawn request actually gets."""
+
+    def __init__(self, max_particles, density=1.0):
+        self.max_particles = max_particles
+        self.density = 1.0
+        self.set_density(density)
+        self.frame_ms = TARGET_FRAME_MS  # smoothed frame time
+        self.frame_scale = 1.0
+        self.spawned = 0
+        self.culled = 0
+        self.active = 0
+
+    def set_density(self, density):
+        try:
+            # particle_density from the save; 0 turns particles off, 2.0 is the cap
+            self.density = max(0.0, min(2.0, float(density)))
+        except (TypeError, ValueError):
+            self.density = 1.0
+
+    def observe_frame(self, dt):
+        """Feed the last frame's duration (seconds)."""
+        # Exponential moving average so one slow frame doesn't gut a burst
+        self.frame_ms += (dt * 1000.0 - self.frame_ms) * 0.1
+        over = (self.frame_ms - TARGET_FRAME_MS) / (SLOW_FRAME_MS - TARGET_FRAME_MS)
+        over = max(0.0, min(1.0, over))
+        self.frame_scale = 1.0 - over * (1.0 - MIN_FRAME_SCALE)
+
+    def scale(self, active):
+        """Combined spawn multiplier for the current density, frame time and fill."""
+        fill = min(1.0, active / float(self.max_particles))
+        # Quadratic taper: barely noticeable when sparse, steep near the cap
+        return self.density * self.frame_scale * (1.0 - fill * fill)
+
+    def budget(self, requested, active):
+        """Return how many of `requested` particles to spawn right now."""
+        if requested <= 0:
+            return 0
+        expected = requested * self.scale(active)
+        count = int(expected)
+        # Stochastic rounding keeps small bursts visible on average
+        if rng.cosmetic.random() < expected - count:
+            count += 1
+        count = max(0, min(count, self.max_particles - active))
+        self.spawned += count
+        self.culled += max(0, requested - count)
+        return count
+
+    def allow_cosmetic(self, active):
+        """True (and counted as spawned) if there is headroom for one extra."""
+        if self.scale(active) >= COSMETIC_THRESHOLD:
+            self.spawned += 1
+            return True
+        self.culled += 1
+        return False
+
+    def stats(self):
+        return {
+            "spawned": self.spawned,
+            "culled": self.culled,
+            "active": self.active,
+            "scale": round(self.scale(self.active), 3),
+            "frame_ms": round(self.frame_ms, 2),
+        }
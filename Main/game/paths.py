@@ -17,8 +17,16 @@ SOUNDS_DIR = os.path.join(ASSETS_DIR, "sounds")
 CUSTOM_FONT_PATH = os.path.join(FONTS_DIR, "PixelifySans-Regular.ttf")
 GRASS1_IMG_PATH = os.path.join(IMAGES_DIR, "grass1.png")
 ICON_PATH = os.path.join(IMAGES_DIR, "icon.ico")
+WATERCAN_IMG_PATH = os.path.join(IMAGES_DIR, "watercan.png")
+MUSIC_ON_IMG_PATH = os.path.join(IMAGES_DIR, "musicOn.png")
+MUSIC_OFF_IMG_PATH = os.path.join(IMAGES_DIR, "musicOff.png")
 CLICK_SOUND_PATH = os.path.join(SOUNDS_DIR, "click.mp3")
 BACK_SOUND_PATH = os.path.join(SOUNDS_DIR, "back.mp3")
+BUY_SOUND_PATH = os.path.join(SOUNDS_DIR, "buy.mp3")
+CHANGE_SOUND_PATH = os.path.join(SOUNDS_DIR, "change.mp3")
+
+# Frozen builds ship the Assets tree as one indexed archive (see asset_pack.py).
+ASSET_PACK_PATH = "assets.ttgpack"
 
 
 
@@ -0,0 +1,137 @@
+# game/perf_check.py
+"""Performance regression gate for the headless frame scenarios.
+
+Runs every benchmark scenario (idle/AFK, 20 CPS clicking, shop overlay,
+particle storm, autosave) for a fixed number of frames, REPEAT times. It
+takes the median of each metric and compares the result with the committed
+baseline (Main/perf_baseline.json):
+
+    python -m game.perf_check            # exit 1 and a diff on regression
+    python -m game.perf_check --update   # re-record the baseline
+
+A metric fails when it is worse than the baseline by more than its relative
+threshold *and* by more than its absolute floor, so sub-millisecond noise
+on fast scenarios doesn't trip the gate. Re-record the baseline on the
+machine that runs the check; numbers from different machines don't compare.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+
+from . import benchmark
+
+FRAMES = 600
+REPEAT = 3
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "perf_baseline.json"
+)
+
+# metric: (allowed relative increase, absolute floor in the metric's unit).
+# Frame-time limits sit above the run-to-run spread of a median of 3 runs.
+THRESHOLDS = {
+    "p50_ms": (0.25, 0.5),
+    "p95_ms": (0.30, 1.0),
+    "p99_ms": (0.40, 2.0),
+    "gc_gen0_per_1k_frames": (0.25, 5.0),
+    "alloc_blocks_growth": (0.50, 5000),
+}
+
+
+def run(frames=FRAMES, repeat=REPEAT, only=None):
+    """Median of each scenario metric over `repeat` runs, as a report dict."""
+    runs = [benchmark.run_all(only, frames, functions=False) for _ in range(repeat)]
+    report = dict(runs[-1])
+    report["frames"] = frames
+    report["repeat"] = repeat
+    results = {}
+    for name in report["results"]:
+        merged = {}
+        for key, value in report["results"][name].items():
+            if isinstance(value, (int, float)):
+                merged[key] = statistics.median(r["results"][name][key] for r in runs)
+            else:
+                merged[key] = value
+        results[name] = merged
+    report["results"] = results
+    return report
+
+
+def check(baseline, current):
+    """Return (diff lines, failure lines)."""
+    lines = []
+    failures = []
+    base_results = baseline.get("results", {})
+    for name, result in current["results"].items():
+        lines.append(name)
+        base = base_results.get(name)
+        if base is None:
+            lines.append("    (not in baseline)")
+            continue
+        for metric, (rel, floor) in THRESHOLDS.items():
+            if metric not in result or metric not in base:
+                continue
+            old, new = base[metric], result[metric]
+            delta = new - old
+            change = f"{delta / old:+.1%}" if old else f"{delta:+g}"
+            status = ""
+            if delta > floor and delta > abs(old) * rel:
+                status = "  FAIL"
+                failures.append(
+                    f"{name} {metric}: {old:g} -> {new:g} ({change}, "
+                    f"limit +{rel:.0%} and +{floor:g})"
+                )
+            lines.append(f"    {metric:<24}{old:>12g}{new:>12g}{change:>10}{status}")
+    return lines, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m game.perf_check")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--update", action="store_true", help="write the results as the new baseline"
+    )
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--only", help="run only scenarios whose name contains this")
+    args = parser.parse_args(argv)
+
+    report = run(args.frames, args.repeat, args.only)
+    if args.update:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; create one with --update")
+        return 2
+    for key in ("platform", "python", "pygame"):
+        if baseline.get(key) != report.get(key):
+            print(
+                f"warning: baseline {key} is {baseline.get(key)!r}, "
+                f"this run is {report.get(key)!r}"
+            )
+    if baseline.get("frames") != args.frames:
+        print(f"warning: baseline ran {baseline.get('frames')} frames per scenario")
+
+    lines, failures = check(baseline, report)
+    print(f"{'':<28}{'baseline':>12}{'current':>12}{'change':>10}")
+    print("\n".join(lines))
+    if failures:
+        print("\nperf-check FAILED:")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+    print("\nperf-check passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
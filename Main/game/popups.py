@@ -0,0 +1,118 @@
+# game/popups.py
+"""Pre-composed popups: achievement toasts, daily reward and Welcome Back.
+
+Each popup is drawn once at full opacity: panel, border and text together.
+While it shows, a frame only changes its alpha and position, so drawing it
+is one set_alpha and one blit. Achievements waiting in the queue are
+composed a few per frame ahead of time (precompose), so an unlock storm
+spreads its text rendering over several frames instead of spiking one.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+FADE_TIME = 0.5  # seconds of fade-out at the end of a popup (and slide-in)
+CACHE_SIZE = 64  # composed popups kept (LRU)
+PRECOMPOSE_AHEAD = 8  # queued achievements looked at per frame
+PRECOMPOSE_PER_FRAME = 2  # at most this many composed per frame
+
+
+def fade_alpha(timer, fade=FADE_TIME):
+    """255 while timer > fade, then down to 0 as timer runs out."""
+    return int(255 * max(0.0, min(1.0, timer / fade)))
+
+
+def _panel(size, bg, border, border_width, radius):
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surf, bg, surf.get_rect(), border_radius=radius)
+    pygame.draw.rect(surf, border, surf.get_rect(), border_width, border_radius=radius)
+    return surf
+
+
+def _blit_centered(panel, text, y):
+    panel.blit(text, (panel.get_width() // 2 - text.get_width() // 2, y))
+
+
+class PopupRenderer:
+    """Composes popups once and draws them with alpha and offset only."""
+
+    def __init__(self, cache_size=CACHE_SIZE):
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+
+    def _get(self, key, build, *args):
+        surf = self.cache.get(key)
+        if surf is None:
+            surf = build(*args)
+            self.cache[key] = surf
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+        return surf
+
+    def achievement(self, data, font):
+        """280x70 toast: "Achievement!", the name and the reward if any."""
+        reward = data.get("reward", 0)
+        key = ("achievement", id(font), data["name"], reward)
+        return self._get(key, self._compose_achievement, data["name"], reward, font)
+
+    def _compose_achievement(self, name, reward, font):
+        panel = _panel((280, 70), (40, 40, 40), (255, 215, 0), 2, 8)
+        panel.blit(font.render("Achievement!", True, (255, 215, 0)), (10, 8))
+        panel.blit(font.render(name, True, (255, 255, 255)), (10, 28))
+        if reward > 0:
+            panel.blit(font.render(f"+${reward}", True, (100, 255, 100)), (10, 48))
+        return panel
+
+    def precompose(self, queue, font):
+        """Compose a few of the queued achievements that aren't cached yet."""
+        budget = PRECOMPOSE_PER_FRAME
+        for data in queue[:PRECOMPOSE_AHEAD]:
+            key = ("achievement", id(font), data["name"], data.get("reward", 0))
+            if key in self.cache:
+                continue
+            self.achievement(data, font)
+            budget -= 1
+            if budget <= 0:
+                break
+
+    def daily_reward(self, streak, amount, font):
+        key = ("daily", id(font), streak, int(amount))
+        return self._get(key, self._compose_daily, streak, int(amount), font)
+
+    def _compose_daily(self, streak, amount, font):
+        panel = _panel((300, 100), (40, 100, 40), (100, 255, 100), 2, 8)
+        _blit_centered(panel, font.render("Daily Reward!", True, (255, 255, 100)), 15)
+        _blit_centered(
+            panel, font.render(f"Streak: {streak} days", True, (255, 255, 255)), 45
+        )
+        _blit_centered(panel, font.render(f"+${amount}", True, (100, 255, 100)), 70)
+        return panel
+
+    def offline(self, earnings, font, title_font):
+        key = ("offline", id(font), id(title_font), int(earnings))
+        return self._get(key, self._compose_offline, int(earnings), font, title_font)
+
+    def _compose_offline(self, earnings, font, title_font):
+        panel = _panel((320, 120), (40, 60, 100), (100, 150, 255), 3, 10)
+        _blit_centered(
+            panel, title_font.render("Welcome Back!", True, (255, 255, 100)), 15
+        )
+        _blit_centered(
+            panel, font.render("While you were away...", True, (200, 200, 255)), 50
+        )
+        _blit_centered(
+            panel, title_font.render(f"+${earnings}", True, (100, 255, 100)), 80
+        )
+        return panel
+
+    @staticmethod
+    def draw(surface, popup, pos, alpha=255):
+        if alpha <= 0:
+            return
+        # surface alpha multiplies the per-pixel alpha of the composed popup
+        if popup.get_alpha() != alpha:
+            popup.set_alpha(alpha)
+        surface.blit(popup, pos)
@@ -0,0 +1,325 @@
+# game/replay.py
+"""Deterministic input recording and replay.
+
+Record a session with TTG_RECORD=1 (or a file path), or by passing
+--record [path] to the game. The recording holds the rng master seed (which
+covers every subsystem stream), the save the session started from, the
+date it was recorded on, and one line per frame with the frame's dt, the
+mouse position and its input events. The file is gzip-compressed JSON
+lines (.ttgrec). Without a path it goes to <save dir>/recordings/. TTG_SEED
+fixes the seed; otherwise a random one is chosen and stored.
+
+Replay with TTG_REPLAY=path or --replay path. Recorded events go through the
+same event handling in run_loop as live input. The recorded dt drives the
+simulation, so the game state matches frame for frame. By default frames
+run back to back at full speed; add --realtime (TTG_REPLAY_REALTIME=1) to
+pace them with the real clock. When the recording runs out, the game quits
+and prints the real frame times. Replays save into a temporary directory so
+the player's save is never touched.
+
+Daily rewards and offline earnings depend on the wall clock, so run_loop
+skips them while recording or replaying. The daily free wheel spin is
+checked against today() instead, which is the recording's date during a
+replay. Saves made while recording keep the player's login, play-time and
+free-spin state (KEPT_SAVE_KEYS) as they were, and the recording's header
+leaves the login and play-time dates out.
+
+Like startup_profiler, keep this module free of game imports; pygame is
+imported lazily so enabling from __main__ doesn't skew startup timing.
+"""
+
+import atexit
+import datetime
+import gzip
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ENABLED = False
+MODE = None  # "record" or "replay"
+REALTIME = False
+FORMAT_VERSION = 1
+# Input the game reacts to; mouse motion is covered by the per-frame position
+RECORDED_EVENTS = (
+    "QUIT",
+    "KEYDOWN",
+    "KEYUP",
+    "MOUSEBUTTONDOWN",
+    "MOUSEBUTTONUP",
+    "MOUSEWHEEL",
+)
+# Save keys that make startup depend on today's date
+WALL_CLOCK_KEYS = ("last_login_date", "last_play_time")
+# Saved as they were in the starting save (see keep_wall_clock)
+KEPT_SAVE_KEYS = WALL_CLOCK_KEYS + (
+    "login_streak",
+    "last_spin_date",
+    "free_spins_today",
+)
+
+_path = None
+_seed = None
+_header = None
+_frames = []  # replay: [ms, mouse or None, events] per frame
+_frame = -1
+_out = None  # record: gzip text stream
+_pending = None  # record: the current frame's [ms, mouse, events]
+_mouse = (0, 0)
+_last_mouse = None
+_event_types = {}  # pygame type id -> name, filled on start()
+_frame_ms = []  # replay: real time per frame
+_last_tick = None
+_kept = {}  # KEPT_SAVE_KEYS values from the starting save
+_today = None  # ISO date the session was recorded on
+
+
+def enable(mode, path=None, realtime=False, seed=None):
+    """Turn on recording or replay; seeds rng and `random` right away."""
+    from . import rng
+
+    global ENABLED, MODE, REALTIME, _path, _seed, _header, _frames
+    if mode == "replay":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            _header = json.loads(f.readline())
+            _frames = [_expand_frame(json.loads(line)) for line in f]
+        if _header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported recording version")
+        seed = _header["seed"]
+        # Saves made while replaying must not overwrite the player's save;
+        # get_save_dir() checks LOCALAPPDATA first on every platform
+        os.environ["LOCALAPPDATA"] = tempfile.mkdtemp(prefix="ttg-replay-")
+    elif seed is None:
+        seed = random.SystemRandom().randrange(2**32)
+    ENABLED = True
+    MODE = mode
+    REALTIME = realtime
+    _path = path
+    _seed = seed
+    rng.seed(seed)
+    random.seed(seed)
+    atexit.register(_finish)
+
+
+def enable_from_env(argv=None):
+    """Enable from --record/--replay/--realtime or TTG_RECORD/TTG_REPLAY.
+
+    Strips the flags. Returns the mode, or None.
+    """
+    argv = sys.argv if argv is None else argv
+    mode = path = None
+    realtime = os.environ.get("TTG_REPLAY_REALTIME", "") not in ("", "0")
+    if "--realtime" in argv:
+        argv.remove("--realtime")
+        realtime = True
+    for flag in ("--record", "--replay"):
+        if flag in argv:
+            i = argv.index(flag)
+            del argv[i]
+            mode = flag[2:]
+            if i < len(argv) and not argv[i].startswith("-"):
+                path = argv.pop(i)
+    if mode is None:
+        replay_env = os.environ.get("TTG_REPLAY", "")
+        record_env = os.environ.get("TTG_RECORD", "")
+        if replay_env:
+            mode, path = "replay", replay_env
+        elif record_env and record_env != "0":
+            mode = "record"
+            path = None if record_env == "1" else record_env
+    if mode is None:
+        return None
+    if mode == "replay" and not path:
+        print("--replay needs a recording file")
+        return None
+    seed = os.environ.get("TTG_SEED")
+    enable(mode, path, realtime, int(seed) if seed else None)
+    return mode
+
+
+def start(game_data, default_dir):
+    """Called by run_loop with the loaded save; returns the save to play from."""
+    global _out, _path, _today
+    import pygame
+
+    for name in RECORDED_EVENTS:
+        _event_types[getattr(pygame, name)] = name
+    if MODE == "replay":
+        print(f"Replaying {_path}: {len(_frames)} frames, seed {_seed}")
+        _today = _header.get("today")
+        _kept.update((k, _header["save"].get(k)) for k in KEPT_SAVE_KEYS)
+        return _header["save"]
+    _kept.update((k, game_data.get(k)) for k in KEPT_SAVE_KEYS)
+    data = {k: v for k, v in game_data.items() if k not in WALL_CLOCK_KEYS}
+    if not _path:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        _path = os.path.join(default_dir, f"session-{stamp}.ttgrec")
+    os.makedirs(os.path.dirname(os.path.abspath(_path)), exist_ok=True)
+    _out = gzip.open(_path, "wt", encoding="utf-8")
+    _today = datetime.date.today().isoformat()
+    header = {
+        "format": "ttg-replay",
+        "version": FORMAT_VERSION,
+        "seed": _seed,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "today": _today,
+        "save": data,
+    }
+    _out.write(json.dumps(header, separators=(",", ":")) + "\n")
+    print(f"Recording to {_path} (seed {_seed})")
+    return game_data
+
+
+def today():
+    """ISO date for daily checks: the recording's date while replaying."""
+    return _today or datetime.date.today().isoformat()
+
+
+def keep_wall_clock(data):
+    """A copy of `data` with the starting save's login/play dates and streak."""
+    data = dict(data)
+    for key, value in _kept.items():
+        if value is None:
+            data.pop(key, None)
+        else:
+            data[key] = value
+    return data
+
+
+class _Clock:
+    """Wraps the run_loop clock: records real dt, or hands back recorded dt."""
+
+    def __init__(self, clock):
+        self.clock = clock
+
+    def tick(self, framerate=0):
+        return _tick(self.clock.tick, framerate)
+
+    def tick_busy_loop(self, framerate=0):
+        return _tick(self.clock.tick_busy_loop, framerate)
+
+    def get_fps(self):
+        if MODE == "replay" and not REALTIME:
+            recent = _frame_ms[-30:]
+            return 1000.0 * len(recent) / sum(recent) if recent else 0.0
+        return self.clock.get_fps()
+
+
+def wrap_clock(clock):
+    return _Clock(clock)
+
+
+def _tick(real_tick, framerate):
+    global _frame, _pending, _mouse, _last_mouse, _last_tick
+    import pygame
+
+    _frame += 1
+    if MODE == "record":
+        ms = real_tick(framerate)
+        _flush_frame()
+        _mouse = pygame.mouse.get_pos()
+        mouse = None if _mouse == _last_mouse else list(_mouse)
+        _last_mouse = _mouse
+        _pending = [ms, mouse, []]
+        return ms
+    if REALTIME:
+        real_tick(framerate)
+    now = time.perf_counter()
+    if _last_tick is not None:
+        _frame_ms.append((now - _last_tick) * 1000.0)
+    _last_tick = now
+    if _frame >= len(_frames):
+        return 1000.0 / 60.0
+    ms, mouse, _ = _frames[_frame]
+    if mouse is not None:
+        _mouse = tuple(mouse)
+    return ms
+
+
+def _flush_frame():
+    if _pending is None or _out is None:
+        return
+    line = _pending
+    # trailing empty fields are left out: most frames are just their dt
+    if not line[2]:
+        line = line[:2] if line[1] is not None else line[0]
+    _out.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+
+def _expand_frame(line):
+    if not isinstance(line, list):
+        return [line, None, ()]
+    return line + [None, ()][len(line) - 1 :]
+
+
+def mouse_pos():
+    """Mouse position for this frame (sampled at tick, or from the recording)."""
+    return _mouse
+
+
+def frame_events(events):
+    """Record this frame's input, or swap it for the recorded input."""
+    import pygame
+
+    if MODE == "record":
+        for event in events:
+            name = _event_types.get(event.type)
+            if name is not None and _pending is not None:
+                _pending[2].append([name, _event_args(event)])
+        return events
+    # Replay: live input is ignored except closing the window and the
+    # profiler/tracer hotkeys, which don't change game state
+    live = [
+        e
+        for e in events
+        if e.type == pygame.QUIT
+        or (e.type == pygame.KEYDOWN and e.key in (pygame.K_F3, pygame.K_F4))
+    ]
+    if _frame >= len(_frames):
+        return live + [pygame.event.Event(pygame.QUIT)]
+    frame = _frames[_frame]
+    return live + [
+        pygame.event.Event(getattr(pygame, name), _event_from_args(args))
+        for name, args in frame[2]
+    ]
+
+
+def _event_args(event):
+    args = {}
+    for key, value in event.dict.items():
+        if isinstance(value, (bool, int, float, str)):
+            args[key] = value
+        elif isinstance(value, tuple) and all(
+            isinstance(v, (int, float)) for v in value
+        ):
+            args[key] = list(value)
+    return args
+
+
+def _event_from_args(args):
+    return {k: tuple(v) if isinstance(v, list) else v for k, v in args.items()}
+
+
+def _percentile(sorted_values, q):
+    i = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[i]
+
+
+def _finish():
+    global _out
+    if MODE == "record" and _out is not None:
+        _flush_frame()
+        _out.close()
+        _out = None
+        print(f"Recording saved to {_path} ({_frame + 1} frames)")
+    elif MODE == "replay" and _frame_ms:
+        times = sorted(_frame_ms)
+        print(
+            f"Replay finished: {len(times)} frames in {sum(times) / 1000.0:.2f} s, "
+            f"mean {sum(times) / len(times):.2f} ms, "
+            f"p50 {_percentile(times, 0.50):.2f} ms, "
+            f"p95 {_percentile(times, 0.95):.2f} ms, "
+            f"p99 {_percentile(times, 0.99):.2f} ms"
+        )
@@ -0,0 +1,115 @@
+# game/rng.py
+"""Seeded random streams, one per subsystem.
+
+Gameplay rolls draw from their own stream (rng.weather, rng.crits, ...), so
+a particle burst or a screen shake no longer shifts the next crit or
+weather roll. seed(master) derives every stream from one number; replay
+stores that number in the recording.
+
+Cosmetic randomness (particles, damage-number drift, rainbow colours, screen
+shake) comes from `cosmetic`. It hands out uniforms from blocks generated by
+a NumPy Generator, so spawn_particles takes all the numbers for a burst in
+one call instead of making ~30 random.* calls per particle.
+"""
+
+import random
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # cosmetic falls back to random.Random
+    np = None
+
+BLOCK_SIZE = 4096  # uniforms generated per NumPy refill
+
+# Gameplay streams
+weather = random.Random()
+specials = random.Random()
+crits = random.Random()
+wheel = random.Random()
+minigames = random.Random()
+powerups = random.Random()
+
+_STREAMS = {
+    "weather": weather,
+    "specials": specials,
+    "crits": crits,
+    "wheel": wheel,
+    "minigames": minigames,
+    "powerups": powerups,
+}
+
+MASTER_SEED = None
+
+
+class CosmeticRandom:
+    """Uniform floats in [0, 1) served from pre-generated blocks."""
+
+    def __init__(self, seed=None, block_size=BLOCK_SIZE):
+        self.block_size = block_size
+        self._buf = []
+        self._i = 0
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        if np is not None:
+            self._gen = np.random.default_rng(seed)
+        else:
+            self._gen = random.Random(seed)
+        self._buf = []
+        self._i = 0
+
+    def _refill(self, n):
+        rest = self._buf[self._i :]
+        size = max(self.block_size, n - len(rest))
+        if np is not None:
+            fresh = self._gen.random(size).tolist()
+        else:
+            r = self._gen.random
+            fresh = [r() for _ in range(size)]
+        self._buf = rest + fresh
+        self._i = 0
+
+    def take(self, n):
+        """Return a list of n uniforms (index it; don't keep it around)."""
+        if self._i + n > len(self._buf):
+            self._refill(n)
+        i = self._i
+        self._i = i + n
+        return self._buf[i : i + n]
+
+    def random(self):
+        if self._i >= len(self._buf):
+            self._refill(1)
+        u = self._buf[self._i]
+        self._i += 1
+        return u
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+    def randint(self, a, b):
+        return a + int(self.random() * (b - a + 1))
+
+
+cosmetic = CosmeticRandom()
+
+
+def _derive(master, name):
+    # stable across runs and platforms (unlike hash())
+    return (master << 32) | zlib.crc32(name.encode("ascii"))
+
+
+def seed(master=None):
+    """Reseed every stream from one master seed; returns the seed used."""
+    global MASTER_SEED
+    if master is None:
+        master = random.SystemRandom().randrange(2**32)
+    MASTER_SEED = master
+    for name, stream in _STREAMS.items():
+        stream.seed(_derive(master, name))
+    cosmetic.seed(_derive(master, "cosmetic"))
+    return master
+
+
+seed()
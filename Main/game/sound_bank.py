@@ -0,0 +1,97 @@
+# game/sound_bank.py
+"""Decoded-PCM cache for sound effects.
+
+MP3 effects are decoded once, and the raw sample buffer is stored on disk keyed
+by the source file hash and the mixer format (frequency, sample format,
+channels). Later launches build pygame.mixer.Sound straight from the cached
+buffer. A different mixer format simply maps to a different key, so it
+triggers a fresh decode instead of an error.
+"""
+import hashlib
+import os
+import struct
+
+import pygame
+
+from .assets import logger, open_resource
+
+_HEADER = struct.Struct("<8siiiQ")
+_MAGIC = b"TTGPCM01"
+
+
+class SoundBank:
+    """Loads sounds through an on-disk PCM cache in cache_dir."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.sounds = {}
+        self.hits = 0
+        self.decodes = 0
+
+    def _read_source(self, relative_path):
+        src = open_resource(relative_path)
+        if isinstance(src, str):
+            with open(src, "rb") as f:
+                return f.read()
+        return src.getvalue()
+
+    def _cache_path(self, digest, mixer_format):
+        freq, fmt, channels = mixer_format
+        return os.path.join(self.cache_dir, f"{digest}_{freq}_{fmt}_{channels}.pcm")
+
+    def _read_cache(self, path, mixer_format):
+        try:
+            with open(path, "rb") as f:
+                header = f.read(_HEADER.size)
+                if len(header) != _HEADER.size:
+                    return None
+                magic, freq, fmt, channels, size = _HEADER.unpack(header)
+                if magic != _MAGIC or (freq, fmt, channels) != tuple(mixer_format):
+                    return None
+                data = f.read()
+            return data if len(data) == size else None
+        except OSError:
+            return None
+
+    def _write_cache(self, path, digest, mixer_format, raw):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Drop buffers decoded for other mixer formats of the same file
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(digest + "_") and name != os.path.basename(path):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, *mixer_format, len(raw)))
+                f.write(raw)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("Sound cache write failed for %s: %s", path, e)
+
+    def load(self, relative_path):
+        """Return a pygame.mixer.Sound, decoding the source only on a cache miss."""
+        sound = self.sounds.get(relative_path)
+        if sound is not None:
+            return sound
+
+        mixer_format = pygame.mixer.get_init()
+        if not mixer_format:
+            # Mixer not initialised: nothing to key the cache on
+            return pygame.mixer.Sound(file=open_resource(relative_path))
+
+        data = self._read_source(relative_path)
+        digest = hashlib.sha1(data).hexdigest()[:20]
+        path = self._cache_path(digest, mixer_format)
+        raw = self._read_cache(path, mixer_format)
+        if raw is not None:
+            sound = pygame.mixer.Sound(buffer=raw)
+            self.hits += 1
+        else:
+            sound = pygame.mixer.Sound(file=open_resource(relative_path))
+            self._write_cache(path, digest, mixer_format, sound.get_raw())
+            self.decodes += 1
+        self.sounds[relative_path] = sound
+        return sound
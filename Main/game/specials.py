@@ -0,0 +1,92 @@
+# game/specials.py
+"""Renderer for animated specials (the watercan pickups).
+
+Each special (an entities.Special record) bobs, sways and rocks left-right.
+The scaled sprite is shared by every special made from the same asset. Its
+rotations are baked once at ANGLE_STEP increments, so a frame costs one blit
+per special instead of a transform.rotate. animate() stores each special's
+position for the frame; drawing and the click node both read that value.
+"""
+
+import math
+
+import pygame
+
+ANGLE_STEP = 1.0  # degrees between baked rotation frames
+MAX_ANGLE = 20.0  # largest rot_amp a special is spawned with
+MAX_DIM = 64  # cap on the sprite's larger side
+
+
+class SpecialRenderer:
+    """Shared scaled sprites and their baked rotation frames."""
+
+    def __init__(self, angle_step=ANGLE_STEP, max_angle=MAX_ANGLE, max_dim=MAX_DIM):
+        self.angle_step = angle_step
+        self.max_angle = max_angle
+        self.max_dim = max_dim
+        self.sprites = {}  # id(source asset) -> (source, scaled sprite)
+        self.frames = {}  # id(sprite) -> {angle step: rotated Surface}
+
+    def sprite_for(self, source):
+        """Scaled (and pre-rotated) sprite for an asset, built once per asset."""
+        entry = self.sprites.get(id(source))
+        if entry is not None and entry[0] is source:
+            return entry[1]
+        gw, gh = source.get_width(), source.get_height()
+        # cap visual size so it doesn't dominate the screen
+        scale = min(0.8, self.max_dim / max(gw, gh)) if max(gw, gh) > 0 else 0.8
+        size = (max(8, int(gw * scale)), max(8, int(gh * scale)))
+        sprite = pygame.transform.smoothscale(source, size)
+        self.sprites[id(source)] = (source, sprite)
+        self._bake(sprite)
+        return sprite
+
+    def _bake(self, sprite):
+        frames = {}
+        steps = int(math.ceil(self.max_angle / self.angle_step))
+        for i in range(-steps, steps + 1):
+            frames[i] = pygame.transform.rotate(sprite, i * self.angle_step)
+        self.frames[id(sprite)] = frames
+
+    def frame(self, sprite, angle):
+        """Rotated sprite at the baked angle nearest to `angle`."""
+        frames = self.frames.get(id(sprite))
+        if frames is None:
+            self._bake(sprite)
+            frames = self.frames[id(sprite)]
+        i = int(round(angle / self.angle_step))
+        surf = frames.get(i)
+        if surf is None:
+            # outside the baked range: bake this step too
+            surf = frames[i] = pygame.transform.rotate(sprite, i * self.angle_step)
+        return surf
+
+    def animate(self, specials, t):
+        """Store this frame's position and angle on each special."""
+        sin = math.sin
+        for s in specials:
+            # vertical bobbing
+            bob = sin(t * s.osc_speed + s.osc_phase) * s.osc_amp
+            # horizontal sway
+            sway = sin(t * s.sway_speed + s.sway_phase) * s.sway_amp
+            # rotation (degrees) that oscillates left-right
+            s.angle = sin(t * s.rot_speed + s.rot_phase) * s.rot_amp
+            s.draw_pos = (int(s.x + sway), int(s.y + bob))
+
+    def draw(self, surface, specials, offset=(0, 0)):
+        """Blit every special at its stored position, shifted by the camera."""
+        ox, oy = offset
+        for s in specials:
+            cx = s.draw_pos[0] + ox
+            cy = s.draw_pos[1] + oy
+            if s.surf:
+                rotated = self.frame(s.surf, s.angle)
+                surface.blit(
+                    rotated,
+                    (cx - rotated.get_width() // 2, cy - rotated.get_height() // 2),
+                )
+            else:
+                # fallback: draw a small gold circle whose radius reflects click area
+                pygame.draw.circle(
+                    surface, (240, 200, 64), (cx, cy), max(6, s.click_radius)
+                )
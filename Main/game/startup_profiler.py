@@ -0,0 +1,233 @@
+# game/startup_profiler.py
+"""Opt-in startup profiler: per-phase wall/CPU time and import costs.
+
+Enable with TTG_PROFILE_STARTUP=1 (or a .json path), or by passing
+--profile-startup [path] to the game. The report is written as JSON once the
+first frame has been presented, so two versions can be compared with:
+
+    python -m game.startup_profiler old.json new.json
+
+Keep this module free of pygame/game imports: it is loaded before them so
+their import time can be measured.
+"""
+import builtins
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import sys
+import time
+
+ENABLED = False
+REPORT_VERSION = 1
+
+_report_path = None
+_t0_wall = 0.0
+_t0_cpu = 0.0
+_phases = []
+_open_phases = []
+_imports = []
+_import_stack = []
+_original_import = None
+_null_phase = contextlib.nullcontext()
+
+
+def enable(report_path=None):
+    """Start recording. Import timing begins immediately."""
+    global ENABLED, _report_path, _t0_wall, _t0_cpu, _original_import
+    if ENABLED:
+        return
+    ENABLED = True
+    _report_path = report_path
+    _t0_wall = time.perf_counter()
+    _t0_cpu = time.process_time()
+    _original_import = builtins.__import__
+    builtins.__import__ = _timed_import
+
+
+def enable_from_env(argv=None):
+    """Enable if TTG_PROFILE_STARTUP or --profile-startup is set. Strips the flag."""
+    argv = sys.argv if argv is None else argv
+    path = None
+    requested = False
+    if "--profile-startup" in argv:
+        i = argv.index("--profile-startup")
+        requested = True
+        del argv[i]
+        if i < len(argv) and argv[i].endswith(".json"):
+            path = argv.pop(i)
+    env = os.environ.get("TTG_PROFILE_STARTUP", "")
+    if env and env != "0":
+        requested = True
+        if env.endswith(".json"):
+            path = path or env
+    if requested:
+        enable(path)
+    return requested
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    # Only time imports that actually load something, like -X importtime.
+    try:
+        package = globals.get("__package__") if (level and globals) else None
+        full_name = importlib.util.resolve_name("." * level + name, package) if level else name
+    except Exception:
+        full_name = name
+    if full_name not in sys.modules:
+        _load(full_name, lambda: _original_import(name, globals, locals, (), level))
+    # "from pkg import sub" loads pkg.sub inside the import machinery, not
+    # through __import__, so time each submodule it would load on its own
+    module = sys.modules.get(full_name)
+    if fromlist and hasattr(module, "__path__"):
+        for item in fromlist:
+            sub_name = f"{full_name}.{item}"
+            if item == "*" or sub_name in sys.modules or hasattr(module, item):
+                continue
+            _load(sub_name, lambda: importlib.import_module(sub_name), missing_ok=True)
+    return _original_import(name, globals, locals, fromlist, level)
+
+
+def _load(full_name, load, missing_ok=False):
+    entry = {"module": full_name, "depth": len(_import_stack), "self_us": 0, "cumulative_us": 0}
+    _imports.append(entry)
+    _import_stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        load()
+    except ModuleNotFoundError as e:
+        # a fromlist name that isn't a submodule; the real import reports it
+        if not (missing_ok and e.name == full_name):
+            raise
+        _imports.remove(entry)
+    finally:
+        elapsed = time.perf_counter() - start
+        children = _import_stack.pop()
+        if _import_stack:
+            _import_stack[-1] += elapsed
+        entry["cumulative_us"] = int(elapsed * 1e6)
+        entry["self_us"] = int((elapsed - children) * 1e6)
+
+
+def begin(name):
+    """Open a startup phase; pair with end(). Phases may nest."""
+    if not ENABLED:
+        return
+    entry = {"name": name, "depth": len(_open_phases)}
+    _phases.append(entry)
+    _open_phases.append((entry, time.perf_counter(), time.process_time()))
+
+
+def end():
+    """Close the innermost open phase."""
+    if not ENABLED or not _open_phases:
+        return
+    entry, wall, cpu = _open_phases.pop()
+    entry["start_ms"] = round((wall - _t0_wall) * 1000, 3)
+    entry["wall_ms"] = round((time.perf_counter() - wall) * 1000, 3)
+    entry["cpu_ms"] = round((time.process_time() - cpu) * 1000, 3)
+
+
+def phase(name):
+    """Context manager timing one startup phase (no-op when disabled)."""
+    if not ENABLED:
+        return _null_phase
+    return _phase(name)
+
+
+@contextlib.contextmanager
+def _phase(name):
+    begin(name)
+    try:
+        yield
+    finally:
+        end()
+
+
+def note(key, value):
+    """Attach a detail to the innermost open phase (e.g. which mixer driver won)."""
+    if ENABLED and _open_phases:
+        _open_phases[-1][0].setdefault("notes", {})[key] = value
+
+
+def build_report():
+    pygame_version = None
+    if "pygame" in sys.modules:
+        pygame_version = getattr(sys.modules["pygame"], "version", None)
+        pygame_version = getattr(pygame_version, "ver", None)
+    return {
+        "report_version": REPORT_VERSION,
+        "label": os.environ.get("TTG_PROFILE_LABEL", ""),
+        "python": platform.python_version(),
+        "pygame": pygame_version,
+        "platform": platform.platform(),
+        "frozen": bool(getattr(sys, "frozen", False)),
+        "total_wall_ms": round((time.perf_counter() - _t0_wall) * 1000, 3),
+        "total_cpu_ms": round((time.process_time() - _t0_cpu) * 1000, 3),
+        "phases": list(_phases),
+        "imports": list(_imports),
+    }
+
+
+def finish(default_dir=None):
+    """Stop recording and write the JSON report. Returns the report path."""
+    global ENABLED
+    if not ENABLED:
+        return None
+    while _open_phases:
+        end()
+    ENABLED = False
+    if builtins.__import__ is _timed_import:
+        builtins.__import__ = _original_import
+
+    report = build_report()
+    path = _report_path
+    if not path:
+        path = os.path.join(default_dir or os.getcwd(), "startup_profile.json")
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Startup profile written to {path} ({report['total_wall_ms']:.1f} ms)")
+    except Exception as e:
+        print(f"Startup profile could not be written: {e}")
+        return None
+    return path
+
+
+def compare(old, new):
+    """Return printable lines diffing phase and top-level import times of two reports."""
+    lines = [f"total: {old['total_wall_ms']:.1f} -> {new['total_wall_ms']:.1f} ms"]
+
+    def by_name(items, key):
+        return {item[key]: item for item in items}
+
+    old_phases = by_name(old.get("phases", []), "name")
+    for p in new.get("phases", []):
+        before = old_phases.get(p["name"], {}).get("wall_ms")
+        delta = "" if before is None else f" ({p['wall_ms'] - before:+.1f})"
+        lines.append(f"{'  ' * p['depth']}{p['name']}: {p['wall_ms']:.1f} ms{delta}")
+
+    old_imports = by_name([i for i in old.get("imports", []) if i["depth"] == 0], "module")
+    top = sorted(
+        (i for i in new.get("imports", []) if i["depth"] == 0),
+        key=lambda i: i["cumulative_us"],
+        reverse=True,
+    )[:15]
+    lines.append("imports (cumulative):")
+    for i in top:
+        before = old_imports.get(i["module"], {}).get("cumulative_us")
+        delta = "" if before is None else f" ({(i['cumulative_us'] - before) / 1000:+.1f})"
+        lines.append(f"  {i['module']}: {i['cumulative_us'] / 1000:.1f} ms{delta}")
+    return lines
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python -m game.startup_profiler OLD.json NEW.json")
+        sys.exit(2)
+    with open(sys.argv[1], encoding="utf-8") as f:
+        old_report = json.load(f)
+    with open(sys.argv[2], encoding="utf-8") as f:
+        new_report = json.load(f)
+    print("\n".join(compare(old_report, new_report)))
@@ -0,0 +1,171 @@
+# game/tracer.py
+"""Opt-in frame/event tracer with Chrome trace-event JSON export.
+
+Enable with TTG_TRACE=1 (or a directory to write traces to), or by passing
+--trace [dir] to the game. While enabled, every frame phase marked through
+frame_profiler.mark() becomes a span, and game events (clicks, saves,
+achievement unlocks, weather changes, particle bursts, prestige) become
+instant events. Events go into a ring buffer that holds the last few
+seconds.
+
+The buffer is written as trace-event JSON when F4 is pressed, or
+automatically when a frame takes longer than TTG_TRACE_LONG_FRAME_MS
+(default 50). Open the file in chrome://tracing or https://ui.perfetto.dev.
+
+Like startup_profiler, keep this module free of game imports.
+"""
+
+from collections import deque
+import contextlib
+import json
+import os
+import sys
+import time
+
+ENABLED = False
+BUFFER_EVENTS = 50000  # roughly 10 s of frames at 144 FPS with ~30 events each
+LONG_FRAME_MS = 50.0
+DUMP_COOLDOWN_S = 10.0  # at most one automatic dump per this many seconds
+
+# (phase, name, category, start s, duration s, args) tuples; formatted on dump
+_events = deque(maxlen=BUFFER_EVENTS)
+_dump_dir = None
+_long_frame_s = LONG_FRAME_MS / 1000.0
+_last_auto_dump = -DUMP_COOLDOWN_S
+_t0 = time.perf_counter()
+_null_span = contextlib.nullcontext()
+
+
+def enable(dump_dir=None, long_frame_ms=LONG_FRAME_MS):
+    """Start recording into the ring buffer."""
+    global ENABLED, _dump_dir, _long_frame_s, _last_auto_dump
+    ENABLED = True
+    _dump_dir = dump_dir
+    _long_frame_s = max(0.0, float(long_frame_ms)) / 1000.0
+    # Loading frames are slow by nature; no automatic dump until the cooldown passes
+    _last_auto_dump = time.perf_counter()
+
+
+def enable_from_env(argv=None):
+    """Enable if TTG_TRACE or --trace is set. Strips the flag."""
+    argv = sys.argv if argv is None else argv
+    path = None
+    requested = False
+    if "--trace" in argv:
+        i = argv.index("--trace")
+        requested = True
+        del argv[i]
+        if i < len(argv) and not argv[i].startswith("-"):
+            path = argv.pop(i)
+    env = os.environ.get("TTG_TRACE", "")
+    if env and env != "0":
+        requested = True
+        if env != "1":
+            path = path or env
+    if requested:
+        try:
+            long_ms = float(os.environ.get("TTG_TRACE_LONG_FRAME_MS", LONG_FRAME_MS))
+        except ValueError:
+            long_ms = LONG_FRAME_MS
+        enable(path, long_ms)
+    return requested
+
+
+def set_default_dir(path):
+    """Where dumps go when no directory was given on enable."""
+    global _dump_dir
+    if _dump_dir is None:
+        _dump_dir = path
+
+
+def complete(name, start, end, cat="frame", args=None):
+    """Record a span from perf_counter() start to end."""
+    _events.append(("X", name, cat, start, end - start, args))
+
+
+def instant(name, cat="game", **args):
+    _events.append(("i", name, cat, time.perf_counter(), 0.0, args or None))
+
+
+def span(name, cat="game"):
+    """Context manager recording a span around a block (no-op when disabled)."""
+    if not ENABLED:
+        return _null_span
+    return _span(name, cat)
+
+
+@contextlib.contextmanager
+def _span(name, cat):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        complete(name, start, time.perf_counter(), cat)
+
+
+def end_frame(start, end):
+    """Record the whole frame; dump the buffer if it ran long."""
+    global _last_auto_dump
+    _events.append(("X", "frame", "frame", start, end - start, None))
+    if _long_frame_s and end - start >= _long_frame_s:
+        if end - _last_auto_dump >= DUMP_COOLDOWN_S:
+            _last_auto_dump = end
+            dump("long-frame", {"frame_ms": round((end - start) * 1000.0, 2)})
+
+
+def build_trace(reason="manual", extra=None):
+    pid = os.getpid()
+    events = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": 1,
+            "args": {"name": "TouchTheGrass"},
+        },
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": 1,
+            "args": {"name": "main"},
+        },
+    ]
+    for ph, name, cat, start, dur, args in _events:
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": ph,
+            "ts": round((start - _t0) * 1e6, 1),
+            "pid": pid,
+            "tid": 1,
+        }
+        if ph == "X":
+            event["dur"] = round(dur * 1e6, 1)
+        else:
+            event["s"] = "t"
+        if args:
+            event["args"] = args
+        events.append(event)
+    other = {"reason": reason}
+    if extra:
+        other.update(extra)
+    return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": other}
+
+
+def dump(reason="manual", extra=None):
+    """Write the ring buffer as trace-event JSON. Returns the file path."""
+    if not ENABLED:
+        return None
+    directory = _dump_dir or os.getcwd()
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(directory, f"trace-{stamp}-{reason}.json")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(build_trace(reason, extra), f)
+        print(f"Trace written to {path} ({len(_events)} events)")
+    except Exception as e:
+        print(f"Trace could not be written: {e}")
+        return None
+    return path
@@ -0,0 +1,211 @@
+# game/ui.py
+"""Retained widget tree shared by drawing and hit-testing.
+
+Every clickable thing on screen (HUD buttons, overlay panels and their
+buttons, the grass, specials) is a node with an absolute screen rect. Layout
+code sets rects when they change; drawing reads them back, and hit tests go
+through a uniform grid, so a click checks only the few nodes in its cell
+instead of re-deriving every rect by hand.
+"""
+
+import pygame
+
+# Draw order, lowest first. Hit tests prefer higher layers.
+LAYER_WORLD = 0  # grass, specials
+LAYER_HUD = 1  # buttons and panels around the play area
+LAYER_OVERLAY = 2  # stats, shop, skill tree, lucky wheel
+
+GRID_CELL = 64
+
+
+class Widget:
+    """One node: absolute rect, optional circular hit shape, children."""
+
+    __slots__ = (
+        "wid",
+        "rect",
+        "parent",
+        "children",
+        "layer",
+        "depth",
+        "order",
+        "visible",
+        "clickable",
+        "radius",
+        "surface",
+        "cache_key",
+        "cells",
+    )
+
+    def __init__(self, wid, rect, parent, layer, order, clickable, radius):
+        self.wid = wid
+        self.rect = pygame.Rect(rect)
+        self.parent = parent
+        self.children = []
+        self.layer = layer
+        self.depth = parent.depth + 1 if parent else 0
+        self.order = order
+        self.visible = True
+        self.clickable = clickable
+        self.radius = radius  # hit as a circle around rect.center when set
+        self.surface = None  # cached render, dropped when the size changes
+        self.cache_key = None  # inputs the cached render was made from
+        self.cells = ()
+
+    def shown(self):
+        node = self
+        while node is not None:
+            if not node.visible:
+                return False
+            node = node.parent
+        return True
+
+    def hits(self, pos):
+        if not self.rect.collidepoint(pos):
+            return False
+        if self.radius is None:
+            return True
+        dx = pos[0] - self.rect.centerx
+        dy = pos[1] - self.rect.centery
+        return dx * dx + dy * dy <= self.radius * self.radius
+
+
+class WidgetTree:
+    """Widgets by id plus a grid index over their rects."""
+
+    def __init__(self, cell=GRID_CELL):
+        self.cell = cell
+        self.widgets = {}
+        self.grid = {}
+        self._order = 0
+
+    def add(
+        self,
+        wid,
+        rect,
+        parent=None,
+        layer=None,
+        clickable=True,
+        radius=None,
+        visible=True,
+    ):
+        """Add (or replace) a node. Child rects are absolute screen rects."""
+        if wid in self.widgets:
+            self.remove(wid)
+        parent_node = self.widgets[parent] if parent is not None else None
+        if layer is None:
+            layer = parent_node.layer if parent_node else LAYER_HUD
+        self._order += 1
+        node = Widget(wid, rect, parent_node, layer, self._order, clickable, radius)
+        node.visible = visible
+        if parent_node is not None:
+            parent_node.children.append(node)
+        self.widgets[wid] = node
+        self._index(node)
+        return node
+
+    def add_local(self, wid, parent, local_rect, **kwargs):
+        """Add a child positioned relative to its parent's top-left."""
+        origin = self.widgets[parent].rect.topleft
+        rect = pygame.Rect(local_rect).move(origin)
+        return self.add(wid, rect, parent=parent, **kwargs)
+
+    def remove(self, wid):
+        node = self.widgets.pop(wid, None)
+        if node is None:
+            return
+        for child in list(node.children):
+            self.remove(child.wid)
+        self._unindex(node)
+        if node.parent is not None:
+            try:
+                node.parent.children.remove(node)
+            except ValueError:
+                pass
+
+    def get(self, wid):
+        return self.widgets.get(wid)
+
+    def rect(self, wid):
+        return self.widgets[wid].rect
+
+    def local_rect(self, wid, ancestor):
+        """Rect of wid relative to ancestor's top-left (for drawing on its surface)."""
+        origin = self.widgets[ancestor].rect
+        return self.widgets[wid].rect.move(-origin.x, -origin.y)
+
+    def set_rect(self, wid, rect):
+        """Move/resize a node. Re-indexes only if the rect actually changed."""
+        node = self.widgets[wid]
+        rect = pygame.Rect(rect)
+        if node.rect == rect:
+            return node
+        if node.rect.size != rect.size:
+            node.surface = None
+        self._unindex(node)
+        node.rect = rect
+        self._index(node)
+        return node
+
+    def cached(self, wid, key, render, *args):
+        """Return wid's cached surface, calling render(*args) only when key changes."""
+        node = self.widgets[wid]
+        if node.surface is None or node.cache_key != key:
+            node.surface = render(*args)
+            node.cache_key = key
+        return node.surface
+
+    def set_visible(self, wid, visible):
+        self.widgets[wid].visible = bool(visible)
+
+    def _cells_for(self, rect):
+        c = self.cell
+        x0, y0 = rect.left // c, rect.top // c
+        x1, y1 = (rect.right - 1) // c, (rect.bottom - 1) // c
+        return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+    def _index(self, node):
+        if node.rect.width <= 0 or node.rect.height <= 0:
+            node.cells = ()
+            return
+        node.cells = self._cells_for(node.rect)
+        for key in node.cells:
+            self.grid.setdefault(key, []).append(node)
+
+    def _unindex(self, node):
+        for key in node.cells:
+            bucket = self.grid.get(key)
+            if bucket:
+                try:
+                    bucket.remove(node)
+                except ValueError:
+                    pass
+                if not bucket:
+                    del self.grid[key]
+        node.cells = ()
+
+    def hit_test(self, pos):
+        """Return the id of the topmost visible node under pos, or None."""
+        bucket = self.grid.get((pos[0] // self.cell, pos[1] // self.cell))
+        if not bucket:
+            return None
+        best = None
+        for node in bucket:
+            if best is not None and (node.layer, node.depth, node.order) < (
+                best.layer,
+                best.depth,
+                best.order,
+            ):
+                continue
+            if node.hits(pos) and node.shown():
+                best = node
+        return best.wid if best is not None else None
+
+    def is_under(self, wid, ancestor):
+        """True if wid is ancestor or one of its descendants."""
+        node = self.widgets.get(wid) if wid is not None else None
+        while node is not None:
+            if node.wid == ancestor:
+                return True
+            node = node.parent
+        return False
@@ -9,6 +9,7 @@ import sys
 import shutil
 import argparse
 import logging
+import importlib.util
 from pathlib import Path
 from datetime import datetime
 import PyInstaller.__main__
@@ -29,6 +30,8 @@ class BuildConfig:
         self.dist_dir = self.project_root / "dist"
         self.specs_dir = self.project_root / "specs"
         self.spec_file = self.specs_dir / "TouchTheGrass.spec"
+        self.asset_pack_module = self.game_dir / "asset_pack.py"
+        self.asset_pack_path = self.build_dir / "assets.ttgpack"
 
     def validate_paths(self):
         """Validate that all required paths exist."""
@@ -137,8 +140,11 @@ class BuildTool:
         else:
             options.append("--onedir")
 
-        # Add data directories
-        if self.config.assets_dir.exists():
+        # Add data directories. With a pack, Assets ships as one indexed file
+        # instead of a tree of loose files to extract on every onefile launch.
+        if getattr(args, "pack", True) and self.config.asset_pack_path.exists():
+            options.append(f"--add-data={self.config.asset_pack_path}{os.pathsep}.")
+        elif self.config.assets_dir.exists():
             options.append(f"--add-data={self.config.assets_dir}{os.pathsep}Assets")
         if self.config.game_dir.exists():
             options.append(f"--add-data={self.config.game_dir}{os.pathsep}game")
@@ -166,6 +172,21 @@ class BuildTool:
 
         return options
 
+    def build_asset_pack(self):
+        """Pack Main/Assets into a single mmap-able archive for the bundle."""
+        spec = importlib.util.spec_from_file_location(
+            "ttg_asset_pack", self.config.asset_pack_module
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        count = module.build_pack(
+            str(self.config.assets_dir), str(self.config.asset_pack_path)
+        )
+        size = self.config.asset_pack_path.stat().st_size / 1024
+        self.logger.info(
+            f"Asset pack created: {self.config.asset_pack_path} ({count} files, {size:.1f} KB)"
+        )
+
     def build(self, args):
         """Execute the build process."""
         try:
@@ -183,6 +204,9 @@ class BuildTool:
 
             version_tag = args.version.strip() if args.version else self.prompt_version()
 
+            if getattr(args, "pack", True):
+                self.build_asset_pack()
+
             modes_to_build = ["onefile", "onedir"] if args.mode == "both" else [args.mode]
 
             for mode in modes_to_build:
@@ -265,10 +289,11 @@ class BuildTool:
                 print("\nİptal edildi.")
                 sys.exit(0)
 
-    def create_args(self, mode="onefile", upx=False, debug=False, cleanup=False, version=None):
+    def create_args(self, mode="onefile", upx=False, debug=False, cleanup=False, version=None, pack=True):
         """Create argument namespace for build."""
         args = argparse.Namespace()
         args.mode = mode
+        args.pack = pack
         args.upx = upx
         args.debug = debug
         args.cleanup = cleanup
@@ -318,6 +343,12 @@ def main():
         "--version",
         help="Version string to append to output names (e.g., 2.2.3)"
     )
+    parser.add_argument(
+        "--no-pack",
+        dest="pack",
+        action="store_false",
+        help="Ship Assets as loose files instead of a single asset pack"
+    )
 
     # Parse known args first to handle interactive mode
     args, unknown = parser.parse_known_args()